@@ -0,0 +1,52 @@
+"""
+Compares the size of the specification, and the time taken to encode it,
+with and without deduplicating its repeated schemas.
+
+    python -m benchmarks.bench_definitions
+"""
+from __future__ import print_function
+import timeit
+
+from rest_framework_swagger.compiler import generate_swagger_object
+from rest_framework_swagger.compression import compress
+from rest_framework_swagger.definitions import deduplicate_schemas
+from rest_framework_swagger.renderers import OpenAPIRenderer
+
+from .documents import make_document
+
+
+SIZES = [100, 1000, 10000]
+
+
+def main():
+    renderer = OpenAPIRenderer()
+    row = '{:>7} {:>12} {:>12} {:>12} {:>12} {:>14}'
+    print(row.format(
+        'links', 'inline', 'deduplicated', 'inline gzip', 'dedup gzip',
+        'deduplication'
+    ))
+    for size in SIZES:
+        document = make_document(links=size, fields=10)
+        spec = generate_swagger_object(document)
+        deduplicated = generate_swagger_object(document)
+        deduplicate_schemas(deduplicated)
+        inline, content = renderer.dump(spec), renderer.dump(deduplicated)
+        durations = []
+        for _ in range(3):
+            data = generate_swagger_object(document)
+            durations.append(timeit.timeit(
+                lambda: deduplicate_schemas(data),
+                number=1
+            ))
+        print(row.format(
+            size,
+            '%.1f KB' % (len(inline) / 1e3),
+            '%.1f KB' % (len(content) / 1e3),
+            '%.1f KB' % (len(compress(inline, 'gzip')) / 1e3),
+            '%.1f KB' % (len(compress(content, 'gzip')) / 1e3),
+            '%.1f ms' % (min(durations) * 1000),
+        ))
+
+
+if __name__ == '__main__':
+    main()
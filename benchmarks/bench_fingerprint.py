@@ -0,0 +1,54 @@
+"""
+Compares the cost of fingerprinting a document with encoding it.
+
+    python -m benchmarks.bench_fingerprint
+
+`cold` fingerprints freshly built documents, as on a miss of the
+in-process spec cache with the shared cache enabled, and `cold / dump` is
+its cost relative to encoding the document. `generation` looks up the key
+of the in-process spec cache.
+"""
+from __future__ import print_function
+import timeit
+
+from openapi_codec import OpenAPICodec
+from rest_framework_swagger.cache import get_generation
+from rest_framework_swagger.fingerprint import get_document_fingerprint
+
+from .documents import make_document
+
+
+SIZES = [10, 100, 1000, 10000]
+REPEAT = 5
+
+
+def best_of(func, repeat=REPEAT):
+    return min(timeit.repeat(func, repeat=repeat, number=1))
+
+
+def time_cold(size):
+    documents = [make_document(links=size) for _ in range(REPEAT)]
+    return best_of(lambda: get_document_fingerprint(documents.pop()))
+
+
+def main():
+    codec = OpenAPICodec()
+    row = '{:>7} {:>12} {:>12} {:>12} {:>12}'
+    print(row.format('links', 'codec dump', 'cold', 'cold / dump',
+                     'generation'))
+    for size in SIZES:
+        document = make_document(links=size)
+        dump = best_of(lambda: codec.dump(document))
+        cold = time_cold(size)
+        generation = best_of(lambda: get_generation(document))
+        print(row.format(
+            size,
+            '%.2f ms' % (dump * 1000),
+            '%.2f ms' % (cold * 1000),
+            '%.2f' % (cold / dump),
+            '%.2f us' % (generation * 1e6)
+        ))
+
+
+if __name__ == '__main__':
+    main()
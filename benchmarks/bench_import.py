@@ -0,0 +1,131 @@
+"""
+Times the import of the modules of rest_framework_swagger loaded by a
+urlconf, each in a fresh interpreter where Django is set up and Django REST
+framework already imported, and lists the dependencies they load.
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --check --max-time 50
+
+The dependencies deferred to the first request must not be loaded by the
+import: with `--check`, the process exits with status 1 when one is, or
+when an import takes longer than `--max-time` milliseconds. On Python 3.7
+and later, the slowest imports reported by `python -X importtime` are
+listed too.
+"""
+from __future__ import print_function
+import argparse
+import json
+import subprocess
+import sys
+
+
+MODULES = [
+    'rest_framework_swagger.views',
+    'rest_framework_swagger.renderers',
+    'rest_framework_swagger.artifacts',
+]
+# Imported on the first request which needs them.
+DEFERRED = [
+    'coreapi',
+    'openapi_codec',
+    'simplejson',
+    'django.shortcuts',
+    'rest_framework.schemas',
+    'django.contrib.admindocs',
+]
+MARKER = '-- rest_framework_swagger --'
+CHILD = '''
+import json, os, sys, timeit
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+import django
+django.setup()
+import rest_framework.renderers, rest_framework.views
+before = set(sys.modules)
+sys.stderr.write(%(marker)r + '\\n')
+start = timeit.default_timer()
+import %(module)s
+elapsed = timeit.default_timer() - start
+loaded = [name for name in %(deferred)r
+          if name in sys.modules and name not in before]
+print(json.dumps({'time': elapsed, 'loaded': loaded}))
+'''
+IMPORTTIME = sys.version_info >= (3, 7)
+
+
+def measure(module, importtime=False):
+    """
+    Returns the time taken to import `module` in a fresh interpreter, the
+    deferred dependencies it loaded and, with `importtime`, the
+    (cumulative microseconds, name) pairs of the modules it imported.
+    """
+    args = [sys.executable]
+    if importtime:
+        args += ['-X', 'importtime']
+    args += ['-c', CHILD % {
+        'marker': MARKER, 'module': module, 'deferred': DEFERRED
+    }]
+    process = subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    stdout, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError(stderr)
+
+    result = json.loads(stdout)
+    imports = []
+    if importtime:
+        # import time: self [us] | cumulative | imported package
+        for line in stderr.split(MARKER, 1)[-1].splitlines():
+            fields = line.split('|')
+            if line.startswith('import time:') and len(fields) == 3:
+                try:
+                    imports.append((int(fields[1]), fields[2].strip()))
+                except ValueError:
+                    pass
+    return result['time'], result['loaded'], imports
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--check', action='store_true')
+    parser.add_argument('--max-time', type=float, default=None,
+                        help='Slowest import allowed, in milliseconds.')
+    args = parser.parse_args()
+
+    failures = []
+    row = '{:<36} {:>10}  {}'
+    print(row.format('module', 'import', 'deferred dependencies loaded'))
+    for module in MODULES:
+        times = []
+        for _ in range(args.repeat):
+            elapsed, loaded, _ = measure(module)
+            times.append(elapsed)
+        elapsed = min(times)
+        print(row.format(
+            module, '%.1f ms' % (elapsed * 1000), ', '.join(loaded) or '-'
+        ))
+        if loaded:
+            failures.append('%s loads %s' % (module, ', '.join(loaded)))
+        if args.max_time is not None and elapsed * 1000 > args.max_time:
+            failures.append('%s takes %.1f ms' % (module, elapsed * 1000))
+
+    if IMPORTTIME:
+        imports = measure(MODULES[0], importtime=True)[2]
+        print()
+        print('Slowest imports of %s:' % MODULES[0])
+        for cumulative, name in sorted(imports, reverse=True)[:args.top]:
+            print('{:>10}  {}'.format('%.1f ms' % (cumulative / 1e3), name))
+
+    if args.check and failures:
+        print()
+        for failure in failures:
+            print('FAIL: %s' % failure)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Encodes the same specification with each available JSON backend.
+
+    python -m benchmarks.bench_json
+"""
+from __future__ import print_function
+import timeit
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework_swagger import json_backends
+from rest_framework_swagger.compiler import generate_swagger_object
+
+from .documents import make_document
+
+
+SIZES = [100, 1000, 10000]
+BACKENDS = [
+    json_backends.SimpleJSONBackend,
+    json_backends.StdlibJSONBackend,
+    json_backends.UJSONBackend,
+    json_backends.OrjsonBackend,
+]
+
+
+def get_backends():
+    for backend_class in BACKENDS:
+        for compact in (False, True):
+            try:
+                backend = backend_class(compact=compact)
+            except ImproperlyConfigured:
+                break
+            yield backend
+            if not backend_class.supports_verbose:
+                break
+
+
+def main():
+    row = '{:>7} {:<20} {:>8} {:>12} {:>12} {:>12}'
+    print(row.format('links', 'backend', 'compact', 'size',
+                     'dumps', 'loads'))
+    for size in SIZES:
+        spec = generate_swagger_object(make_document(links=size))
+        for backend in get_backends():
+            content = backend.dumps(spec)
+            dumps = min(timeit.repeat(
+                lambda: backend.dumps(spec), repeat=5, number=1
+            ))
+            loads = min(timeit.repeat(
+                lambda: backend.loads(content), repeat=5, number=1
+            ))
+            print(row.format(
+                size,
+                type(backend).__name__,
+                'yes' if backend.compact else 'no',
+                '%.1f KB' % (len(content) / 1024.0),
+                '%.2f ms' % (dumps * 1000),
+                '%.2f ms' % (loads * 1000),
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares the size and rendering time of the whole specification with its
+`openapi-lite` summary.
+
+    python -m benchmarks.bench_lite
+"""
+from __future__ import print_function
+import timeit
+
+from rest_framework_swagger.compression import compress
+from rest_framework_swagger.renderers import (
+    OpenAPILiteRenderer, OpenAPIRenderer
+)
+
+from .documents import make_document
+
+
+SIZES = [100, 1000, 10000]
+
+
+class Request(object):
+    def get_host(self):
+        return 'api.example.com'
+
+
+def main():
+    renderer_context = {'request': Request()}
+    row = '{:>7} {:<13} {:>10} {:>10} {:>12}'
+    print(row.format('links', 'format', 'size', 'gzip', 'render time'))
+    for size in SIZES:
+        document = make_document(links=size, fields=10)
+        for renderer in (OpenAPIRenderer(), OpenAPILiteRenderer()):
+            def render():
+                return renderer.render_specification(
+                    document, renderer_context
+                )
+            content = render()
+            print(row.format(
+                size,
+                renderer.format,
+                '%.1f KB' % (len(content) / 1e3),
+                '%.1f KB' % (len(compress(content, 'gzip')) / 1e3),
+                '%.1f ms' % (
+                    min(timeit.repeat(render, repeat=3, number=1)) * 1000
+                ),
+            ))
+
+
+if __name__ == '__main__':
+    main()
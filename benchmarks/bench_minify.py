@@ -0,0 +1,57 @@
+"""
+Compares the size of the specification, and the time taken to encode it,
+as rendered by default, with `COMPACT_JSON`, and with `MINIFY`.
+
+    python -m benchmarks.bench_minify
+"""
+from __future__ import print_function
+import timeit
+
+from rest_framework_swagger.compiler import generate_swagger_object
+from rest_framework_swagger.json_backends import SimpleJSONBackend
+from rest_framework_swagger.minify import minify
+
+from .documents import make_document
+
+
+SIZES = [100, 1000, 10000]
+MODES = [
+    ('default', False, None),
+    ('COMPACT_JSON', True, None),
+    ('MINIFY', True, False),
+    ('MINIFY, no descriptions', True, True),
+]
+
+
+def render(document, compact, strip_descriptions):
+    spec = generate_swagger_object(document)
+    if strip_descriptions is not None:
+        minify(spec, strip_descriptions)
+    return SimpleJSONBackend(compact=compact).dumps(spec)
+
+
+def main():
+    row = '{:>7} {:<24} {:>12} {:>8} {:>12}'
+    print(row.format('links', 'mode', 'size', 'saved', 'render time'))
+    for size in SIZES:
+        document = make_document(links=size, fields=10)
+        default_size = None
+        for name, compact, strip_descriptions in MODES:
+            def call():
+                return render(document, compact, strip_descriptions)
+            content_size = len(call())
+            if default_size is None:
+                default_size = content_size
+            print(row.format(
+                size,
+                name,
+                '%.1f KB' % (content_size / 1e3),
+                '%.0f%%' % (100 - 100.0 * content_size / default_size),
+                '%.1f ms' % (
+                    min(timeit.repeat(call, repeat=3, number=1)) * 1000
+                ),
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Compares the peak memory and duration of rendering the specification in
+one piece with streaming it in chunks.
+
+    python -m benchmarks.bench_streaming
+"""
+from __future__ import print_function
+import timeit
+
+from rest_framework_swagger.renderers import OpenAPIRenderer
+
+from .documents import make_document
+from .memory import format_peak, measure_peak
+
+
+SIZES = [100, 1000, 10000]
+
+
+class Request(object):
+    def get_host(self):
+        return 'api.example.com'
+
+
+def render(renderer, document, renderer_context):
+    content = renderer.render_specification(document, renderer_context)
+    return len(content)
+
+
+def stream(renderer, document, renderer_context):
+    # Consume the chunks as a response would, without keeping them.
+    return sum(
+        len(chunk) for chunk in renderer.stream(document, renderer_context)
+    )
+
+
+def main():
+    renderer = OpenAPIRenderer()
+    renderer_context = {'request': Request()}
+    row = '{:>7} {:>10} {:>12} {:>12} {:>12} {:>12}'
+    print(row.format(
+        'links', 'size', 'render peak', 'stream peak',
+        'render time', 'stream time'
+    ))
+    for size in SIZES:
+        document = make_document(links=size, fields=10)
+        results = []
+        for func in (render, stream):
+            call = lambda: func(renderer, document, renderer_context)
+            results.append((
+                measure_peak(call),
+                min(timeit.repeat(call, repeat=3, number=1))
+            ))
+        (render_peak, render_time), (stream_peak, stream_time) = results
+        print(row.format(
+            size,
+            '%.1f MB' % (render(renderer, document, renderer_context) / 1e6),
+            format_peak(render_peak),
+            format_peak(stream_peak),
+            '%.1f ms' % (render_time * 1000),
+            '%.1f ms' % (stream_time * 1000),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares the time taken to render the Swagger UI page through the template
+engine with filling in the page cached with `UI_CACHE`.
+
+    python -m benchmarks.bench_ui
+"""
+from __future__ import print_function
+import timeit
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import RequestFactory
+from rest_framework_swagger.renderers import ui
+from rest_framework_swagger.cache import ui_cache
+
+
+NUMBER = 1000
+USERS = [
+    ('anonymous', AnonymousUser()),
+    ('authenticated', User(username='kramer')),
+]
+
+
+def render(user):
+    request = RequestFactory().get('/docs/')
+    request.user = user
+    return ui.SwaggerUIRenderer().render(
+        None, renderer_context={'request': request}
+    )
+
+
+def main():
+    row = '{:<14} {:<10} {:>14}'
+    print(row.format('user', 'UI_CACHE', 'render time'))
+    for name, user in USERS:
+        for enabled in (False, True):
+            ui.swagger_settings.UI_CACHE = enabled
+            ui_cache.clear()
+            seconds = min(timeit.repeat(
+                lambda: render(user), repeat=3, number=NUMBER
+            ))
+            print(row.format(
+                name,
+                str(enabled),
+                '%.1f us' % (seconds / NUMBER * 1e6),
+            ))
+
+
+if __name__ == '__main__':
+    main()
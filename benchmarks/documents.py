@@ -0,0 +1,74 @@
+"""
+Synthetic coreapi documents for benchmarking.
+"""
+import coreapi
+
+
+ACTIONS = ['get', 'post', 'put', 'patch', 'delete']
+LOCATIONS = ['path', 'query', 'form', 'header']
+
+
+def make_document(links=100, fields=5, links_per_tag=20):
+    """
+    Returns a document with `links` links spread across tags, each link
+    having up to `fields` fields and a response schema.
+    """
+    content = {}
+    tags = []
+    definitions = {}
+    for index in range(links):
+        tag = 'tag%d' % (index // links_per_tag)
+        if tag not in content:
+            content[tag] = {}
+            tags.append({'name': tag, 'description': 'All of %s' % tag})
+
+        model = 'Model%d' % (index % 50)
+        definitions[model] = make_schema(fields)
+        content[tag]['link%d' % index] = make_link(index, fields, model)
+
+    return coreapi.Document(
+        url='https://api.example.com/',
+        title='Benchmark API',
+        content=content,
+        tags=tags,
+        definitions=definitions
+    )
+
+
+def make_link(index, fields, model):
+    return coreapi.Link(
+        url='/resources%d/{pk}/' % (index // len(ACTIONS)),
+        action=ACTIONS[index % len(ACTIONS)],
+        summary='Operation %d' % index,
+        description='Performs operation %d on the resource.' % index,
+        fields=[
+            coreapi.Field(
+                'field%d' % number,
+                number == 0,
+                LOCATIONS[number % len(LOCATIONS)],
+                'string',
+                'Field %d of operation %d' % (number, index)
+            )
+            for number in range(1 + index % max(fields, 1))
+        ],
+        responses={
+            200: {
+                'description': 'OK',
+                'schema': make_schema(fields)
+            },
+            403: {'description': 'Forbidden'},
+        }
+    )
+
+
+def make_schema(fields):
+    return {
+        'type': 'object',
+        'properties': {
+            'property%d' % number: {
+                'type': 'string',
+                'description': 'Property %d' % number
+            }
+            for number in range(fields)
+        }
+    }
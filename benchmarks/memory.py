@@ -0,0 +1,32 @@
+"""
+Peak memory measurement for benchmarks.
+"""
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+def measure_peak(func):
+    """
+    Calls `func` and returns the peak memory, in bytes, allocated while it
+    ran, as traced by tracemalloc. Returns None where tracemalloc isn't
+    available, as on Python 2: other measurements aren't comparable.
+    """
+    if tracemalloc is None:
+        func()
+        return None
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def format_peak(peak):
+    if peak is None:
+        return 'n/a'
+    return '%.1f MB' % (peak / 1e6)
@@ -0,0 +1,19 @@
+SECRET_KEY = 'fake-key'
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.staticfiles',
+    'rest_framework_swagger',
+]
+STATIC_URL = '/static/'
+ROOT_URLCONF = []
+DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3'}}
+TEMPLATES = [{
+    'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    'APP_DIRS': True,
+    'OPTIONS': {
+        'context_processors': [
+            'django.template.context_processors.request',
+        ],
+    },
+}]
@@ -0,0 +1,254 @@
+"""
+Benchmark suite for specification generation and rendering.
+
+Times each stage of the renderers against synthetic documents of 10 to
+10,000 links, records the peak memory of each stage with tracemalloc, and
+optionally compares the results with a baseline saved on the same machine:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --save-baseline .benchmarks/baseline.json
+    python -m benchmarks --baseline .benchmarks/baseline.json
+
+The process exits with status 1 when a stage is slower, or uses more
+memory, than the baseline allows, and when the baseline is missing or was
+recorded with another interpreter.
+"""
+from __future__ import print_function
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+import coreapi
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from rest_framework_swagger.fingerprint import (
+    MEMO_ATTRIBUTE, get_document_fingerprint
+)
+from rest_framework_swagger.renderers import (
+    OpenAPIRenderer, SwaggerUIRenderer
+)
+
+from .documents import make_document
+from .memory import measure_peak, tracemalloc
+
+
+SIZES = [10, 100, 1000, 10000]
+FIELDS = [2, 10]
+
+
+class Response(object):
+    status_code = 200
+
+    def __init__(self):
+        self.headers = {}
+
+    def __setitem__(self, header, value):
+        self.headers[header] = value
+
+    def has_header(self, header):
+        return header in self.headers
+
+
+def get_renderer_context():
+    request = RequestFactory().get('/', HTTP_HOST='api.example.com')
+    request.user = AnonymousUser()
+    return {'request': request, 'response': Response()}
+
+
+def forget_fingerprints(node):
+    """
+    Drops the digests memoized on a document and its nodes, so that it is
+    fingerprinted whole, as on its first miss of the spec cache.
+    """
+    vars(node).pop(MEMO_ATTRIBUTE, None)
+    if not isinstance(node, coreapi.Link):
+        for value in node.values():
+            if isinstance(value, (coreapi.Object, coreapi.Link)):
+                forget_fingerprints(value)
+    return node
+
+
+def get_stages(document):
+    """
+    Returns (name, callable) pairs, one for each stage of rendering the
+    document.
+    """
+    openapi = OpenAPIRenderer()
+    ui = SwaggerUIRenderer()
+    spec = openapi.get_openapi_specification(document)
+    openapi.add_customizations(spec, get_renderer_context())
+
+    def render():
+        # A new renderer for each call, as for each response.
+        return OpenAPIRenderer().render(
+            document,
+            renderer_context=get_renderer_context()
+        )
+
+    return [
+        ('fingerprint',
+         lambda: get_document_fingerprint(forget_fingerprints(document))),
+        ('get_openapi_specification',
+         lambda: openapi.get_openapi_specification(document)),
+        ('add_customizations',
+         lambda: openapi.add_customizations(spec, get_renderer_context())),
+        ('dump', lambda: openapi.dump(spec)),
+        ('openapi_render', render),
+        ('swagger_ui_render',
+         lambda: ui.render(None, renderer_context=get_renderer_context())),
+    ]
+
+
+def run(sizes, fields, repeat):
+    results = []
+    for size in sizes:
+        for field_count in fields:
+            document = make_document(links=size, fields=field_count)
+            for stage, func in get_stages(document):
+                timings = timeit.repeat(func, repeat=repeat, number=1)
+                result = {
+                    'links': size,
+                    'fields': field_count,
+                    'stage': stage,
+                    'seconds': min(timings),
+                    'mean_seconds': sum(timings) / len(timings),
+                    'peak_bytes': measure_peak(func),
+                }
+                results.append(result)
+                print_result(result)
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'memory': 'tracemalloc' if tracemalloc is not None else None,
+        'results': results,
+    }
+
+
+def print_result(result):
+    peak = result['peak_bytes']
+    print('{links:>6} links {fields:>3} fields  {stage:<26} '
+          '{ms:>10.2f} ms {kb:>13}'.format(
+              ms=result['seconds'] * 1000,
+              kb='n/a' if peak is None else '%.1f KB' % (peak / 1024.0),
+              **result
+          ))
+
+
+def get_mismatch(results, baseline):
+    """
+    Returns a description of the difference between the interpreters the
+    results and the baseline were recorded with, or None if they match.
+    """
+    for name in ('python', 'implementation', 'memory'):
+        if results.get(name) != baseline.get(name):
+            return 'the baseline was recorded with %s %s, not %s' % (
+                name, baseline.get(name), results.get(name)
+            )
+    return None
+
+
+def compare(results, baseline, tolerance, min_seconds, min_bytes):
+    """
+    Returns a description of each stage which regressed against the
+    baseline by more than `tolerance`. Measurements below `min_seconds`
+    or `min_bytes` in both runs are too noisy to compare, and missing or
+    zero measurements in the baseline can't be compared.
+    """
+    minimums = {'seconds': min_seconds, 'peak_bytes': min_bytes}
+
+    def get_key(result):
+        return (result['links'], result['fields'], result['stage'])
+
+    expected = dict(
+        (get_key(result), result) for result in baseline['results']
+    )
+    regressions = []
+    for result in results['results']:
+        previous = expected.get(get_key(result))
+        if previous is None:
+            continue
+
+        for metric in ('seconds', 'peak_bytes'):
+            if not previous[metric] or result[metric] is None:
+                continue
+            if max(result[metric], previous[metric]) < minimums[metric]:
+                continue
+            limit = previous[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                regressions.append(
+                    '%s links, %s fields, %s: %s %s > %s baseline' % (
+                        result['links'], result['fields'], result['stage'],
+                        metric, result[metric], previous[metric]
+                    )
+                )
+
+    return regressions
+
+
+def write_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True, separators=(',', ': '))
+        f.write('\n')
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        description='Benchmark specification generation and rendering.'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help='Number of links of each document.')
+    parser.add_argument('--fields', type=int, nargs='+', default=FIELDS,
+                        help='Maximum number of fields of each link.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of timed runs of each stage.')
+    parser.add_argument('--output', help='Write the results to this file.')
+    parser.add_argument('--save-baseline',
+                        help='Write the results as the baseline to this file.')
+    parser.add_argument('--baseline',
+                        help='Compare the results with this baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative regression (default: 0.25).')
+    parser.add_argument('--min-seconds', type=float, default=0.001,
+                        help='Ignore timings below this duration.')
+    parser.add_argument('--min-bytes', type=int, default=1024 * 1024,
+                        help='Ignore peak memory below this size.')
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    if args.baseline and not os.path.exists(args.baseline):
+        print('No baseline at %s: save one with --save-baseline.'
+              % args.baseline, file=sys.stderr)
+        return 1
+
+    results = run(args.sizes, args.fields, args.repeat)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            write_json(path, results)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    mismatch = get_mismatch(results, baseline)
+    if mismatch is not None:
+        print('Cannot compare with %s: %s.' % (args.baseline, mismatch),
+              file=sys.stderr)
+        return 1
+
+    regressions = compare(
+        results, baseline, args.tolerance, args.min_seconds, args.min_bytes
+    )
+    for regression in regressions:
+        print('REGRESSION: %s' % regression, file=sys.stderr)
+
+    return 1 if regressions else 0
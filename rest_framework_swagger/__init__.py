@@ -1 +1,3 @@
 __version__ = '2.0.5'
+
+default_app_config = 'rest_framework_swagger.apps.SwaggerConfig'
@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class SwaggerConfig(AppConfig):
+    name = 'rest_framework_swagger'
+    verbose_name = 'Django REST Swagger'
+
+    def ready(self):
+        # REST framework imports coreapi, so it is only imported when
+        # there is something to warm up.
+        if getattr(settings, 'SWAGGER_SETTINGS', {}).get('WARMUP'):
+            from .warmup import warm_up
+            # Every management command loads the apps, including migrate
+            # when the tables the views query are missing: errors are only
+            # logged.
+            warm_up(raise_errors=False)
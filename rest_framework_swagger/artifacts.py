@@ -0,0 +1,188 @@
+"""
+Serves the specification and UI built by the `generate_swagger` command.
+
+The artifacts are memory-mapped once per process and every response is
+sliced from the mapping: no file is opened or read on the hot path, and
+the pages are shared, through the page cache, by every worker process.
+This module imports neither coreapi nor openapi_codec.
+"""
+import json
+import mmap
+import os
+import tempfile
+import threading
+
+from django.conf import settings
+from django.http import (
+    Http404, HttpResponseNotModified, StreamingHttpResponse
+)
+from django.views.generic import View
+
+from .compression import get_accepted_encoding
+
+
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'index.html'
+SPEC_MEDIA_TYPE = 'application/openapi+json'
+
+
+class Artifact(object):
+    """
+    A memory-mapped file.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # Empty files can't be mapped.
+            self.buffer = b''
+            if self.size:
+                self.buffer = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, self.size, chunk_size):
+            yield self.buffer[start:start + chunk_size]
+
+
+class Artifacts(object):
+    """
+    The artifacts of a directory, listed by its manifest. They are mapped
+    again when the manifest changes.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._version = None
+        self.manifest = None
+        self.files = {}
+
+    def load(self):
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise Http404('No artifacts in %s.' % self.directory)
+
+        # The manifest is replaced, not rewritten, by generate_swagger.
+        version = (stat.st_ino, stat.st_mtime)
+        with self._lock:
+            if version == self._version:
+                return self
+
+            with open(path) as f:
+                manifest = json.load(f)
+            names = [INDEX_NAME, manifest['spec']['name']]
+            names.extend(name for _, name in manifest['spec']['encodings'])
+            self.files = dict(
+                (name, Artifact(os.path.join(self.directory, name)))
+                for name in names
+            )
+            self.manifest = manifest
+            self._version = version
+
+        return self
+
+
+_artifacts = {}
+_artifacts_lock = threading.Lock()
+
+
+def get_artifacts(directory):
+    with _artifacts_lock:
+        artifacts = _artifacts.get(directory)
+        if artifacts is None:
+            artifacts = _artifacts[directory] = Artifacts(directory)
+
+    return artifacts.load()
+
+
+class MappedFileResponse(StreamingHttpResponse):
+    """
+    A response whose content is sliced from an `Artifact`.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, artifact, *args, **kwargs):
+        super(MappedFileResponse, self).__init__(
+            artifact.iter_chunks(self.chunk_size),
+            *args,
+            **kwargs
+        )
+        self['Content-Length'] = str(artifact.size)
+
+
+class ArtifactView(View):
+    """
+    Serves `index.html` at the root of its url, and the specification at
+    `?format=openapi` or under its hashed name, from `directory` or the
+    `ARTIFACTS_DIR` setting. Urls must capture the file name as `path`:
+
+        url(r'^docs/(?P<path>[^/]*)$', ArtifactView.as_view())
+    """
+    directory = None
+    http_method_names = ['get', 'head']
+
+    def get(self, request, path=''):
+        artifacts = get_artifacts(self.get_directory())
+        spec = artifacts.manifest['spec']
+        if path == '' and request.GET.get('format') == 'openapi':
+            path = spec['name']
+
+        if path == '':
+            return MappedFileResponse(
+                artifacts.files[INDEX_NAME],
+                content_type='text/html; charset=utf-8'
+            )
+        if path != spec['name']:
+            raise Http404()
+
+        # Encodings are listed as (encoding, name) pairs, most preferred
+        # first.
+        variants = dict(spec['encodings'])
+        encoding = get_accepted_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING'),
+            [variant for variant, _ in spec['encodings']]
+        )
+        etag = spec['etag']
+        if encoding is not None:
+            etag = '%s-%s"' % (etag[:-1], encoding)
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        etags = [value.strip() for value in if_none_match.split(',')]
+        if etag in etags or '*' in etags:
+            response = HttpResponseNotModified()
+        else:
+            name = variants[encoding] if encoding else spec['name']
+            response = MappedFileResponse(
+                artifacts.files[name],
+                content_type=SPEC_MEDIA_TYPE
+            )
+            if encoding is not None:
+                response['Content-Encoding'] = encoding
+
+        response['ETag'] = etag
+        if variants:
+            response['Vary'] = 'Accept-Encoding'
+        return response
+
+    def get_directory(self):
+        # Read without swagger_settings, which imports REST framework.
+        directory = self.directory or \
+            getattr(settings, 'SWAGGER_SETTINGS', {}).get('ARTIFACTS_DIR')
+        if not directory:
+            raise Http404('No ARTIFACTS_DIR is configured.')
+        return directory
+
+
+def write(directory, name, content):
+    """
+    Writes an artifact to `directory`, atomically.
+    """
+    # Files are replaced, never rewritten, as they may be mapped in memory
+    # by the processes serving them.
+    fd, path = tempfile.mkstemp(dir=directory, prefix='.' + name)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+    os.chmod(path, 0o644)
+    os.rename(path, os.path.join(directory, name))
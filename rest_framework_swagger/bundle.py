@@ -0,0 +1,153 @@
+"""
+Bundles the scripts and stylesheets of the Swagger UI page into one script
+and one stylesheet, named after the hash of their content, for the
+`USE_BUNDLE` setting. The bundles are built by `manage.py
+build_swagger_bundle` and listed in a manifest, found through the static
+files finders.
+
+The bundles are regular static files: collected by `collectstatic`, they
+are hashed again by `ManifestStaticFilesStorage`, which also rewrites the
+urls of the stylesheet.
+"""
+import hashlib
+import io
+import json
+import os
+import re
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import force_bytes, force_text
+
+
+PREFIX = 'rest_framework_swagger/'
+MANIFEST_NAME = PREFIX + 'bundle.json'
+SCRIPT_NAME = PREFIX + 'bundle.%s.js'
+# Next to the stylesheets, whose urls are relative to their directory.
+STYLESHEET_NAME = PREFIX + 'css/bundle.%s.css'
+
+# The scripts of `base.html`, in order, minified where a minified version
+# ships.
+SCRIPTS = (
+    'lib/object-assign-pollyfill.js',
+    'lib/jquery-1.8.0.min.js',
+    'lib/jquery.slideto.min.js',
+    'lib/jquery.wiggle.min.js',
+    'lib/jquery.ba-bbq.min.js',
+    'lib/handlebars-4.0.5.js',
+    'lib/lodash.min.js',
+    'lib/backbone-min.js',
+    'swagger-ui.min.js',
+    'lib/highlight.9.1.0.pack.js',
+    'lib/highlight.9.1.0.pack_extended.js',
+    'lib/jsoneditor.min.js',
+    'lib/marked.js',
+    'lib/swagger-oauth.js',
+)
+# The stylesheets of `base.html`, by media. The fonts are declared for
+# every media.
+STYLESHEETS = (
+    (None, ('css/typography.css',)),
+    ('screen', ('css/reset.css', 'css/screen.css')),
+    ('print', ('css/reset.css', 'css/print.css')),
+)
+
+SOURCE_MAP_RE = re.compile(r'^//[#@] sourceMappingURL=.*$', re.M)
+# Strings are matched first, so that comments and spaces within them are
+# kept. Spaces next to punctuation are dropped, other runs of spaces are
+# collapsed.
+CSS_TOKEN_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/|'
+    r'(?<=[{};,])\s+|\s+(?=[{};,])|(\s+)',
+    re.S
+)
+
+
+def build_bundle(find=finders.find):
+    """
+    Returns the (name, content) pairs of the script and the stylesheet
+    bundles, and of the manifest listing them.
+    """
+    script = force_bytes(bundle_scripts(
+        read(find, PREFIX + path) for path in SCRIPTS
+    ))
+    stylesheet = force_bytes(bundle_stylesheets(
+        (media, [read(find, PREFIX + path) for path in paths])
+        for media, paths in STYLESHEETS
+    ))
+    script_name = SCRIPT_NAME % get_digest(script)
+    stylesheet_name = STYLESHEET_NAME % get_digest(stylesheet)
+    manifest = json.dumps(
+        {'script': script_name, 'stylesheet': stylesheet_name},
+        sort_keys=True
+    )
+    return [
+        (script_name, script),
+        (stylesheet_name, stylesheet),
+        (MANIFEST_NAME, force_bytes(manifest)),
+    ]
+
+
+def bundle_scripts(sources):
+    # Scripts may omit their last semicolon, or end with a comment.
+    return u'\n;\n'.join(
+        SOURCE_MAP_RE.sub(u'', source).strip() for source in sources
+    ) + u'\n;\n'
+
+
+def bundle_stylesheets(sources):
+    rules = []
+    for media, stylesheets in sources:
+        content = u'\n'.join(minify_css(source) for source in stylesheets)
+        if media is not None:
+            content = u'@media %s{%s}' % (media, content)
+        rules.append(content)
+    return u'\n'.join(rules) + u'\n'
+
+
+def minify_css(source):
+    """
+    Drops the comments and the spaces of a stylesheet which don't change
+    its meaning.
+    """
+    def replace(match):
+        if match.group(1):
+            return match.group(1)
+        return u' ' if match.group(2) else u''
+
+    return CSS_TOKEN_RE.sub(replace, source).strip()
+
+
+def get_digest(content):
+    return hashlib.sha1(content).hexdigest()[:12]
+
+
+def read(find, path):
+    location = find(path)
+    if not location:
+        raise ImproperlyConfigured('The static file %s is missing.' % path)
+    with io.open(location, encoding='utf-8') as f:
+        return f.read()
+
+
+def get_bundle(find=finders.find):
+    """
+    Returns the manifest of the bundles, mapping `script` and `stylesheet`
+    to their static names.
+    """
+    location = find(MANIFEST_NAME)
+    if not location:
+        raise ImproperlyConfigured(
+            'USE_BUNDLE is set, but the %s static file is missing. Build '
+            'it with `manage.py build_swagger_bundle`.' % MANIFEST_NAME
+        )
+    with open(location, 'rb') as f:
+        return json.loads(force_text(f.read()))
+
+
+def get_static_directory():
+    """
+    Returns the static files directory of the app, to which the bundles
+    are written by default.
+    """
+    return os.path.join(os.path.dirname(__file__), 'static')
@@ -0,0 +1,392 @@
+"""
+Caches of generated schemas, rendered OpenAPI specifications and the
+Swagger UI page: in process, and shared between processes through Django's
+cache framework.
+"""
+from collections import OrderedDict
+import hashlib
+import itertools
+import sys
+import threading
+import time
+import uuid
+
+from django.core.cache import caches
+from django.test.signals import setting_changed
+from django.utils.encoding import force_bytes
+
+from . import __version__, settings
+from .compression import compress
+
+
+GENERATION_ATTRIBUTE = '_swagger_generation'
+
+_generations = itertools.count(1)
+
+
+def get_generation(document):
+    """
+    Returns the generation of a document: a number identifying it in this
+    process, assigned when it is stored in the document cache, or on first
+    use for a document which never was. Unlike its `id`, a generation is
+    never reused by another document.
+    """
+    generation = getattr(document, GENERATION_ATTRIBUTE, None)
+    if generation is None:
+        generation = set_generation(document)
+    return generation
+
+
+def set_generation(document):
+    generation = next(_generations)
+    setattr(document, GENERATION_ATTRIBUTE, generation)
+    return generation
+
+
+class Spec(object):
+    """
+    An encoded specification along with its validators and its
+    pre-compressed variants.
+    """
+    def __init__(self, content, encodings=(), etag=None,
+                 last_modified=None):
+        self.content = content
+        self.encodings = list(encodings)
+        self.variants = {
+            encoding: compress(content, encoding)
+            for encoding in self.encodings
+        }
+        if etag is None:
+            etag = '"%s"' % hashlib.sha1(content).hexdigest()
+        self.etag = etag
+        if last_modified is None:
+            last_modified = int(time.time())
+        self.last_modified = last_modified
+
+    @property
+    def size(self):
+        return sys.getsizeof(self.content) + sum(
+            sys.getsizeof(variant) for variant in self.variants.values()
+        )
+
+    def get_content(self, encoding=None):
+        if encoding is None:
+            return self.content
+        return self.variants[encoding]
+
+    def get_etag(self, encoding=None):
+        """
+        Returns the ETag of the content in the given encoding. Each
+        encoding is a distinct representation, with its own strong ETag.
+        """
+        if encoding is None:
+            return self.etag
+        return '%s-%s"' % (self.etag[:-1], encoding)
+
+
+class SpecTemplate(object):
+    """
+    An encoded specification without its `host`, split around the place
+    the host goes, so that it can be rendered for any host without being
+    encoded again.
+    """
+    def __init__(self, prefix, suffix):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.digest = hashlib.sha1(prefix + b'\0' + suffix).hexdigest()
+        self.last_modified = int(time.time())
+
+    @property
+    def size(self):
+        return sys.getsizeof(self.prefix) + sys.getsizeof(self.suffix)
+
+    def render(self, host, encodings=()):
+        """
+        Returns the `Spec` for `host`, given as encoded JSON.
+        """
+        # The ETag hashes the host with the template, not the whole content.
+        etag = hashlib.sha1(self.digest.encode('ascii') + host).hexdigest()
+        return Spec(
+            self.prefix + host + self.suffix,
+            encodings,
+            etag='"%s"' % etag,
+            last_modified=self.last_modified
+        )
+
+
+class SpecCache(object):
+    """
+    A thread-safe LRU cache of `Spec` and `SpecTemplate` instances.
+
+    Entries are evicted, least recently used first, once the cache holds
+    more than `SPEC_CACHE_MAX_ENTRIES` entries or more than
+    `SPEC_CACHE_MAX_BYTES` bytes.
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_entries(self):
+        return settings.swagger_settings.SPEC_CACHE_MAX_ENTRIES
+
+    @property
+    def max_bytes(self):
+        return settings.swagger_settings.SPEC_CACHE_MAX_BYTES
+
+    def get(self, key):
+        with self._lock:
+            spec = self._entries.pop(key, None)
+            if spec is not None:
+                self._entries[key] = spec
+
+        return spec
+
+    def set(self, key, spec):
+        size = spec.size
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key).size
+            self._entries[key] = spec
+            self.size += size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _evict(self):
+        while self._entries and (
+                len(self._entries) > self.max_entries or
+                self.size > self.max_bytes):
+            _, spec = self._entries.popitem(last=False)
+            self.size -= spec.size
+
+
+class DocumentCache(object):
+    """
+    A thread-safe LRU cache of generated `coreapi.Document` instances, and
+    of the schema generators they come from.
+
+    Each document is kept for as long as the url patterns it was generated
+    from, and for at most `ttl` seconds. An entry found with other url
+    patterns is dropped, and the least recently used entry is evicted once
+    the cache holds more than `SCHEMA_CACHE_MAX_ENTRIES` entries.
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_entries(self):
+        return settings.swagger_settings.SCHEMA_CACHE_MAX_ENTRIES
+
+    def get(self, key, patterns):
+        document, expired = self.get_entry(key, patterns)
+        return None if expired else document
+
+    def get_entry(self, key, patterns):
+        """
+        Returns the document of `key`, even when expired, and whether it
+        has expired. The document is None when it is missing or was
+        generated from other url patterns.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[1] is not patterns:
+                return None, False
+            self._entries[key] = entry
+
+        document, _, expires = entry
+        return document, expires is not None and time.time() >= expires
+
+    def set(self, key, document, patterns, ttl=None):
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (document, patterns, expires)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class UICache(object):
+    """
+    A thread-safe cache of the parts of the Swagger UI page which are the
+    same for every request. It is cleared whenever a setting changes.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, create):
+        """
+        Returns the entry of `key`, calling `create` to make it when it is
+        missing.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+        if value is None:
+            value = create()
+            with self._lock:
+                self._entries[key] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedSpecCache(object):
+    """
+    Stores specifications in the Django cache named by the `CACHE` setting,
+    so that they are rendered once for every process.
+
+    A process rendering a missing specification holds a lease on it, for
+    at most `CACHE_LEASE_TIMEOUT` seconds, while the other processes wait
+    for the result.
+    """
+    # Processes running another version of the package, as during a
+    # rolling deployment, don't share their specifications.
+    key_prefix = 'rest_framework_swagger:%s:spec:' % __version__
+    poll_interval = 0.05
+
+    @property
+    def enabled(self):
+        return bool(settings.swagger_settings.CACHE)
+
+    @property
+    def cache(self):
+        return caches[settings.swagger_settings.CACHE]
+
+    def make_key(self, key):
+        digest = hashlib.sha1(force_bytes(repr(key))).hexdigest()
+        return self.key_prefix + digest
+
+    def get_or_set(self, key, create):
+        """
+        Returns the cached value of `key`, calling `create` to render it in
+        at most one process at a time.
+        """
+        cache = self.cache
+        cache_key = self.make_key(key)
+        value = cache.get(cache_key)
+        if value is not None:
+            return value
+
+        lease_key = cache_key + ':lease'
+        lease = uuid.uuid4().hex
+        lease_timeout = settings.swagger_settings.CACHE_LEASE_TIMEOUT
+        while not cache.add(lease_key, lease, lease_timeout):
+            # The lease expires if its holder dies, letting another
+            # process take it over.
+            time.sleep(self.poll_interval)
+            value = cache.get(cache_key)
+            if value is not None:
+                return value
+
+        try:
+            value = cache.get(cache_key)
+            if value is None:
+                value = create()
+                cache.set(
+                    cache_key,
+                    value,
+                    settings.swagger_settings.CACHE_TIMEOUT
+                )
+        finally:
+            if cache.get(lease_key) == lease:
+                cache.delete(lease_key)
+
+        return value
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent calls for the same key into one: the first caller
+    runs the function while the others wait for, and share, its result.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self, key):
+        return key in self._calls
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+spec_cache = SpecCache()
+document_cache = DocumentCache()
+shared_spec_cache = SharedSpecCache()
+ui_cache = UICache()
+single_flight = SingleFlight()
+
+
+def clear_caches(*args, **kwargs):
+    """
+    Clears the caches which depend on a setting changed during unit tests,
+    after `reload_settings` has reloaded the settings.
+    """
+    # The page depends on the templates, static files, urls and settings.
+    ui_cache.clear()
+    if kwargs['setting'] in ('ROOT_URLCONF', 'SWAGGER_SETTINGS'):
+        document_cache.clear()
+    if kwargs['setting'] == 'SWAGGER_SETTINGS':
+        spec_cache.clear()
+
+
+setting_changed.connect(clear_caches)
@@ -0,0 +1,130 @@
+"""
+Compiles a coreapi.Document straight into an OpenAPI 2.0 dictionary.
+
+The output is identical to `json.loads(OpenAPICodec().dump(document))`,
+without encoding the specification to JSON and decoding it back again.
+"""
+import json
+import numbers
+
+from django.utils import six
+
+
+def generate_swagger_object(document):
+    """
+    Generates root of the Swagger spec.
+    """
+    return _get_root_object(document, _get_paths_object(document))
+
+
+def generate_swagger_root(document):
+    """
+    Generates root of the Swagger spec with an empty paths object, for the
+    path items to be generated one at a time by `iter_path_items`.
+    """
+    return _get_root_object(document, {})
+
+
+def iter_path_items(document):
+    """
+    Generates the Path Item objects of the Swagger spec one at a time, as
+    `(url, path_item)` pairs, in the order of the paths object.
+    """
+    # The links are indexed in the same order as the paths object is
+    # filled, so that both iterate in the same order.
+    links = {}
+    for tag, object_ in document.data.items():
+        if not hasattr(object_, 'links'):
+            continue
+
+        for link in object_.links.values():
+            links.setdefault(link.url, []).append((tag, link))
+
+    for url, tagged_links in links.items():
+        operations = {}
+        for tag, link in tagged_links:
+            operations[link.action] = _get_operation(tag, link)
+        yield url, operations
+
+
+def _get_root_object(document, paths):
+    parsed_url = six.moves.urllib.parse.urlparse(document.url)
+
+    return {
+        'swagger': '2.0',
+        'info': _get_info_object(document),
+        'tags': _to_primitive(document.tags),
+        'definitions': _to_primitive(document.definitions),
+        'paths': paths,
+        'host': parsed_url.netloc,
+    }
+
+
+def _get_info_object(document):
+    return {
+        'title': document.title,
+        'version': ''  # Required by the spec
+    }
+
+
+def _get_paths_object(document):
+    paths = {}
+    for tag, object_ in document.data.items():
+        if not hasattr(object_, 'links'):
+            continue
+
+        for link in object_.links.values():
+            operations = paths.setdefault(link.url, {})
+            operations[link.action] = _get_operation(tag, link)
+
+    return paths
+
+
+def _get_operation(tag, link):
+    return {
+        'tags': [tag],
+        'description': link.description,
+        'summary': link.summary,
+        'responses': _to_primitive(link.responses),
+        'parameters': _get_parameters(link.fields)
+    }
+
+
+def _get_parameters(fields):
+    """
+    Generates Swagger Parameter Item object.
+    """
+    return [
+        {
+            'name': field.name,
+            'required': field.required,
+            'in': 'formData' if field.location == 'form' else field.location,
+            'description': field.description,
+            'type': field.type
+        }
+        for field in fields
+    ]
+
+
+def _to_primitive(value):
+    """
+    Returns a fresh copy of `value` shaped the way a JSON round trip would
+    leave it: tuples become lists and mapping keys become strings.
+    """
+    if isinstance(value, dict):
+        return {
+            _to_key(key): _to_primitive(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_primitive(item) for item in value]
+    return value
+
+
+def _to_key(key):
+    if isinstance(key, six.string_types):
+        return key
+    if key is None or isinstance(key, (numbers.Integral, float)):
+        return json.dumps(key)
+
+    raise TypeError('key %r is not a string' % (key,))
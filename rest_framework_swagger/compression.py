@@ -0,0 +1,66 @@
+"""
+Content encodings for pre-compressed specifications.
+"""
+import gzip
+import io
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+def get_available_encodings():
+    """
+    Returns the supported content encodings, most preferred first.
+    """
+    if brotli is not None:
+        return ['br', 'gzip']
+    return ['gzip']
+
+
+def compress(content, encoding):
+    if encoding == 'br':
+        return brotli.compress(content)
+    if encoding == 'gzip':
+        buf = io.BytesIO()
+        # A fixed mtime keeps the output, and so its ETag, reproducible.
+        with gzip.GzipFile(mode='wb', fileobj=buf, mtime=0) as f:
+            f.write(content)
+        return buf.getvalue()
+
+    raise ValueError('Unsupported content encoding: %s' % encoding)
+
+
+def get_accepted_encoding(accept_encoding, encodings):
+    """
+    Returns the encoding, out of `encodings`, preferred by the client's
+    `Accept-Encoding` header, or None when the content should be sent
+    unencoded.
+    """
+    qualities = {}
+    for item in (accept_encoding or '').split(','):
+        parts = item.split(';')
+        coding = parts[0].strip().lower()
+        if not coding:
+            continue
+        qualities[coding] = _get_quality(parts[1:])
+
+    best, best_quality = None, 0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get('*', 0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def _get_quality(params):
+    for param in params:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 1
@@ -0,0 +1,157 @@
+"""
+Hoists the schemas repeated across the operations of an OpenAPI
+specification into its `definitions`, for the `DEDUPLICATE_SCHEMAS`
+setting.
+
+Views often declare the same serializer for many responses, and each
+declaration is inlined in full: deduplicated, the specification grows with
+the number of distinct schemas rather than with the number of uses.
+"""
+from collections import Counter
+import hashlib
+import json
+
+from django.utils.encoding import force_bytes
+from django.utils.six import string_types
+
+from .fragments import DEFINITIONS_PREFIX
+
+
+# Smaller schemas take about as many bytes as a reference to them.
+MIN_SCHEMA_SIZE = 80
+SCHEMA_MEMBERS = ('items', 'additionalProperties')
+SCHEMA_LIST_MEMBERS = ('allOf', 'anyOf', 'oneOf')
+
+
+def deduplicate_schemas(spec):
+    """
+    Replaces each schema found more than once in the operations of `spec`
+    with a `$ref` to a definition holding it. Definitions are named after
+    the hash of their canonical encoding, and a schema equal to an
+    existing definition refers to it.
+    """
+    # Schemas built alike have the same repr, which is much cheaper to
+    # compute than a canonical encoding: they are counted by repr, and
+    # only one schema of each repr is encoded.
+    counts = Counter()
+
+    def count(container, key):
+        schema = container[key]
+        key = repr(schema)
+        counts[key] += 1
+        # A repeated schema is either hoisted whole or too small for any
+        # of its members to be, so its members are counted only once.
+        if counts[key] == 1:
+            for slot in _iter_nested_slots(schema):
+                count(*slot)
+
+    for slot in _iter_operation_slots(spec):
+        count(*slot)
+
+    definitions = spec.get('definitions') or {}
+    # Equal definitions are referred to by the first of their names.
+    digests = {}
+    for name in sorted(definitions, reverse=True):
+        if isinstance(definitions[name], dict):
+            digests[_encode(definitions[name])[0]] = name
+
+    names = {}
+
+    def get_name(schema):
+        key = repr(schema)
+        if key in names:
+            return names[key]
+
+        name = None
+        if '$ref' not in schema:
+            digest, size = _encode(schema)
+            name = digests.get(digest)
+            if name is None and counts[key] > 1 and size >= MIN_SCHEMA_SIZE:
+                name = digests[digest] = _get_name(schema, digest, definitions)
+                definitions[name] = schema
+        names[key] = name
+        return name
+
+    def replace(container, key):
+        schema = container[key]
+        name = get_name(schema)
+        if name is None:
+            for slot in _iter_nested_slots(schema):
+                replace(*slot)
+        else:
+            container[key] = {'$ref': DEFINITIONS_PREFIX + name}
+
+    for slot in _iter_operation_slots(spec):
+        replace(*slot)
+
+    if definitions:
+        spec['definitions'] = definitions
+
+
+def _encode(schema):
+    """
+    Returns the digest and size of the canonical encoding of `schema`.
+    """
+    content = force_bytes(json.dumps(
+        schema, sort_keys=True, separators=(',', ':')
+    ))
+    return hashlib.sha1(content).hexdigest(), len(content)
+
+
+def _get_name(schema, digest, definitions):
+    title = schema.get('title')
+    if isinstance(title, string_types) and title not in definitions:
+        return title
+    return 'Schema%s' % digest[:8]
+
+
+def _iter_operation_slots(spec):
+    """
+    Yields the (container, key) pairs of the schemas of the parameters and
+    responses of every operation, in a stable order.
+    """
+    for operations in _sorted_values(spec.get('paths', {})):
+        for slot in _iter_parameter_slots(operations):
+            yield slot
+        for operation in _sorted_values(operations):
+            if not isinstance(operation, dict):
+                continue
+            for slot in _iter_parameter_slots(operation):
+                yield slot
+            for response in _sorted_values(operation.get('responses') or {}):
+                if isinstance(response, dict) and \
+                        isinstance(response.get('schema'), dict):
+                    yield response, 'schema'
+
+
+def _iter_parameter_slots(owner):
+    parameters = owner.get('parameters') or ()
+    if not isinstance(parameters, list):
+        return
+    for parameter in parameters:
+        if isinstance(parameter, dict) and \
+                isinstance(parameter.get('schema'), dict):
+            yield parameter, 'schema'
+
+
+def _iter_nested_slots(schema):
+    for member in SCHEMA_MEMBERS:
+        if isinstance(schema.get(member), dict):
+            yield schema, member
+
+    properties = schema.get('properties')
+    if isinstance(properties, dict):
+        for name in sorted(properties):
+            if isinstance(properties[name], dict):
+                yield properties, name
+
+    for member in SCHEMA_LIST_MEMBERS:
+        schemas = schema.get(member)
+        if isinstance(schemas, list):
+            for index, item in enumerate(schemas):
+                if isinstance(item, dict):
+                    yield schemas, index
+
+
+def _sorted_values(mapping):
+    return [mapping[key] for key in sorted(mapping)]
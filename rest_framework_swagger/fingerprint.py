@@ -0,0 +1,190 @@
+"""
+Structural fingerprints of coreapi documents, which identify them in the
+shared cache of every process and version the specifications rendered from
+them. Fingerprinting a document costs about as much as encoding it.
+
+The fingerprint covers everything the OpenAPI specification is built from:
+the document url, title, tags and definitions, and the url, action,
+summary, description, responses and fields of every link. Mapping keys are
+sorted, so the result does not depend on insertion order.
+
+Documents, links and objects are immutable, so their digests are memoized
+on the node itself, and those of links and objects are shared between
+documents built from the same nodes. The links of an object are encoded
+together, in a single pass of the JSON encoder.
+
+Access fingerprints identify the endpoints of a schema visible to a
+request, so that users with the same permissions share a schema.
+"""
+import hashlib
+import simplejson as json
+
+import coreapi
+from coreapi.compat import force_bytes
+from rest_framework import exceptions
+from rest_framework.request import clone_request
+
+
+MEMO_ATTRIBUTE = '_swagger_fingerprint'
+
+
+def get_document_fingerprint(document):
+    """
+    Returns a hex digest identifying the content of a coreapi.Document,
+    computing it at most once for each document.
+    """
+    digest = getattr(document, MEMO_ATTRIBUTE, None)
+    if digest is not None:
+        return digest
+
+    content = _encode([
+        document.url,
+        document.title,
+        document.tags,
+        document.definitions,
+        _get_items(document, get_node_fingerprint),
+    ])
+    digest = hashlib.sha1(content).hexdigest()
+    setattr(document, MEMO_ATTRIBUTE, digest)
+    return digest
+
+
+def get_node_fingerprint(node):
+    """
+    Returns the hex digest of a link or object, computing it at most once.
+    """
+    digest = getattr(node, MEMO_ATTRIBUTE, None)
+    if digest is not None:
+        return digest
+
+    if isinstance(node, coreapi.Link):
+        content = _encode(_get_link(node))
+    else:
+        content = _encode(_get_items(node, _get_link))
+
+    digest = hashlib.sha1(content).hexdigest()
+    setattr(node, MEMO_ATTRIBUTE, digest)
+    return digest
+
+
+def get_access_fingerprint(generator, request):
+    """
+    Returns the indexes of the endpoints of a schema generator whose
+    permission checks pass for the request, as `get_schema` runs them.
+    """
+    allowed = []
+    for index, endpoint in enumerate(get_endpoints(generator)):
+        if _has_permission(generator, endpoint, request):
+            allowed.append(index)
+
+    return tuple(allowed)
+
+
+def get_endpoints(generator):
+    """
+    Returns the endpoints of a schema generator, listing them once, as
+    `get_schema` does: with its `endpoint_inspector_cls` from REST framework
+    3.5, and with its own `get_api_endpoints` in 3.4.
+    """
+    if getattr(generator, 'endpoints', None) is None:
+        inspector_cls = getattr(generator, 'endpoint_inspector_cls', None)
+        if inspector_cls is not None:
+            inspector = inspector_cls(generator.patterns, generator.urlconf)
+            generator.endpoints = inspector.get_api_endpoints()
+        else:
+            generator.endpoints = generator.get_api_endpoints(
+                generator.patterns
+            )
+
+    return generator.endpoints
+
+
+def _has_permission(generator, endpoint, request):
+    method, callback = endpoint[1], endpoint[-1]
+    if hasattr(generator, 'has_view_permissions'):
+        # REST framework 3.5+ endpoints are (path, method, callback).
+        view = generator.create_view(callback, method, request)
+        return generator.has_view_permissions(endpoint[0], method, view)
+
+    view = callback.cls()
+    for attr, value in getattr(callback, 'initkwargs', {}).items():
+        setattr(view, attr, value)
+    view.args = ()
+    view.kwargs = {}
+    view.format_kwarg = None
+    view.request = clone_request(request, method)
+    try:
+        view.check_permissions(view.request)
+    except exceptions.APIException:
+        return False
+    return True
+
+
+def _get_items(node, get_link):
+    """
+    Returns the sorted items of a document or object. Links are converted
+    with `get_link` and nested objects are replaced by their digest.
+    """
+    items = []
+    for key, value in sorted(node.items(), key=lambda item: item[0]):
+        if isinstance(value, coreapi.Link):
+            value = get_link(value)
+        elif isinstance(value, coreapi.Object):
+            value = get_node_fingerprint(value)
+        items.append([key, value])
+
+    return items
+
+
+def _get_link(link):
+    return [
+        link.url,
+        link.action,
+        link.encoding,
+        link.transform,
+        link.summary,
+        link.description,
+        link.responses,
+        link.fields,
+    ]
+
+
+def _encode(value):
+    """
+    Returns an order-stable encoding of `value`.
+    """
+    try:
+        value = _encoder.encode(value)
+    except TypeError:
+        # Keys of mixed types can't be sorted by the encoder.
+        value = repr(_canonical(value))
+
+    return force_bytes(value)
+
+
+def _default(value):
+    if isinstance(value, coreapi.Object):
+        return dict(value.items())
+    if isinstance(value, coreapi.Array):
+        return list(value)
+    return repr(value)
+
+
+_encoder = json.JSONEncoder(
+    sort_keys=True,
+    namedtuple_as_object=False,
+    default=_default
+)
+
+
+def _canonical(value):
+    """
+    Returns a hashable, order-stable representation of a primitive value.
+    """
+    if hasattr(value, 'items'):
+        return tuple(sorted(
+            (repr(key), _canonical(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple, coreapi.Array)):
+        return tuple(_canonical(item) for item in value)
+    return value
@@ -0,0 +1,144 @@
+"""
+Splits an OpenAPI specification, for the `SPEC_SPLIT` setting, into a
+small index of its operations and a fragment for each tag, and reduces it
+to the summary served by the `openapi-lite` format.
+
+The index keeps the tags and summary of each operation, which is all the
+UI needs to list them. The fragment of a tag holds its full operations and
+the definitions they refer to.
+"""
+from django.utils.six import string_types
+
+
+# The tag Swagger UI lists untagged operations under.
+DEFAULT_TAG = 'default'
+DEFINITIONS_PREFIX = '#/definitions/'
+INDEX_OPERATION_MEMBERS = ('tags', 'summary', 'operationId')
+LITE_OPERATION_MEMBERS = INDEX_OPERATION_MEMBERS + ('deprecated',)
+LITE_PARAMETER_MEMBERS = ('name', 'in', 'required', 'type')
+
+
+def get_index(spec):
+    """
+    Returns the specification without its definitions, and with its
+    operations reduced to their tags and summaries.
+    """
+    index = {
+        key: value for key, value in spec.items()
+        if key not in ('paths', 'definitions')
+    }
+    index['paths'] = _get_paths(
+        spec,
+        lambda operation: _select(operation, INDEX_OPERATION_MEMBERS)
+    )
+    return index
+
+
+def get_lite(spec):
+    """
+    Returns the specification without its definitions, descriptions and
+    responses, with the schema of each parameter left out.
+    """
+    def get_operation(operation):
+        lite = _select(operation, LITE_OPERATION_MEMBERS)
+        if operation.get('parameters'):
+            lite['parameters'] = [
+                _select(parameter, LITE_PARAMETER_MEMBERS)
+                for parameter in operation['parameters']
+            ]
+        return lite
+
+    lite = {
+        key: value for key, value in spec.items()
+        if key not in ('paths', 'definitions', 'securityDefinitions')
+    }
+    if 'info' in lite:
+        lite['info'] = _omit(lite['info'], 'description')
+    if 'tags' in lite:
+        lite['tags'] = [
+            _omit(tag, 'description') if isinstance(tag, dict) else tag
+            for tag in lite['tags']
+        ]
+    lite['paths'] = _get_paths(spec, get_operation)
+    return lite
+
+
+def get_fragment(spec, tag):
+    """
+    Returns the operations of `tag`, by path, and the definitions they
+    refer to, directly or through other definitions.
+    """
+    paths = {}
+    for path, operations in spec.get('paths', {}).items():
+        selected = {
+            method: operation
+            for method, operation in _iter_operations(operations)
+            if tag in (operation.get('tags') or [DEFAULT_TAG])
+        }
+        if selected:
+            paths[path] = selected
+
+    return {
+        'paths': paths,
+        'definitions': _get_definitions(paths, spec.get('definitions') or {})
+    }
+
+
+def _get_paths(spec, get_operation):
+    return {
+        path: {
+            method: get_operation(operation)
+            for method, operation in _iter_operations(operations)
+        }
+        for path, operations in spec.get('paths', {}).items()
+    }
+
+
+def _select(mapping, members):
+    return {
+        member: mapping[member] for member in members if member in mapping
+    }
+
+
+def _omit(mapping, member):
+    return {key: value for key, value in mapping.items() if key != member}
+
+
+def _iter_operations(operations):
+    # Path items may also hold members shared by their operations.
+    for method, operation in operations.items():
+        if isinstance(operation, dict):
+            yield method, operation
+
+
+def _get_definitions(value, definitions):
+    names = set()
+    pending = list(_iter_references(value))
+    while pending:
+        name = pending.pop()
+        if name in names or name not in definitions:
+            continue
+        names.add(name)
+        pending.extend(_iter_references(definitions[name]))
+
+    return {name: definitions[name] for name in names}
+
+
+def _iter_references(value):
+    """
+    Yields the name of each definition referred to from `value`.
+    """
+    if isinstance(value, dict):
+        reference = value.get('$ref')
+        if isinstance(reference, string_types) and \
+                reference.startswith(DEFINITIONS_PREFIX):
+            yield reference[len(DEFINITIONS_PREFIX):]
+        values = value.values()
+    elif isinstance(value, list):
+        values = value
+    else:
+        return
+
+    for item in values:
+        for name in _iter_references(item):
+            yield name
@@ -0,0 +1,101 @@
+"""
+JSON encoders available to the renderers, selected with the
+`JSON_BACKEND` setting.
+
+Each backend adapts one JSON library to a small interface: `dumps`,
+`loads` and the separators it writes between items and keys, which are
+used when a specification is encoded in pieces.
+"""
+import importlib
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+COMPACT_SEPARATORS = (',', ':')
+VERBOSE_SEPARATORS = (', ', ': ')
+
+
+class BaseJSONBackend(object):
+    """
+    Set `compact` to write no whitespace between items and keys.
+    Backends which only support compact output ignore it.
+    """
+    supports_verbose = True
+    # The JSON library adapted by the backend, imported as `self.json`.
+    module_name = None
+
+    def __init__(self, compact=False):
+        self.compact = compact or not self.supports_verbose
+        separators = COMPACT_SEPARATORS if self.compact \
+            else VERBOSE_SEPARATORS
+        self.item_separator, self.key_separator = separators
+        self.json = None
+        if self.module_name is not None:
+            self.json = _import(self.module_name)
+
+    def dumps(self, data):
+        """
+        Returns the encoded data, as text or bytes.
+        """
+        raise NotImplementedError('`dumps()` must be implemented.')
+
+    def loads(self, content):
+        raise NotImplementedError('`loads()` must be implemented.')
+
+
+class JSONModuleBackend(BaseJSONBackend):
+    """
+    Adapts a library with the interface of the standard `json` module.
+    """
+    def dumps(self, data):
+        if self.compact:
+            return self.json.dumps(data, separators=COMPACT_SEPARATORS)
+        return self.json.dumps(data)
+
+    def loads(self, content):
+        return self.json.loads(content)
+
+
+class SimpleJSONBackend(JSONModuleBackend):
+    module_name = 'simplejson'
+
+
+class StdlibJSONBackend(JSONModuleBackend):
+    module_name = 'json'
+
+
+class UJSONBackend(BaseJSONBackend):
+    """
+    Requires the `ujson` package. Output is always compact.
+    """
+    supports_verbose = False
+    module_name = 'ujson'
+
+    def dumps(self, data):
+        return self.json.dumps(data, escape_forward_slashes=False)
+
+    def loads(self, content):
+        return self.json.loads(content)
+
+
+class OrjsonBackend(BaseJSONBackend):
+    """
+    Requires the `orjson` package. Output is always compact.
+    """
+    supports_verbose = False
+    module_name = 'orjson'
+
+    def dumps(self, data):
+        return self.json.dumps(data, option=self.json.OPT_NON_STR_KEYS)
+
+    def loads(self, content):
+        return self.json.loads(content)
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImproperlyConfigured(
+            'The %s JSON backend requires the `%s` package.' % (name, name)
+        )
@@ -0,0 +1,58 @@
+"""
+Builds the script and stylesheet bundles of the Swagger UI, served with
+the `USE_BUNDLE` setting.
+"""
+import json
+import os
+
+from django.core.management.base import BaseCommand
+
+from ...artifacts import write
+from ...bundle import MANIFEST_NAME, build_bundle, get_static_directory
+
+
+class Command(BaseCommand):
+    help = 'Bundles the scripts and stylesheets of the Swagger UI.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output', nargs='?',
+            help='Static files directory to write to. Defaults to the '
+                 'static files of rest_framework_swagger.'
+        )
+
+    def handle(self, *args, **options):
+        directory = options['output'] or get_static_directory()
+        for name in write_bundle(directory):
+            self.stdout.write('Wrote %s' % os.path.join(directory, name))
+
+
+def write_bundle(directory):
+    """
+    Writes the bundles and their manifest, and removes the bundles of the
+    previous manifest. Returns the names of the files written.
+    """
+    previous = read_manifest(directory)
+    names = []
+    for name, content in build_bundle():
+        path = os.path.join(directory, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        write(os.path.dirname(path), os.path.basename(path), content)
+        names.append(name)
+
+    for name in previous.values():
+        if name not in names:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+    return names
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
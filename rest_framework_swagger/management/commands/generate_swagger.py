@@ -0,0 +1,170 @@
+"""
+Writes the OpenAPI specification and the Swagger UI to static artifacts,
+served by `rest_framework_swagger.artifacts.ArtifactView`.
+"""
+import hashlib
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import Http404
+from django.template.loader import render_to_string
+from django.utils.encoding import force_bytes, force_text
+from django.utils.module_loading import import_string
+try:
+    from django.urls import resolve
+except ImportError:  # pragma: no cover
+    from django.core.urlresolvers import resolve
+from rest_framework.schemas import SchemaGenerator
+
+from ... import settings
+from ...artifacts import INDEX_NAME, MANIFEST_NAME, write
+from ...bundle import get_bundle
+from ...compression import compress, get_available_encodings
+from ...renderers import (
+    OpenAPIRenderer, SwaggerUIRenderer, get_json_backend
+)
+from ...warmup import get_request
+
+
+EXTENSIONS = {
+    'br': '.br',
+    'gzip': '.gz',
+}
+
+
+class Command(BaseCommand):
+    help = 'Writes the OpenAPI specification and the Swagger UI to files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output', nargs='?',
+            help='Directory to write to. Defaults to ARTIFACTS_DIR.'
+        )
+        parser.add_argument(
+            '--url',
+            help='Url of the schema view to take the schema from.'
+        )
+        parser.add_argument(
+            '--generator',
+            help='Import path of the schema generator class to use.'
+        )
+        parser.add_argument(
+            '--title',
+            help='Title of the schema generated from the ROOT_URLCONF.'
+        )
+        parser.add_argument(
+            '--host',
+            help='Host of the API. Defaults to the host serving the files.'
+        )
+
+    def handle(self, *args, **options):
+        directory = options['output'] or \
+            settings.swagger_settings.ARTIFACTS_DIR
+        if not directory:
+            raise CommandError(
+                'Give an output directory or set ARTIFACTS_DIR.'
+            )
+
+        document = self.get_document(options)
+        if document is None:
+            raise CommandError('The schema is empty.')
+
+        for name in write_artifacts(document, directory, options['host']):
+            self.stdout.write('Wrote %s' % os.path.join(directory, name))
+
+    def get_document(self, options):
+        if options['url']:
+            try:
+                match = resolve(options['url'])
+            except Http404:
+                raise CommandError('No view at %s.' % options['url'])
+            response = match.func(
+                get_request(options['url']),
+                *match.args,
+                **match.kwargs
+            )
+            if response.status_code != 200:
+                raise CommandError('%s responded with status %s.' % (
+                    options['url'], response.status_code
+                ))
+            return response.data
+
+        if options['generator']:
+            generator = import_string(options['generator'])()
+        else:
+            generator = SchemaGenerator(title=options['title'])
+        return generator.get_schema()
+
+
+def write_artifacts(document, directory, host=None):
+    """
+    Writes the specification of the document, under a name hashed from
+    its content, with its compressed variants, the UI and the manifest.
+    Returns the names of the files written.
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    content = render_specification(document, host)
+    digest = hashlib.sha1(content).hexdigest()
+    name = 'openapi.%s.json' % digest[:12]
+    write(directory, name, content)
+    names = [name]
+
+    encodings = []
+    for encoding in get_available_encodings():
+        variant = name + EXTENSIONS[encoding]
+        write(directory, variant, compress(content, encoding))
+        encodings.append([encoding, variant])
+        names.append(variant)
+
+    write(directory, INDEX_NAME, force_bytes(render_index(name)))
+    names.append(INDEX_NAME)
+
+    manifest = {
+        'spec': {
+            'name': name,
+            'etag': '"%s"' % digest,
+            'encodings': encodings,
+        },
+    }
+    write(directory, MANIFEST_NAME, force_bytes(json.dumps(manifest)))
+    names.append(MANIFEST_NAME)
+    return names
+
+
+def render_specification(document, host=None):
+    """
+    Renders the specification. Unless a host is given, or set by the
+    schema, the specification has none, so that the UI uses the host
+    serving it.
+    """
+    renderer = OpenAPIRenderer()
+    data = renderer.get_openapi_specification(document)
+    if host:
+        data['host'] = host
+    has_host = bool(data.get('host'))
+    renderer.add_customizations(data, {'request': get_request('/')})
+    if not has_host:
+        data.pop('host', None)
+    renderer.minify_specification(data)
+    return renderer.dump(data)
+
+
+def render_index(spec_name):
+    """
+    Renders the UI without session authentication, loading the
+    specification from its hashed name.
+    """
+    ui_settings = SwaggerUIRenderer().get_ui_settings()
+    ui_settings['url'] = spec_name
+    # The artifacts hold the whole specification.
+    ui_settings.pop('splitSpec', None)
+    context = {
+        'USE_SESSION_AUTH': False,
+        'drs_settings': force_text(get_json_backend().dumps(ui_settings)),
+    }
+    if settings.swagger_settings.USE_BUNDLE:
+        context['bundle'] = get_bundle()
+    return render_to_string('rest_framework_swagger/index.html', context)
@@ -0,0 +1,104 @@
+"""
+Drops the members of an OpenAPI specification which clients don't need,
+for the `MINIFY` setting: empty members, and members set to the default
+value given by the OpenAPI specification.
+"""
+from django.utils.six import string_types
+
+
+# The members kept even when empty: those required by the OpenAPI
+# specification, such as the `responses` of an operation, and those for
+# which emptiness has a meaning. An empty `security` disables security,
+# and an empty schema accepts any value.
+KEPT_MEMBERS = frozenset(['swagger', 'info', 'title', 'version', 'paths',
+                          'name', 'in', 'responses', 'security', 'schema',
+                          'items'])
+# The members whose value is the default given by the OpenAPI
+# specification when they are left out.
+DEFAULT_MEMBERS = {
+    'required': False,
+    'deprecated': False,
+    'readOnly': False,
+    'allowEmptyValue': False,
+    'uniqueItems': False,
+    'exclusiveMaximum': False,
+    'exclusiveMinimum': False,
+    'collectionFormat': 'csv',
+}
+# The members holding values rather than specification objects.
+VALUE_MEMBERS = frozenset(['default', 'example', 'examples', 'enum'])
+# The members set from settings, which are shared by every specification
+# and must not be modified.
+SHARED_MEMBERS = frozenset(['securityDefinitions'])
+SKIPPED_MEMBERS = VALUE_MEMBERS | SHARED_MEMBERS
+# The members mapping names to objects, whose entries are kept even when
+# empty.
+NAMED_MEMBERS = frozenset(['definitions', 'properties', 'responses',
+                           'parameters', 'headers'])
+
+
+def minify(spec, strip_descriptions=False):
+    """
+    Drops, in place and in a single pass, the empty and default members of
+    `spec`, and every description if `strip_descriptions` is set.
+    """
+    _minify_object(spec, strip_descriptions)
+
+
+def minify_path_item(path_item, strip_descriptions=False):
+    """
+    Minifies, in place, a Path Item object generated apart from the paths
+    object of its specification.
+    """
+    _minify_named(path_item, strip_descriptions)
+
+
+def _minify_object(data, strip_descriptions):
+    for key, value in list(data.items()):
+        if key in SKIPPED_MEMBERS or key[:2] == 'x-':
+            continue
+        if strip_descriptions and key == 'description':
+            del data[key]
+            continue
+
+        if isinstance(value, dict):
+            if key in NAMED_MEMBERS:
+                _minify_named(value, strip_descriptions)
+            elif key == 'paths':
+                # Path items map methods to operations, which are kept
+                # even when empty.
+                for path_item in value.values():
+                    if isinstance(path_item, dict):
+                        _minify_named(path_item, strip_descriptions)
+            else:
+                _minify_object(value, strip_descriptions)
+        elif isinstance(value, list):
+            _minify_list(value, strip_descriptions)
+
+        if key not in KEPT_MEMBERS and _is_default(key, value):
+            del data[key]
+
+
+def _minify_named(data, strip_descriptions):
+    for value in data.values():
+        if isinstance(value, dict):
+            _minify_object(value, strip_descriptions)
+        elif isinstance(value, list):
+            _minify_list(value, strip_descriptions)
+
+
+def _minify_list(data, strip_descriptions):
+    for item in data:
+        if isinstance(item, dict):
+            _minify_object(item, strip_descriptions)
+        elif isinstance(item, list):
+            _minify_list(item, strip_descriptions)
+
+
+def _is_default(key, value):
+    if value:
+        return key == 'collectionFormat' and value == 'csv'
+    if value is None or isinstance(value, (string_types, list, dict)):
+        return True
+    # False equals 0, which isn't a default.
+    return value is False and DEFAULT_MEMBERS.get(key) is False
@@ -0,0 +1,13 @@
+"""
+The renderers of the Swagger UI page and of the OpenAPI specification.
+
+The dependencies only some requests need, such as `coreapi`, the
+`openapi_codec`, `simplejson` and the template shortcuts, are imported on
+first use, so that importing the urlconf stays cheap for every worker.
+"""
+from .cache_control import VERSION_PARAM, add_cache_control
+from .openapi import (
+    HOST_PLACEHOLDER, EmbeddedSpecRenderer, OpenAPILiteRenderer,
+    OpenAPIRenderer, get_json_backend
+)
+from .ui import SwaggerUIRenderer
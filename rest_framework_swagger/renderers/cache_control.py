@@ -0,0 +1,22 @@
+"""
+The `Cache-Control` policies of the specification and of the UI page.
+"""
+from django.utils.cache import patch_cache_control
+
+
+# The query parameter carrying the version of the specification.
+VERSION_PARAM = 'v'
+
+
+def add_cache_control(response, policy):
+    """
+    Adds a `Cache-Control` policy, given as keyword arguments of
+    `patch_cache_control`, to the response. Private responses stay private.
+    """
+    if not policy:
+        return
+
+    policy = dict(policy)
+    if 'private' in response.get('Cache-Control', ''):
+        policy.pop('public', None)
+    patch_cache_control(response, **policy)
@@ -0,0 +1,500 @@
+"""
+The renderers of the OpenAPI specification, whole, split or reduced.
+"""
+import hashlib
+import json
+
+from django.utils import six
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.renderers import BaseRenderer
+from rest_framework import status
+
+from .. import __version__
+from ..cache import (
+    Spec, SpecTemplate, get_generation, shared_spec_cache, single_flight,
+    spec_cache
+)
+from ..compiler import (
+    generate_swagger_object, generate_swagger_root, iter_path_items
+)
+from ..compression import get_accepted_encoding, get_available_encodings
+from ..definitions import deduplicate_schemas
+from ..fragments import get_fragment, get_index, get_lite
+from ..minify import minify, minify_path_item
+from ..settings import swagger_settings
+from ..timing import add_server_timing, timed
+from .cache_control import VERSION_PARAM, add_cache_control
+
+
+# Stands in for the request host in cached specifications.
+HOST_PLACEHOLDER = '__rest_framework_swagger_host__'
+
+
+def force_bytes(value):
+    # Encodes text, leaving the bytes of the JSON backends as they are.
+    if isinstance(value, six.text_type):
+        return value.encode('utf-8')
+    return value
+
+
+def get_json_backend():
+    return swagger_settings.JSON_BACKEND(
+        compact=swagger_settings.COMPACT_JSON or swagger_settings.MINIFY
+    )
+
+
+class OpenAPIRenderer(BaseRenderer):
+    media_type = 'application/openapi+json'
+    charset = None
+    format = 'openapi'
+    stream_chunk_size = 64 * 1024
+    streamed_members = ('paths', 'definitions')
+    # With `MINIFY`, drop every description, as for machine-only views.
+    strip_descriptions = False
+    # Renderers which only render another part of the specification of
+    # their base class share its cache entries and version.
+    shares_spec_cache = False
+    # The spec may be requested before the response is rendered, as by the
+    # ConditionalSpecMixin, so it is kept, with its data, for the render.
+    _spec = _spec_data = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if renderer_context['response'].status_code != status.HTTP_200_OK:
+            return self.dump(data)
+
+        request = renderer_context['request']
+        response = renderer_context['response']
+        spec = self.get_spec(data, renderer_context)
+        encoding = self.get_content_encoding(spec, request)
+        self.set_headers(spec, response, encoding)
+        self.set_cache_control(response, data, renderer_context)
+        add_server_timing(request, response)
+        return spec.get_content(encoding)
+
+    def get_spec(self, data, renderer_context):
+        """
+        Returns the rendered specification as a `Spec`, from the spec cache
+        when it is enabled.
+        """
+        if self._spec is not None and self._spec_data is data:
+            return self._spec
+
+        if not swagger_settings.SPEC_CACHE:
+            spec = self.create_spec(data, renderer_context)
+        else:
+            spec = self.get_cached_spec(
+                data,
+                renderer_context,
+                lambda: self.create_spec_template(data, renderer_context)
+            )
+            if isinstance(spec, SpecTemplate):
+                spec = self.render_template(spec, data, renderer_context)
+
+        self._spec, self._spec_data = spec, data
+        return spec
+
+    def get_cached_spec(self, data, renderer_context, create, variant=()):
+        """
+        Returns the spec cache entry of the document, or of a `variant` of
+        it, from the shared cache or from `create` when it is missing.
+        Concurrent misses of the same entry share a single call of `create`.
+        """
+        key = self.get_cache_key(data, renderer_context) + variant
+        spec = spec_cache.get(key)
+        if spec is not None:
+            return spec
+
+        return single_flight.do(
+            ('spec',) + key,
+            lambda: self.create_cached_spec(
+                data, renderer_context, create, variant
+            )
+        )
+
+    def create_cached_spec(self, data, renderer_context, create, variant):
+        # The entry may have been stored since the spec cache was missed.
+        key = self.get_cache_key(data, renderer_context) + variant
+        spec = spec_cache.get(key)
+        if spec is not None:
+            return spec
+
+        if shared_spec_cache.enabled:
+            shared_key = self.get_cache_key(
+                data, renderer_context, shared=True
+            )
+            spec = shared_spec_cache.get_or_set(shared_key + variant, create)
+        else:
+            spec = create()
+        spec_cache.set(key, spec)
+        return spec
+
+    def get_encodings(self):
+        if swagger_settings.SPEC_COMPRESSION:
+            return get_available_encodings()
+        return []
+
+    def create_spec(self, data, renderer_context):
+        return Spec(
+            self.render_specification(data, renderer_context),
+            self.get_encodings()
+        )
+
+    def create_spec_template(self, data, renderer_context):
+        """
+        Renders the specification once for every host: returns a
+        `SpecTemplate` split where the request host goes, or a `Spec` when
+        the schema sets its own host and for tag fragments, which have
+        none.
+        """
+        request = renderer_context['request']
+        part = self.get_part(renderer_context)
+        with timed(request, 'specification'):
+            data = self.get_openapi_specification(data)
+        if data.get('host') or part[:1] == ('tag',):
+            with timed(request, 'customizations'):
+                self.add_customizations(data, renderer_context)
+                data = self.split_specification(data, renderer_context)
+                self.minify_specification(data)
+            with timed(request, 'json'):
+                return Spec(self.dump(data), self.get_encodings())
+
+        with timed(request, 'customizations'):
+            self.add_customizations(data, renderer_context)
+            data['host'] = HOST_PLACEHOLDER
+            data = self.split_specification(data, renderer_context)
+            self.minify_specification(data)
+        with timed(request, 'json'):
+            content = self.dump(data)
+
+        parts = content.split(self.dump(HOST_PLACEHOLDER))
+        assert len(parts) == 2, (
+            'The host placeholder %r must appear once in the specification.'
+            % HOST_PLACEHOLDER
+        )
+        return SpecTemplate(*parts)
+
+    def render_template(self, template, data, renderer_context):
+        """
+        Splices the request host into a cached `SpecTemplate`.
+        """
+        host = self.dump(self.get_host(renderer_context))
+        encodings = self.get_encodings()
+        if not encodings:
+            return template.render(host)
+
+        # Compressed variants can't be spliced, so they are cached per host.
+        return self.get_cached_spec(
+            data,
+            renderer_context,
+            lambda: template.render(host, encodings),
+            (host,)
+        )
+
+    def get_etag(self, data, renderer_context):
+        """
+        Returns the strong ETag of the rendered specification.
+        """
+        return self.get_spec(data, renderer_context).etag
+
+    def get_content_encoding(self, spec, request):
+        """
+        Returns the pre-compressed variant of the spec accepted by the
+        client, or None to send the spec unencoded.
+        """
+        if not spec.encodings:
+            return None
+
+        return get_accepted_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING'),
+            spec.encodings
+        )
+
+    def set_headers(self, spec, response, encoding=None):
+        self.set_validators(spec, response, encoding)
+        if encoding is not None:
+            response['Content-Encoding'] = encoding
+
+    def set_validators(self, spec, response, encoding=None):
+        response['ETag'] = spec.get_etag(encoding)
+        response['Last-Modified'] = http_date(spec.last_modified)
+        if spec.encodings:
+            patch_vary_headers(response, ('Accept-Encoding',))
+
+    def set_cache_control(self, response, data, renderer_context):
+        """
+        Adds the `SPEC_CACHE_CONTROL` policy to the response or, when the
+        request carries the current version of the specification,
+        `VERSIONED_SPEC_CACHE_CONTROL`.
+        """
+        policy = swagger_settings.SPEC_CACHE_CONTROL
+        if swagger_settings.VERSIONED_SPEC_URL:
+            version = renderer_context['request'].GET.get(VERSION_PARAM)
+            if version == self.get_version(data, renderer_context):
+                policy = swagger_settings.VERSIONED_SPEC_CACHE_CONTROL
+        add_cache_control(response, policy)
+
+    def get_version(self, data, renderer_context):
+        """
+        Returns the version of the specification, which changes with the
+        document, the renderer and settings applied to it and the version of
+        the package rendering it. Every part of the specification has the
+        version of the whole.
+        """
+        key = self.get_cache_key(data, renderer_context, shared=True)
+        key = (__version__,) + key[len(self.get_part(renderer_context)):]
+        return hashlib.sha1(force_bytes(repr(key))).hexdigest()[:12]
+
+    def render_specification(self, data, renderer_context):
+        request = renderer_context['request']
+        with timed(request, 'specification'):
+            data = self.get_openapi_specification(data)
+        with timed(request, 'customizations'):
+            self.add_customizations(data, renderer_context)
+            data = self.split_specification(data, renderer_context)
+            self.minify_specification(data)
+        with timed(request, 'json'):
+            return self.dump(data)
+
+    def get_cache_key(self, data, renderer_context, shared=False):
+        """
+        Returns the key identifying the rendered specification in the
+        spec cache: the document and any settings applied to the
+        specification, and the part of it requested in split mode. The
+        request host is spliced in on each request.
+
+        The document is identified by its generation, so a document
+        generated anew for each request is rendered each time. In the keys
+        of the shared cache and of versions, it is identified by its
+        fingerprint, the same in every process, which costs about as much
+        as encoding it once.
+        """
+        from ..fingerprint import get_document_fingerprint
+
+        return self.get_part(renderer_context) + (
+            self.get_cache_name(),
+            get_document_fingerprint(data) if shared else get_generation(data),
+            json.dumps(swagger_settings.SECURITY_DEFINITIONS, sort_keys=True),
+            swagger_settings.USE_OPENAPI_CODEC,
+            swagger_settings.SPEC_COMPRESSION,
+            swagger_settings.JSON_BACKEND,
+            swagger_settings.COMPACT_JSON,
+            swagger_settings.DEDUPLICATE_SCHEMAS,
+            swagger_settings.MINIFY,
+            self.strip_descriptions,
+        )
+
+    def get_cache_name(self):
+        """
+        Returns the dotted path of the renderer class, or of the nearest
+        base class for renderers which share its spec cache entries, so
+        that renderers customizing the specification don't share them.
+        """
+        cls = next(
+            cls for cls in type(self).__mro__
+            if not cls.__dict__.get('shares_spec_cache', False)
+        )
+        return '%s.%s' % (cls.__module__, cls.__name__)
+
+    def dump(self, data):
+        return force_bytes(get_json_backend().dumps(data))
+
+    def stream(self, data, renderer_context):
+        """
+        Renders the specification as an iterator of byte chunks of about
+        `stream_chunk_size`, without holding its whole encoding in memory.
+
+        The path items are compiled from the document one at a time, as
+        they are encoded, so that neither the whole specification nor its
+        encoding is held in memory. Parts of the specification, schemas
+        deduplicated with `DEDUPLICATE_SCHEMAS` and specifications encoded
+        by the OpenAPI codec need the whole specification: it is compiled
+        first.
+        """
+        if (self.get_part(renderer_context) or
+                swagger_settings.DEDUPLICATE_SCHEMAS or
+                swagger_settings.USE_OPENAPI_CODEC):
+            data = self.get_openapi_specification(data)
+            self.add_customizations(data, renderer_context)
+            data = self.split_specification(data, renderer_context)
+            self.minify_specification(data)
+            encoded = self.iterdump(data)
+        else:
+            root = self.get_openapi_root(data)
+            self.add_customizations(root, renderer_context)
+            self.minify_specification(root)
+            encoded = self.iterdump(
+                root, {'paths': self.iter_path_items(data)}
+            )
+
+        chunks, size = [], 0
+        for chunk in encoded:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.stream_chunk_size:
+                yield b''.join(chunks)
+                chunks, size = [], 0
+
+        if chunks:
+            yield b''.join(chunks)
+
+    def iterdump(self, data, members=None):
+        """
+        Encodes the specification piece by piece, giving the same output
+        as `dump`. Each entry of the `streamed_members` is encoded on its
+        own. `members` maps members of the specification to iterators of
+        their `(key, value)` entries, encoded in their place.
+        """
+        members = members or {}
+        backend = get_json_backend()
+        item_separator = force_bytes(backend.item_separator)
+        key_separator = force_bytes(backend.key_separator)
+
+        def dump(value):
+            return force_bytes(backend.dumps(value))
+
+        yield b'{'
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                yield item_separator
+            yield dump(key) + key_separator
+            if key in members:
+                entries = members[key]
+            elif key in self.streamed_members and isinstance(value, dict):
+                entries = value.items()
+            else:
+                yield dump(value)
+                continue
+
+            yield b'{'
+            for member_index, member in enumerate(entries):
+                if member_index:
+                    yield item_separator
+                yield dump(member[0]) + key_separator + dump(member[1])
+            yield b'}'
+        yield b'}'
+
+    def get_openapi_specification(self, data):
+        """
+        Converts data into OpenAPI specification.
+        """
+        import coreapi
+
+        assert isinstance(data, coreapi.Document), (
+            'Expected a coreapi.Document, but received %s instead.' %
+            type(data)
+        )
+        if swagger_settings.USE_OPENAPI_CODEC:
+            from openapi_codec import OpenAPICodec
+
+            codec = OpenAPICodec()
+            return get_json_backend().loads(codec.dump(data))
+
+        return generate_swagger_object(data)
+
+    def get_openapi_root(self, data):
+        """
+        Converts data into the root of the OpenAPI specification, with an
+        empty paths object.
+        """
+        import coreapi
+
+        assert isinstance(data, coreapi.Document), (
+            'Expected a coreapi.Document, but received %s instead.' %
+            type(data)
+        )
+        return generate_swagger_root(data)
+
+    def iter_path_items(self, data):
+        """
+        Converts data into the path items of the OpenAPI specification, one
+        at a time, minified with `MINIFY`.
+        """
+        for url, path_item in iter_path_items(data):
+            if swagger_settings.MINIFY:
+                minify_path_item(path_item, self.strip_descriptions)
+            yield url, path_item
+
+    def add_customizations(self, data, renderer_context):
+        """
+        Adds settings, overrides, etc. to the specification.
+        """
+        self.add_security_definitions(data)
+        if swagger_settings.DEDUPLICATE_SCHEMAS:
+            deduplicate_schemas(data)
+        if not data.get('host'):
+            data['host'] = self.get_host(renderer_context)
+
+    def get_part(self, renderer_context):
+        """
+        Returns the part of the specification requested when `SPEC_SPLIT`
+        is enabled: `('index',)` for `?index`, `('tag', name)` for
+        `?tag=name`, or an empty tuple for the whole specification.
+        """
+        if not swagger_settings.SPEC_SPLIT:
+            return ()
+
+        params = renderer_context['request'].GET
+        if 'tag' in params:
+            return ('tag', params['tag'])
+        if 'index' in params:
+            return ('index',)
+        return ()
+
+    def split_specification(self, data, renderer_context):
+        """
+        Returns the part of the customized specification requested.
+        """
+        part = self.get_part(renderer_context)
+        if not part:
+            return data
+        if part[0] == 'index':
+            return get_index(data)
+        return get_fragment(data, part[1])
+
+    def minify_specification(self, data):
+        """
+        Drops the empty and default members of the specification, in
+        place, when `MINIFY` is enabled.
+        """
+        if swagger_settings.MINIFY:
+            minify(data, self.strip_descriptions)
+
+    def add_security_definitions(self, data):
+        if not swagger_settings.SECURITY_DEFINITIONS:
+            return
+
+        data['securityDefinitions'] = swagger_settings.SECURITY_DEFINITIONS
+
+    def get_host(self, renderer_context):
+        return renderer_context['request'].get_host()
+
+
+class OpenAPILiteRenderer(OpenAPIRenderer):
+    """
+    Renders the paths, methods and summaries of the specification, for
+    clients which only list the operations. It is cached next to the
+    whole specification, under its own key, and compiled from the document
+    on a miss: the whole specification is only cached encoded.
+    """
+    format = 'openapi-lite'
+    shares_spec_cache = True
+
+    def get_part(self, renderer_context):
+        return ('lite',)
+
+    def split_specification(self, data, renderer_context):
+        return get_lite(data)
+
+
+class EmbeddedSpecRenderer(OpenAPIRenderer):
+    """
+    Renders the specification embedded in the Swagger UI page with
+    `EMBED_SPEC`: whole, or its index when `SPEC_SPLIT` is enabled. It
+    shares the spec cache entries of the `OpenAPIRenderer`.
+    """
+    shares_spec_cache = True
+    def get_part(self, renderer_context):
+        if swagger_settings.SPEC_SPLIT:
+            return ('index',)
+        return ()
@@ -0,0 +1,146 @@
+"""
+The renderer of the Swagger UI page.
+"""
+from django.utils.encoding import force_text
+from django.utils.safestring import mark_safe
+from rest_framework.renderers import BaseRenderer
+from rest_framework import status
+
+from ..cache import ui_cache
+from ..settings import swagger_settings
+from ..timing import add_server_timing, timed
+from .cache_control import add_cache_control
+from .openapi import EmbeddedSpecRenderer, get_json_backend
+
+
+class SwaggerUIRenderer(BaseRenderer):
+    media_type = 'text/html'
+    format = 'swagger'
+    template = 'rest_framework_swagger/index.html'
+    charset = 'utf-8'
+    spec_renderer_class = EmbeddedSpecRenderer
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        request = renderer_context['request']
+        fields = self.get_spec_fields(data, renderer_context)
+        with timed(request, 'template'):
+            if swagger_settings.UI_CACHE:
+                content = self.render_shell(request, fields)
+            else:
+                from django.shortcuts import render
+
+                self.set_context(renderer_context)
+                renderer_context.update(fields)
+                content = render(request, self.template, renderer_context)
+        if 'response' in renderer_context:
+            response = renderer_context['response']
+            add_cache_control(response, swagger_settings.UI_CACHE_CONTROL)
+            add_server_timing(request, response)
+        return content
+
+    def render_shell(self, request, fields=None):
+        """
+        Renders the page from the pre-rendered page of the template, filled
+        in with the CSRF token, user and path of the request, and the
+        fields of the specification.
+        """
+        from ..shell import is_authenticated, render_shell
+
+        fields = fields or {}
+        authenticated = is_authenticated(request.user)
+        names = tuple(sorted(fields))
+        shell = ui_cache.get(
+            ('shell', self.template, authenticated, names),
+            lambda: render_shell(
+                self.template,
+                self.get_context(),
+                authenticated,
+                names
+            )
+        )
+        return shell.render(request, **fields)
+
+    def get_spec_fields(self, data, renderer_context):
+        """
+        Returns the context of the page which depends on the specification:
+        the embedded `spec`, with `EMBED_SPEC`, and the `spec_version` of
+        its url, with `VERSIONED_SPEC_URL`.
+        """
+        import coreapi
+
+        fields = {}
+        response = renderer_context.get('response')
+        if not isinstance(data, coreapi.Document) or \
+                (response is not None and
+                 response.status_code != status.HTTP_200_OK):
+            return fields
+
+        if swagger_settings.EMBED_SPEC:
+            fields['spec'] = self.get_embedded_spec(data, renderer_context)
+        if swagger_settings.VERSIONED_SPEC_URL:
+            fields['spec_version'] = self.spec_renderer_class().get_version(
+                data, renderer_context
+            )
+        return fields
+
+    def get_embedded_spec(self, data, renderer_context):
+        """
+        Returns the specification to embed in the page, as JSON safe to
+        include in a `<script>` element.
+        """
+        renderer = self.spec_renderer_class()
+        content = renderer.get_spec(data, renderer_context).get_content()
+        # `<` only appears within JSON strings, where it can be escaped, so
+        # that no `</script>` ends the element early.
+        return mark_safe(
+            force_text(content).replace(u'<', u'\\u003c')
+        )
+
+    def set_context(self, renderer_context):
+        renderer_context.update(self.get_context())
+
+    def get_context(self):
+        """
+        Returns the template context which is the same for every request,
+        computed once until the settings change.
+        """
+        return ui_cache.get(('context', type(self)), self.create_context)
+
+    def create_context(self):
+        context = {'USE_SESSION_AUTH': swagger_settings.USE_SESSION_AUTH}
+        context.update(self.get_auth_urls())
+        context['drs_settings'] = force_text(
+            get_json_backend().dumps(self.get_ui_settings())
+        )
+        if swagger_settings.USE_BUNDLE:
+            from ..bundle import get_bundle
+
+            context['bundle'] = get_bundle()
+        return context
+
+    def get_auth_urls(self):
+        from django.shortcuts import resolve_url
+
+        urls = {}
+        if swagger_settings.LOGIN_URL is not None:
+            urls['LOGIN_URL'] = resolve_url(swagger_settings.LOGIN_URL)
+        if swagger_settings.LOGOUT_URL is not None:
+            urls['LOGOUT_URL'] = resolve_url(swagger_settings.LOGOUT_URL)
+
+        return urls
+
+    def get_ui_settings(self):
+        data = {
+            'apisSorter': swagger_settings.APIS_SORTER,
+            'docExpansion': swagger_settings.DOC_EXPANSION,
+            'jsonEditor': swagger_settings.JSON_EDITOR,
+            'operationsSorter': swagger_settings.OPERATIONS_SORTER,
+            'showRequestHeaders': swagger_settings.SHOW_REQUEST_HEADERS,
+            'supportedSubmitMethods': swagger_settings.SUPPORTED_SUBMIT_METHODS
+        }
+        if swagger_settings.VALIDATOR_URL != '':
+            data['validatorUrl'] = swagger_settings.VALIDATOR_URL
+        if swagger_settings.SPEC_SPLIT:
+            data['splitSpec'] = True
+
+        return data
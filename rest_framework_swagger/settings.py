@@ -25,9 +25,45 @@ DEFAULTS = {
         'patch'
     ],
     'VALIDATOR_URL': '',
+    'USE_OPENAPI_CODEC': False,
+    'SPEC_CACHE': False,
+    'SPEC_CACHE_MAX_ENTRIES': 16,
+    'SPEC_CACHE_MAX_BYTES': 64 * 1024 * 1024,
+    'SPEC_COMPRESSION': False,
+    'SPEC_STREAMING': False,
+    'SPEC_SPLIT': False,
+    'DEDUPLICATE_SCHEMAS': False,
+    'JSON_BACKEND': 'rest_framework_swagger.json_backends.SimpleJSONBackend',
+    'COMPACT_JSON': False,
+    'MINIFY': False,
+    'TIMING': False,
+    'SCHEMA_CACHE_TTL': None,
+    'SCHEMA_CACHE_MAX_ENTRIES': 64,
+    'STALE_WHILE_REVALIDATE': False,
+    'CACHE': None,
+    'CACHE_TIMEOUT': 24 * 60 * 60,
+    'CACHE_LEASE_TIMEOUT': 30,
+    'WARMUP': [],
+    'WARMUP_WORKERS': 1,
+    'WARMUP_EXECUTOR': 'thread',
+    'WARMUP_RAISE': False,
+    'ARTIFACTS_DIR': None,
+    'UI_CACHE': False,
+    'EMBED_SPEC': False,
+    'USE_BUNDLE': False,
+    'UI_CACHE_CONTROL': None,
+    'SPEC_CACHE_CONTROL': None,
+    'VERSIONED_SPEC_URL': False,
+    'VERSIONED_SPEC_CACHE_CONTROL': {
+        'public': True,
+        'max_age': 365 * 24 * 60 * 60,
+        'immutable': True,
+    },
 }
 
-IMPORT_STRINGS = []
+IMPORT_STRINGS = [
+    'JSON_BACKEND',
+]
 
 swagger_settings = APISettings(
     user_settings=getattr(settings, 'SWAGGER_SETTINGS', {}),
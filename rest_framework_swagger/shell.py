@@ -0,0 +1,92 @@
+"""
+The Swagger UI page, rendered once through the template engine and
+completed on each request, for the `UI_CACHE` setting.
+
+The page is rendered for a stand-in request whose path, user and CSRF
+token are placeholders; each request fills in its own, along with the
+embedded specification and its version.
+"""
+import re
+
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.utils.encoding import force_text, python_2_unicode_compatible
+from django.utils.html import escape
+
+
+PLACEHOLDER = '__rest_framework_swagger_%s__'
+FIELDS = ('csrf_token', 'user', 'path', 'spec', 'spec_version')
+FIELDS_RE = re.compile(PLACEHOLDER % '(%s)' % '|'.join(FIELDS))
+
+
+class Shell(object):
+    """
+    A rendered page, split around the placeholders of its per-request
+    fields.
+    """
+    def __init__(self, content):
+        # Literal text alternating with the names of the fields.
+        self.parts = FIELDS_RE.split(content)
+        self.fields = frozenset(self.parts[1::2])
+
+    def render(self, request, **values):
+        """
+        Fills in the fields from `request`, or from `values`, which are
+        inserted as they are.
+        """
+        for name in self.fields:
+            if name not in values:
+                values[name] = get_value(name, request)
+        parts = list(self.parts)
+        parts[1::2] = [values[name] for name in self.parts[1::2]]
+        return u''.join(parts)
+
+
+def get_value(name, request):
+    """
+    Returns the HTML of the field `name` for `request`.
+    """
+    if name == 'csrf_token':
+        return escape(get_token(request))
+    if name == 'user':
+        return escape(force_text(request.user))
+    if name == 'path':
+        return escape(request.path)
+    raise ValueError('No value for the field %r.' % name)
+
+
+def render_shell(template, context, authenticated, fields=()):
+    """
+    Renders `template`, with `context`, for a user who is or isn't
+    `authenticated`, and with the given `fields` of the specification.
+    """
+    request = HttpRequest()
+    request.path = PLACEHOLDER % 'path'
+    request.user = ShellUser(authenticated)
+    context = dict(
+        context,
+        request=request,
+        csrf_token=PLACEHOLDER % 'csrf_token'
+    )
+    for name in fields:
+        context[name] = PLACEHOLDER % name
+    return Shell(render_to_string(template, context, request=request))
+
+
+def is_authenticated(user):
+    # A method before Django 1.10.
+    authenticated = user.is_authenticated
+    if callable(authenticated):
+        authenticated = authenticated()
+    return bool(authenticated)
+
+
+@python_2_unicode_compatible
+class ShellUser(object):
+    def __init__(self, authenticated):
+        self.is_authenticated = authenticated
+        self.is_anonymous = not authenticated
+
+    def __str__(self):
+        return PLACEHOLDER % 'user'
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+
+# Sent for each timed stage when the `TIMING` setting is enabled, with the
+# arguments `stage`, `duration` (in seconds) and `request`.
+stage_timed = Signal()
+
+# Sent for each target warmed up at startup, with the arguments `target`,
+# `duration` (in seconds) and `error`, the exception raised, if any.
+warmed_up = Signal()
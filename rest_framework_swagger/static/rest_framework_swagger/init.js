@@ -26,6 +26,9 @@ $(function () {
         window.SwaggerTranslator.translate();
       }
       addCsrfTokenHeaders();
+      if (splitSpec) {
+        splitSpec.onComplete();
+      }
     },
     onFailure: function(data) {
       log("Unable to Load SwaggerUI");
@@ -37,9 +40,110 @@ $(function () {
   };
   $.extend(settings, JSON.parse($('#drs-settings').html()));
 
-  window.swaggerUi = new SwaggerUi(settings);
+  // The version of the specification, with VERSIONED_SPEC_URL, so that
+  // it can be cached until it changes.
+  var specVersion = $('#' + settings.dom_id).attr('data-spec-version');
+  if (specVersion) {
+    settings.url += (settings.url.indexOf('?') < 0 ? '?' : '&') +
+      'v=' + encodeURIComponent(specVersion);
+  }
+
+  // The specification, or its index, embedded in the page with
+  // EMBED_SPEC, which saves fetching it.
+  var embeddedSpec = $('#drs-spec');
+  embeddedSpec = embeddedSpec.length ? JSON.parse(embeddedSpec.html()) : null;
+
+  var splitSpec = settings.splitSpec ? new SplitSpec(settings) : null;
+  if (splitSpec) {
+    splitSpec.load(embeddedSpec);
+  } else {
+    if (embeddedSpec) {
+      settings.spec = embeddedSpec;
+    }
+    window.swaggerUi = new SwaggerUi(settings);
+    window.swaggerUi.load();
+  }
 
-  window.swaggerUi.load();
+  // Loads the index of the operations, then the operations of each tag
+  // the first time it is expanded.
+  function SplitSpec(settings) {
+    var spec = null;
+    var loaded = {};
+    var expanded = null;
+
+    this.load = function(index) {
+      if (index) {
+        loadIndex(index);
+      } else {
+        $.getJSON(settings.url + '&index', loadIndex).fail(settings.onFailure);
+      }
+
+      $('#' + settings.dom_id).on(
+        'click',
+        '.toggleEndpointList, .expandResource, .collapseResource',
+        function() {
+          var id = $(this).closest('li.resource').attr('id');
+          loadTag(id.replace(/^resource_/, ''));
+        }
+      );
+    };
+
+    function loadIndex(index) {
+      spec = index;
+      settings.spec = spec;
+      window.swaggerUi = new SwaggerUi(settings);
+      window.swaggerUi.load();
+    }
+
+    this.onComplete = function() {
+      if (expanded !== null) {
+        Docs.expandEndpointListForResource(expanded);
+        expanded = null;
+      }
+    };
+
+    function loadTag(id) {
+      var tag = getTag(id);
+      if (tag === null || loaded[tag]) {
+        return;
+      }
+      loaded[tag] = true;
+
+      $.getJSON(
+        settings.url + '&tag=' + encodeURIComponent(tag),
+        function(fragment) {
+          $.each(fragment.paths, function(path, operations) {
+            $.extend(spec.paths[path], operations);
+          });
+          spec.definitions = $.extend(
+            spec.definitions || {}, fragment.definitions
+          );
+          // Render again, with the tag expanded.
+          expanded = id;
+          window.swaggerUi.setOption('spec', spec);
+          window.swaggerUi.load();
+        }
+      ).fail(function() {
+        loaded[tag] = false;
+        log('Unable to load the operations of ' + tag);
+      });
+    }
+
+    // Resources are identified by their tag, with spaces replaced.
+    function getTag(id) {
+      var tag = null;
+      $.each(spec.paths, function(path, operations) {
+        $.each(operations, function(method, operation) {
+          $.each(operation.tags || ['default'], function(i, name) {
+            if (name.replace(/\s/g, '_') === id) {
+              tag = name;
+            }
+          });
+        });
+      });
+      return tag;
+    }
+  }
 
   function addCsrfTokenHeaders() {
     var token = $('[name="csrfmiddlewaretoken"]')[0];
@@ -0,0 +1,69 @@
+"""
+Opt-in timing of the stages of rendering the documentation.
+
+When the `TIMING` setting is enabled, each stage is recorded on the
+request, reported through the `stage_timed` signal, and emitted by the
+renderers as a `Server-Timing` response header.
+"""
+from contextlib import contextmanager
+import time
+
+from . import settings
+from .signals import stage_timed
+
+
+TIMINGS_ATTRIBUTE = '_swagger_timings'
+
+
+@contextmanager
+def timed(request, stage):
+    """
+    Times the enclosed block as `stage` of the given request, if any.
+    """
+    if request is None or not settings.swagger_settings.TIMING:
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        record(request, stage, time.time() - start)
+
+
+def record(request, stage, duration):
+    get_timings(request).append((stage, duration))
+    stage_timed.send(
+        sender=None,
+        stage=stage,
+        duration=duration,
+        request=request
+    )
+
+
+def get_timings(request):
+    timings = getattr(request, TIMINGS_ATTRIBUTE, None)
+    if timings is None:
+        timings = []
+        setattr(request, TIMINGS_ATTRIBUTE, timings)
+    return timings
+
+
+def add_server_timing(request, response):
+    """
+    Adds the stages timed for the request to the `Server-Timing` header.
+    """
+    if not settings.swagger_settings.TIMING:
+        return
+
+    timings = getattr(request, TIMINGS_ATTRIBUTE, None)
+    if not timings:
+        return
+
+    metrics = [
+        '%s;dur=%.3f' % (stage, duration * 1000)
+        for stage, duration in timings
+    ]
+    if response.has_header('Server-Timing'):
+        metrics.insert(0, response['Server-Timing'])
+    response['Server-Timing'] = ', '.join(metrics)
@@ -0,0 +1,321 @@
+from importlib import import_module
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponseNotModified, StreamingHttpResponse
+from django.utils import six
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_http_date_safe
+from django.utils.module_loading import import_string
+from rest_framework import exceptions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cache import document_cache, set_generation, single_flight
+from .renderers import (
+    OpenAPILiteRenderer, OpenAPIRenderer, SwaggerUIRenderer
+)
+from .settings import swagger_settings
+from .timing import add_server_timing, timed
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_not_modified(request, spec, encoding=None):
+    """
+    Returns True when the conditional headers of the request match the
+    rendered specification, in the given content encoding.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        etags = [etag.strip() for etag in if_none_match.split(',')]
+        return '*' in etags or spec.get_etag(encoding) in etags
+
+    if_modified_since = parse_http_date_safe(
+        request.META.get('HTTP_IF_MODIFIED_SINCE', '')
+    )
+    if if_modified_since is not None:
+        return spec.last_modified <= if_modified_since
+
+    return False
+
+
+class ConditionalSpecMixin(object):
+    """
+    Answers conditional GET requests for the OpenAPI specification with
+    a `304 Not Modified`, before the response is rendered.
+
+    Combine with the `SPEC_CACHE` setting so that a matching request is
+    served from the cache without encoding the specification.
+    """
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super(ConditionalSpecMixin, self).finalize_response(
+            request, response, *args, **kwargs
+        )
+        renderer = getattr(response, 'accepted_renderer', None)
+        if (request.method not in ('GET', 'HEAD') or
+                response.status_code != status.HTTP_200_OK or
+                not isinstance(renderer, OpenAPIRenderer)):
+            return response
+        # A streamed specification is never encoded whole, so it has no
+        # validators to compare.
+        if isinstance(self, StreamingSpecMixin) and \
+                self.is_streamed(request, response):
+            return response
+
+        spec = renderer.get_spec(response.data, response.renderer_context)
+        encoding = renderer.get_content_encoding(spec, request)
+        if not is_not_modified(request, spec, encoding):
+            return response
+
+        not_modified = HttpResponseNotModified()
+        renderer.set_validators(spec, not_modified, encoding)
+        renderer.set_cache_control(
+            not_modified, response.data, response.renderer_context
+        )
+        add_server_timing(request, not_modified)
+        return not_modified
+
+
+class StreamingSpecMixin(object):
+    """
+    Streams the OpenAPI specification in chunks, through a
+    `StreamingHttpResponse`, when `SPEC_STREAMING` is enabled.
+
+    Streamed specifications are encoded on every request: they are not
+    stored in the spec cache and carry no validators, so the
+    `ConditionalSpecMixin` leaves them alone.
+    """
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super(StreamingSpecMixin, self).finalize_response(
+            request, response, *args, **kwargs
+        )
+        if not self.is_streamed(request, response):
+            return response
+
+        renderer = response.accepted_renderer
+        streaming = StreamingHttpResponse(
+            renderer.stream(response.data, response.renderer_context),
+            content_type=renderer.media_type
+        )
+        for header, value in response.items():
+            if header.lower() != 'content-type':
+                streaming[header] = value
+        renderer.set_cache_control(
+            streaming, response.data, response.renderer_context
+        )
+        add_server_timing(request, streaming)
+        return streaming
+
+    def is_streamed(self, request, response):
+        renderer = getattr(response, 'accepted_renderer', None)
+        return (swagger_settings.SPEC_STREAMING and
+                request.method == 'GET' and
+                response.status_code == status.HTTP_200_OK and
+                isinstance(renderer, OpenAPIRenderer))
+
+
+class SwaggerSchemaView(ConditionalSpecMixin, APIView):
+    """
+    Serves the Swagger UI and the OpenAPI specification of the API, whole
+    or, at `?format=openapi-lite`, reduced to its operation summaries.
+
+    The schema is generated on the first request and kept, in the document
+    cache, until the url patterns change, the settings are reloaded or
+    `SCHEMA_CACHE_TTL` seconds have passed. Concurrent requests for a
+    missing schema share a single generation and, with
+    `STALE_WHILE_REVALIDATE`, an expired schema is served while it is
+    generated again in a background thread.
+
+    By default the schema lists every endpoint of the API. Set
+    `filter_by_permissions` to list only the endpoints whose permission
+    checks pass for the requesting user: one schema is then kept for each
+    set of visible endpoints, shared by all the users who see it, and
+    responses are marked private.
+    """
+    renderer_classes = [
+        SwaggerUIRenderer, OpenAPIRenderer, OpenAPILiteRenderer
+    ]
+    exclude_from_schema = True
+    # A dotted path is imported on the first request, sparing the workers
+    # which never serve one the import of `rest_framework.schemas`.
+    generator_class = 'rest_framework.schemas.SchemaGenerator'
+    title = None
+    url = None
+    urlconf = None
+    patterns = None
+    schema_ttl = None
+    filter_by_permissions = False
+
+    def get(self, request):
+        schema = self.get_schema(request)
+        if schema is None:
+            raise exceptions.PermissionDenied()
+
+        return Response(schema)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super(SwaggerSchemaView, self).finalize_response(
+            request, response, *args, **kwargs
+        )
+        # Schemas filtered by permissions differ between users.
+        if self.filter_by_permissions:
+            patch_vary_headers(response, ('Authorization', 'Cookie'))
+            patch_cache_control(response, private=True)
+        return response
+
+    def get_schema(self, request):
+        """
+        Returns the memoized schema, generating it when it is missing or
+        stale.
+        """
+        patterns = self.get_patterns(request)
+        key = self.get_schema_cache_key(request)
+        generator = self.get_generator(patterns, key)
+        schema_request = None
+        if self.filter_by_permissions:
+            with timed(request, 'access'):
+                key += (self.get_access_fingerprint(generator, request),)
+            schema_request = request
+
+        schema, expired = document_cache.get_entry(key, patterns)
+        if schema is not None and not expired:
+            return schema
+        if schema is not None and swagger_settings.STALE_WHILE_REVALIDATE:
+            self.revalidate(key, patterns, generator, schema_request)
+            return schema
+
+        return single_flight.do(
+            ('schema',) + key,
+            lambda: self.refresh_schema(
+                key, patterns, generator, schema_request, request
+            )
+        )
+
+    def refresh_schema(self, key, patterns, generator, schema_request,
+                       request):
+        """
+        Generates the schema and stores it in the document cache.
+        """
+        # The schema may have been stored since the cache was missed.
+        schema = document_cache.get(key, patterns)
+        if schema is not None:
+            return schema
+
+        with timed(request, 'schema'):
+            schema = self.generate_schema(generator, schema_request)
+        if schema is not None:
+            # Specifications are keyed by the generation of the schema, so
+            # those rendered from the previous one are no longer served.
+            set_generation(schema)
+            document_cache.set(key, schema, patterns, self.get_ttl())
+
+        return schema
+
+    def revalidate(self, key, patterns, generator, schema_request):
+        """
+        Starts a background thread generating the schema again, unless one
+        is already running. Returns the thread, or None.
+
+        The request has been answered by the time the thread runs, so the
+        generation isn't timed.
+        """
+        flight_key = ('schema',) + key
+        if single_flight.in_flight(flight_key):
+            return None
+
+        def run():
+            try:
+                single_flight.do(
+                    flight_key,
+                    lambda: self.refresh_schema(
+                        key, patterns, generator, schema_request, None
+                    )
+                )
+            # Generating the schema runs the code of every view, and the
+            # thread has no caller to raise its errors to: they are logged.
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to revalidate the schema.')
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def generate_schema(self, generator, request=None):
+        return generator.get_schema(request=request)
+
+    def get_access_fingerprint(self, generator, request):
+        """
+        Returns a hashable value identifying the endpoints of the generator
+        whose permission checks pass for the request.
+
+        The endpoints are read from `SchemaGenerator.endpoints`, filled as
+        by REST framework 3.4 and 3.5: override this method for a generator
+        which lists its endpoints otherwise.
+        """
+        from .fingerprint import get_access_fingerprint
+
+        return get_access_fingerprint(generator, request)
+
+    def get_generator(self, patterns, key):
+        """
+        Returns the schema generator of the url patterns. It is kept with
+        the schemas, so that the patterns are only walked once.
+        """
+        key += ('generator',)
+        generator = document_cache.get(key, patterns)
+        if generator is None:
+            generator_class = self.generator_class
+            if isinstance(generator_class, six.string_types):
+                generator_class = import_string(generator_class)
+            generator = generator_class(
+                title=self.title,
+                url=self.url,
+                patterns=patterns
+            )
+            document_cache.set(key, generator, patterns)
+
+        return generator
+
+    def get_patterns(self, request):
+        """
+        Returns the url patterns documented by the schema: `patterns`, or
+        those of `urlconf`, the request's urlconf or the `ROOT_URLCONF`.
+        """
+        if self.patterns is not None:
+            return self.patterns
+
+        urlconf = self.get_urlconf(request)
+        if isinstance(urlconf, six.string_types):
+            urlconf = import_module(urlconf)
+        return getattr(urlconf, 'urlpatterns', urlconf)
+
+    def get_urlconf(self, request):
+        return self.urlconf or getattr(request, 'urlconf', None) or \
+            settings.ROOT_URLCONF
+
+    def get_schema_cache_key(self, request):
+        """
+        Returns the document cache key of the schema. The url patterns are
+        keyed by the urlconf they come from, so that the schema of reloaded
+        patterns replaces the previous one.
+        """
+        if self.patterns is not None:
+            source = id(self.patterns)
+        else:
+            urlconf = self.get_urlconf(request)
+            if not isinstance(urlconf, six.string_types):
+                urlconf = getattr(urlconf, '__name__', None) or id(urlconf)
+            source = urlconf
+        return (type(self), self.title, self.url, source)
+
+    def get_ttl(self):
+        if self.schema_ttl is not None:
+            return self.schema_ttl
+        return swagger_settings.SCHEMA_CACHE_TTL
@@ -0,0 +1,174 @@
+"""
+Generates and renders specifications ahead of the first request.
+
+Each target of the `WARMUP` setting is either the url of a schema view,
+which is requested, or the import path of a schema generator, whose schema
+is rendered by the `OpenAPIRenderer`. A url fills the caches which are
+enabled: the document cache of a `SwaggerSchemaView`, the `SPEC_CACHE` and
+the shared `CACHE`. A generator's schema is served by no view, so it only
+fills the shared `CACHE`.
+"""
+from collections import namedtuple
+import logging
+from multiprocessing.pool import Pool, ThreadPool
+import time
+
+from django.conf import settings as django_settings
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+
+try:
+    from django.urls import resolve
+except ImportError:  # pragma: no cover
+    from django.core.urlresolvers import resolve
+
+from . import settings
+from .renderers import OpenAPIRenderer
+from .signals import warmed_up
+
+
+logger = logging.getLogger(__name__)
+
+WarmupResult = namedtuple('WarmupResult', ['target', 'duration', 'error'])
+
+
+def warm_up(targets=None, workers=None, executor=None, raise_errors=None):
+    """
+    Warms up each target, on `workers` threads or processes, and returns a
+    `WarmupResult` for each one. Targets default to the `WARMUP` setting.
+
+    Every result is reported first. Then, if `raise_errors` is set, the
+    error of the first failing target is raised. It defaults to the
+    `WARMUP_RAISE` setting.
+    """
+    swagger_settings = settings.swagger_settings
+    if targets is None:
+        targets = swagger_settings.WARMUP
+    if workers is None:
+        workers = swagger_settings.WARMUP_WORKERS
+    if executor is None:
+        executor = swagger_settings.WARMUP_EXECUTOR
+    if raise_errors is None:
+        raise_errors = swagger_settings.WARMUP_RAISE
+
+    if workers <= 1 or len(targets) <= 1:
+        results = [warm_up_target(target) for target in targets]
+    else:
+        pool = get_pool(executor, min(workers, len(targets)))
+        try:
+            results = pool.map(warm_up_target, targets)
+        finally:
+            pool.close()
+            pool.join()
+
+    for result in results:
+        report(result)
+
+    if raise_errors:
+        for result in results:
+            if result.error is not None:
+                raise result.error
+
+    return results
+
+
+def get_pool(executor, workers):
+    if executor == 'thread':
+        return ThreadPool(workers)
+    if executor == 'process':
+        return Pool(workers)
+
+    raise ValueError('Unsupported warm-up executor: %s' % executor)
+
+
+def warm_up_target(target):
+    """
+    Warms up a url or a schema generator, returning a `WarmupResult`.
+    Errors are returned rather than raised.
+    """
+    start = time.time()
+    try:
+        if target.startswith('/'):
+            warm_up_url(target)
+        else:
+            warm_up_generator(target)
+    # Warming up runs the code of the views, which may raise anything: the
+    # error is reported with the other results rather than stopping them.
+    except Exception as e:  # pylint: disable=broad-except
+        return WarmupResult(target, time.time() - start, e)
+
+    return WarmupResult(target, time.time() - start, None)
+
+
+def warm_up_url(path):
+    match = resolve(path)
+    request = get_request(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise ValueError(
+            '%s responded with status %s.' % (path, response.status_code)
+        )
+
+
+def warm_up_generator(path):
+    generator = import_string(path)
+    if isinstance(generator, type):
+        generator = generator()
+
+    renderer_context = {
+        'request': get_request('/'),
+        'response': HttpResponse(),
+    }
+    OpenAPIRenderer().render(
+        generator.get_schema(),
+        renderer_context=renderer_context
+    )
+
+
+def get_request(path, host=None):
+    host = host or get_host()
+    request = RequestFactory().get(
+        path,
+        HTTP_ACCEPT=OpenAPIRenderer.media_type,
+        HTTP_HOST=host
+    )
+    # The request is built here, so its host needn't be validated against
+    # ALLOWED_HOSTS, which may accept none outside of a request.
+    request.get_host = lambda: host
+    return request
+
+
+def get_host():
+    """
+    Returns a host accepted by `ALLOWED_HOSTS`.
+    """
+    for host in django_settings.ALLOWED_HOSTS:
+        host = host.lstrip('.')
+        if host and host != '*':
+            return host
+    return 'localhost'
+
+
+def report(result):
+    if result.error is None:
+        logger.info(
+            'Warmed up %s in %.1f ms.',
+            result.target,
+            result.duration * 1000
+        )
+    else:
+        logger.error(
+            'Failed to warm up %s: %s',
+            result.target,
+            result.error
+        )
+
+    warmed_up.send(
+        sender=None,
+        target=result.target,
+        duration=result.duration,
+        error=result.error
+    )
@@ -47,7 +47,12 @@ setup(
         'openapi-codec-devin',
         'simplejson'
     ],
-    packages=['rest_framework_swagger'],
+    packages=[
+        'rest_framework_swagger',
+        'rest_framework_swagger.management',
+        'rest_framework_swagger.management.commands',
+        'rest_framework_swagger.renderers',
+    ],
     include_package_data=True,
     license='FreeBSD License',
     description='Swagger UI for Django REST Framework 3.4+',
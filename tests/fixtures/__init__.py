@@ -0,0 +1,79 @@
+# coding: utf-8
+from __future__ import unicode_literals
+import os
+
+import coreapi
+import simplejson as json
+
+
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_document(url='https://api.example.com/v1/'):
+    """
+    A coreapi.Document exercising every part of the OpenAPI compiler.
+    """
+    user_schema = {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'username': {'type': 'string'},
+        }
+    }
+    return coreapi.Document(
+        url=url,
+        title='Pastebin API',
+        tags=[
+            {'name': 'snippets', 'description': 'All snippets'},
+            {'name': 'users', 'description': '所有用户'},
+        ],
+        definitions={'User': user_schema},
+        content={
+            'snippets': {
+                'list': coreapi.Link(
+                    url='/snippets/',
+                    action='get',
+                    summary='List snippets',
+                    description='Returns every snippet.',
+                    fields=[
+                        coreapi.Field('page', False, 'query', 'integer',
+                                      'Page number'),
+                    ],
+                    responses={
+                        200: {'description': 'OK'},
+                        403: {'description': '权限不够'},
+                    }
+                ),
+                'create': coreapi.Link(
+                    url='/snippets/',
+                    action='post',
+                    fields=[
+                        coreapi.Field('code', True, 'form', 'string'),
+                        'title',
+                    ],
+                    responses={201: {'description': 'Created'}}
+                ),
+            },
+            'users': {
+                'read': coreapi.Link(
+                    url='/users/{pk}/',
+                    action='get',
+                    fields=(coreapi.Field('pk', True, 'path'),),
+                    responses={
+                        '200': {
+                            'description': 'OK',
+                            'schema': {'$ref': '#/definitions/User'},
+                            'examples': ({'id': 1, 'username': 'amy'},)
+                        }
+                    }
+                ),
+            },
+            'version': '1.0',
+            'root': coreapi.Link(url='/', action='get'),
+        }
+    )
+
+
+def load_json(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return json.loads(f.read().decode('utf-8'))
@@ -0,0 +1,39 @@
+from rest_framework_swagger.cache import SpecCache
+from rest_framework_swagger.json_backends import SimpleJSONBackend
+
+from ..compat.mock import patch
+
+
+class OpenAPISettingsMixin(object):
+    """
+    Patches the settings of the OpenAPI renderers, with every setting they
+    read, and gives them an empty spec cache.
+    """
+    def patch_settings(self, **settings):
+        defaults = {
+            'SPEC_CACHE': True,
+            'SPEC_SPLIT': False,
+            'SECURITY_DEFINITIONS': None,
+            'USE_OPENAPI_CODEC': False,
+            'SPEC_COMPRESSION': False,
+            'JSON_BACKEND': SimpleJSONBackend,
+            'COMPACT_JSON': False,
+            'DEDUPLICATE_SCHEMAS': False,
+            'MINIFY': False,
+            'SPEC_CACHE_CONTROL': None,
+            'VERSIONED_SPEC_URL': False,
+        }
+        defaults.update(settings)
+        settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings',
+            **defaults
+        )
+        self.swagger_settings = settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+        cache_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.spec_cache',
+            SpecCache()
+        )
+        self.spec_cache = cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
@@ -1,13 +1,21 @@
+import json
+
 import coreapi
+from django.http import HttpResponse
 from django.test import TestCase
-from rest_framework_swagger import renderers
+from django.utils.http import http_date
+from rest_framework_swagger.renderers import openapi
+from rest_framework_swagger.cache import Spec
+from rest_framework_swagger.json_backends import SimpleJSONBackend
 
 from ..compat.mock import DEFAULT, MagicMock, patch
+from ..fixtures import get_document
+from .mixins import OpenAPISettingsMixin
 
 
 class TestOpenAPIRenderer(TestCase):
     def setUp(self):
-        self.sut = renderers.OpenAPIRenderer()
+        self.sut = openapi.OpenAPIRenderer()
 
     def test_media_type(self):
         self.assertEqual(
@@ -33,7 +41,8 @@ class TestOpenAPIRenderer(TestCase):
             add_customizations=DEFAULT,
             dump=DEFAULT
         ) as values:
-            self.sut.render(data, renderer_context=renderer_context)
+            values['dump'].return_value = b'{}'
+            result = self.sut.render(data, renderer_context=renderer_context)
 
         values['get_openapi_specification'].assert_called_once_with(data)
         data = values['get_openapi_specification'].return_value
@@ -42,6 +51,37 @@ class TestOpenAPIRenderer(TestCase):
             renderer_context
         )
         values['dump'].assert_called_once_with(data)
+        self.assertEqual(b'{}', result)
+
+    def test_render_sets_validators(self):
+        response = MagicMock(status_code=200)
+        renderer_context = {'request': MagicMock(), 'response': response}
+        spec = Spec(b'{}')
+        with patch.object(self.sut, 'get_spec', return_value=spec):
+            self.sut.render(MagicMock(), renderer_context=renderer_context)
+
+        response.__setitem__.assert_any_call('ETag', spec.etag)
+        response.__setitem__.assert_any_call(
+            'Last-Modified',
+            http_date(spec.last_modified)
+        )
+
+    def test_get_spec_is_kept_for_the_same_data(self):
+        data = MagicMock()
+        with patch.object(self.sut, 'render_specification') as mock:
+            mock.return_value = b'{}'
+            spec = self.sut.get_spec(data, {})
+            result = self.sut.get_spec(data, {})
+
+        mock.assert_called_once_with(data, {})
+        self.assertIs(spec, result)
+
+    def test_get_etag(self):
+        with patch.object(self.sut, 'render_specification') as mock:
+            mock.return_value = b'{}'
+            result = self.sut.get_etag(MagicMock(), {})
+
+        self.assertEqual(Spec(b'{}').etag, result)
 
     def test_render_if_response_is_not_200(self):
         """
@@ -56,7 +96,7 @@ class TestOpenAPIRenderer(TestCase):
         mock.assert_called_once_with(data)
         self.assertEqual(mock.return_value, result)
 
-    @patch('rest_framework_swagger.renderers.force_bytes')
+    @patch('rest_framework_swagger.renderers.openapi.force_bytes')
     @patch('simplejson.dumps')
     def test_dump(self, json_mock, bytes_mock):
         data = MagicMock()
@@ -67,13 +107,30 @@ class TestOpenAPIRenderer(TestCase):
 
         self.assertEqual(bytes_mock.return_value, result)
 
+    @patch('rest_framework_swagger.renderers.openapi.generate_swagger_object')
+    def test_get_openapi_specification(self, compiler_mock):
+        """
+        Asserts that the returned value is the compiled specification.
+        """
+        data = coreapi.Document()
+        with patch('openapi_codec.OpenAPICodec.dump') as codec_mock:
+            result = self.sut.get_openapi_specification(data)
+
+        codec_mock.assert_not_called()
+        compiler_mock.assert_called_once_with(data)
+        self.assertEqual(compiler_mock.return_value, result)
+
+    @patch('rest_framework_swagger.renderers.openapi.swagger_settings')
     @patch('openapi_codec.OpenAPICodec.dump')
     @patch('simplejson.loads')
-    def test_get_openapi_specification(self, json_mock, codec_mock):
+    def test_get_openapi_specification_with_codec(
+            self, json_mock, codec_mock, settings_mock):
         """
-        Asserts that the returned value is a Python representation
-        of the OpenAPICodec's `dump` method.
+        Given USE_OPENAPI_CODEC is enabled, the returned value should be
+        a Python representation of the OpenAPICodec's `dump` method.
         """
+        settings_mock.USE_OPENAPI_CODEC = True
+        settings_mock.JSON_BACKEND = SimpleJSONBackend
         data = coreapi.Document()
         self.sut.get_openapi_specification(data)
 
@@ -96,12 +153,176 @@ class TestOpenAPIRenderer(TestCase):
         self.assertEqual(expected, str(cx.exception))
 
 
+class TestOpenAPILiteRenderer(OpenAPISettingsMixin, TestCase):
+    def setUp(self):
+        self.sut = openapi.OpenAPILiteRenderer()
+        self.data = get_document(url='/v1/')
+        request = MagicMock()
+        request.get_host.return_value = 'kramerica.org'
+        self.renderer_context = {
+            'request': request,
+            'response': MagicMock(status_code=200)
+        }
+
+        self.patch_settings(SECURITY_DEFINITIONS={'basic': {'type': 'basic'}})
+
+    def render(self, renderer):
+        return renderer.render(
+            self.data,
+            renderer_context=self.renderer_context
+        )
+
+    def test_format(self):
+        self.assertEqual('openapi-lite', self.sut.format)
+
+    def test_render(self):
+        result = json.loads(self.render(self.sut))
+
+        self.assertEqual('kramerica.org', result['host'])
+        self.assertNotIn('securityDefinitions', result)
+        self.assertNotIn('responses', result['paths']['/snippets/']['get'])
+
+    def test_render_is_smaller(self):
+        self.assertLess(
+            len(self.render(self.sut)),
+            len(self.render(openapi.OpenAPIRenderer()))
+        )
+
+    def test_cached_next_to_whole_specification(self):
+        whole = self.render(openapi.OpenAPIRenderer())
+        lite = self.render(self.sut)
+
+        self.assertEqual(2, len(self.spec_cache))
+        self.assertEqual(whole, self.render(openapi.OpenAPIRenderer()))
+        self.assertEqual(lite, self.render(openapi.OpenAPILiteRenderer()))
+
+    def test_ignores_split_requests(self):
+        self.assertEqual(('lite',), self.sut.get_part(self.renderer_context))
+
+
+class TestSpecCompression(TestCase):
+    def setUp(self):
+        self.sut = openapi.OpenAPIRenderer()
+        self.spec = Spec(b'{"fizz": "buzz"}', ['gzip'])
+        self.response = HttpResponse()
+
+    def render(self, accept_encoding=None):
+        request = MagicMock(META={'HTTP_ACCEPT_ENCODING': accept_encoding})
+        renderer_context = {'request': request, 'response': self.response}
+        with patch.object(self.sut, 'get_spec', return_value=self.spec):
+            return self.sut.render(
+                MagicMock(),
+                renderer_context=renderer_context
+            )
+
+    @patch('rest_framework_swagger.renderers.openapi.swagger_settings')
+    def test_create_spec_with_compression(self, settings_mock):
+        settings_mock.SPEC_COMPRESSION = True
+        with patch.object(self.sut, 'render_specification') as mock:
+            mock.return_value = b'{}'
+            spec = self.sut.create_spec(MagicMock(), {})
+
+        self.assertIn('gzip', spec.encodings)
+
+    @patch('rest_framework_swagger.renderers.openapi.swagger_settings')
+    def test_create_spec_without_compression(self, settings_mock):
+        settings_mock.SPEC_COMPRESSION = False
+        with patch.object(self.sut, 'render_specification') as mock:
+            mock.return_value = b'{}'
+            spec = self.sut.create_spec(MagicMock(), {})
+
+        self.assertEqual([], spec.encodings)
+
+    def test_render_compressed_variant(self):
+        result = self.render('gzip, deflate')
+
+        self.assertEqual(self.spec.get_content('gzip'), result)
+        self.assertEqual('gzip', self.response['Content-Encoding'])
+        self.assertEqual('Accept-Encoding', self.response['Vary'])
+        self.assertEqual(self.spec.get_etag('gzip'), self.response['ETag'])
+
+    def test_render_uncompressed_variant(self):
+        result = self.render('identity')
+
+        self.assertEqual(self.spec.content, result)
+        self.assertNotIn('Content-Encoding', self.response)
+        self.assertEqual('Accept-Encoding', self.response['Vary'])
+        self.assertEqual(self.spec.etag, self.response['ETag'])
+
+    def test_render_without_variants(self):
+        self.spec = Spec(b'{}')
+        self.render('gzip')
+
+        self.assertNotIn('Content-Encoding', self.response)
+        self.assertNotIn('Vary', self.response)
+
+
+class TestStream(TestCase):
+    def setUp(self):
+        self.sut = openapi.OpenAPIRenderer()
+        self.data = {
+            'swagger': '2.0',
+            'paths': {
+                '/fizz/': {'get': {'summary': 'Fizz'}},
+                '/buzz/': {'post': {'summary': 'Buzz'}},
+            },
+            'definitions': {},
+            'tags': ['fizz'],
+        }
+
+    def test_iterdump_matches_dump(self):
+        self.assertEqual(
+            self.sut.dump(self.data),
+            b''.join(self.sut.iterdump(self.data))
+        )
+
+    def test_iterdump_encodes_members_separately(self):
+        chunks = list(self.sut.iterdump(self.data))
+
+        self.assertIn(self.sut.dump({'get': {'summary': 'Fizz'}}), [
+            chunk.split(b': ', 1)[-1] for chunk in chunks
+        ])
+
+    def test_stream_matches_render_specification(self):
+        self.sut.stream_chunk_size = 16
+        data = get_document()
+        renderer_context = {'request': MagicMock()}
+        renderer_context['request'].get_host.return_value = 'kramerica.org'
+
+        chunks = list(self.sut.stream(data, renderer_context))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            self.sut.render_specification(data, renderer_context),
+            b''.join(chunks)
+        )
+
+    def test_stream_compiles_path_items_one_at_a_time(self):
+        renderer_context = {'request': MagicMock()}
+        with patch.object(self.sut, 'get_openapi_specification') as mock:
+            list(self.sut.stream(get_document(), renderer_context))
+
+        mock.assert_not_called()
+
+    def test_stream_matches_render_specification_when_customized(self):
+        data = get_document()
+        renderer_context = {'request': MagicMock()}
+        renderer_context['request'].get_host.return_value = 'kramerica.org'
+        for setting in ('MINIFY', 'DEDUPLICATE_SCHEMAS'):
+            with patch.object(openapi.swagger_settings, setting, True):
+                self.assertEqual(
+                    self.sut.render_specification(data, renderer_context),
+                    b''.join(self.sut.stream(data, renderer_context)),
+                    setting
+                )
+
+
 class TestAddSecurityDefinitons(TestCase):
     def setUp(self):
-        self.sut = renderers.OpenAPIRenderer()
+        self.sut = openapi.OpenAPIRenderer()
 
         settings_patcher = patch(
-            'rest_framework_swagger.renderers.swagger_settings'
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
         )
         self.swagger_settings = settings_patcher.start()
         self.addCleanup(settings_patcher.stop)
@@ -114,6 +335,21 @@ class TestAddSecurityDefinitons(TestCase):
 
         mock.assert_called_once_with(data)
 
+    def test_add_customizations_deduplicates_schemas(self):
+        data = {'host': 'kramerica.org'}
+        self.swagger_settings.DEDUPLICATE_SCHEMAS = True
+        with patch.object(openapi, 'deduplicate_schemas') as mock:
+            self.sut.add_customizations(data, {'request': MagicMock()})
+
+        mock.assert_called_once_with(data)
+
+    def test_add_customizations_keeps_schemas_inline_by_default(self):
+        self.swagger_settings.DEDUPLICATE_SCHEMAS = False
+        with patch.object(openapi, 'deduplicate_schemas') as mock:
+            self.sut.add_customizations({}, {'request': MagicMock()})
+
+        mock.assert_not_called()
+
     def test_add_security_definitions_when_none(self):
         """
         Given that SECURITY_DEFINITIONS is set to None, security definitions
@@ -142,7 +378,7 @@ class TestAddSecurityDefinitons(TestCase):
 
 class TestAddRequestHost(TestCase):
     def setUp(self):
-        self.sut = renderers.OpenAPIRenderer()
+        self.sut = openapi.OpenAPIRenderer()
 
     def test_add_customizations_sets_hosts_when_falsey(self):
         """
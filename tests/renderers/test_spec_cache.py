@@ -0,0 +1,263 @@
+import json
+import zlib
+
+from django.test import override_settings, TestCase
+from rest_framework_swagger.renderers import openapi
+from rest_framework_swagger.cache import Spec, SpecTemplate, set_generation
+
+from ..compat.mock import MagicMock, patch
+from ..fixtures import get_document
+from .mixins import OpenAPISettingsMixin
+
+
+class CustomRenderer(openapi.OpenAPIRenderer):
+    def add_customizations(self, data, renderer_context):
+        super(CustomRenderer, self).add_customizations(data, renderer_context)
+        data['info']['version'] = 'CUSTOM'
+
+
+class TestSpecCache(OpenAPISettingsMixin, TestCase):
+    def setUp(self):
+        self.sut = openapi.OpenAPIRenderer()
+        self.data = get_document(url='/v1/')
+        request = MagicMock()
+        request.get_host.return_value = 'kramerica.org'
+        self.renderer_context = {
+            'request': request,
+            'response': MagicMock(status_code=200)
+        }
+
+        self.patch_settings(SECURITY_DEFINITIONS={'basic': {'type': 'basic'}})
+
+    def render(self):
+        return self.sut.render(
+            self.data,
+            renderer_context=self.renderer_context
+        )
+
+    def test_render_stores_template_in_cache(self):
+        result = self.render()
+
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        template = self.spec_cache.get(key)
+        self.assertIsInstance(template, SpecTemplate)
+        self.assertEqual(result, template.render(b'"kramerica.org"').content)
+
+    def test_render_uses_cached_content(self):
+        expected = self.render()
+        self.sut = openapi.OpenAPIRenderer()
+        with patch.object(self.sut, 'render_specification') as mock:
+            result = self.render()
+
+        mock.assert_not_called()
+        self.assertEqual(expected, result)
+
+    def test_cache_key_does_not_fingerprint_document(self):
+        with patch(
+            'rest_framework_swagger.fingerprint.get_document_fingerprint'
+        ) as mock:
+            self.render()
+            self.sut = openapi.OpenAPIRenderer()
+            self.render()
+
+        mock.assert_not_called()
+
+    def test_new_generation_is_rendered_again(self):
+        self.render()
+        set_generation(self.data)
+        self.sut = openapi.OpenAPIRenderer()
+        with patch.object(self.sut, 'create_spec_template') as mock:
+            mock.return_value = Spec(b'{}')
+            result = self.render()
+
+        mock.assert_called_once_with(self.data, self.renderer_context)
+        self.assertEqual(b'{}', result)
+
+    def test_version_does_not_vary_with_generation(self):
+        version = self.sut.get_version(self.data, self.renderer_context)
+        set_generation(self.data)
+
+        self.assertEqual(
+            version,
+            self.sut.get_version(self.data, self.renderer_context)
+        )
+
+    def test_renderers_with_customizations_dont_share_cache(self):
+        self.render()
+        self.sut = CustomRenderer()
+        result = json.loads(self.render())
+
+        self.assertEqual('CUSTOM', result['info']['version'])
+        self.assertEqual(2, len(self.spec_cache))
+
+    def test_renderers_of_parts_share_cache_name(self):
+        self.assertEqual(
+            'rest_framework_swagger.renderers.openapi.OpenAPIRenderer',
+            openapi.EmbeddedSpecRenderer().get_cache_name()
+        )
+        self.assertEqual(
+            self.sut.get_cache_name(),
+            openapi.OpenAPILiteRenderer().get_cache_name()
+        )
+
+    def test_version_varies_with_renderer(self):
+        self.assertNotEqual(
+            self.sut.get_version(self.data, self.renderer_context),
+            CustomRenderer().get_version(self.data, self.renderer_context)
+        )
+
+    def test_render_without_cache(self):
+        self.swagger_settings.SPEC_CACHE = False
+        self.render()
+
+        self.assertEqual(0, len(self.spec_cache))
+
+    def test_render_matches_render_specification(self):
+        expected = self.sut.render_specification(
+            self.data,
+            self.renderer_context
+        )
+
+        self.assertEqual(expected, self.render())
+
+    def test_render_splices_request_host(self):
+        self.render()
+        self.sut = openapi.OpenAPIRenderer()
+        self.renderer_context['request'].get_host.return_value = 'pendant.io'
+        with patch.object(self.sut, 'render_specification') as mock:
+            result = self.render()
+
+        mock.assert_not_called()
+        self.assertEqual(1, len(self.spec_cache))
+        self.assertEqual('pendant.io', json.loads(result)['host'])
+
+    def test_render_escapes_spliced_host(self):
+        self.renderer_context['request'].get_host.return_value = 'a"b'
+
+        self.assertEqual('a"b', json.loads(self.render())['host'])
+
+    def test_etag_varies_with_host(self):
+        etag = self.sut.get_etag(self.data, self.renderer_context)
+        self.sut = openapi.OpenAPIRenderer()
+        self.renderer_context['request'].get_host.return_value = 'pendant.io'
+
+        self.assertNotEqual(
+            etag,
+            self.sut.get_etag(self.data, self.renderer_context)
+        )
+
+    def test_render_honours_schema_host(self):
+        self.data = get_document(url='https://vandelay.com/v1/')
+        self.render()
+
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        spec = self.spec_cache.get(key)
+        self.assertIsInstance(spec, Spec)
+        self.assertEqual('vandelay.com', json.loads(spec.content)['host'])
+
+    def test_compressed_variants_are_cached_per_host(self):
+        self.swagger_settings.SPEC_COMPRESSION = True
+        self.sut.get_spec(self.data, self.renderer_context)
+        self.sut = openapi.OpenAPIRenderer()
+        self.renderer_context['request'].get_host.return_value = 'pendant.io'
+        spec = self.sut.get_spec(self.data, self.renderer_context)
+        content = zlib.decompress(
+            spec.get_content('gzip'),
+            16 + zlib.MAX_WBITS
+        )
+
+        self.assertEqual(3, len(self.spec_cache))
+        self.assertEqual('pendant.io', json.loads(content)['host'])
+
+    def test_render_uses_shared_cache(self):
+        with override_settings(
+            CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            }},
+            SWAGGER_SETTINGS={'CACHE': 'default'}
+        ):
+            expected = self.render()
+            # As in another process.
+            self.spec_cache.clear()
+            self.sut = openapi.OpenAPIRenderer()
+            with patch.object(self.sut, 'render_specification') as mock, \
+                    patch.object(self.sut, 'dump') as dump:
+                dump.side_effect = openapi.OpenAPIRenderer().dump
+                result = self.render()
+
+        mock.assert_not_called()
+        self.assertEqual(1, dump.call_count)
+        self.assertEqual(expected, result)
+
+    def test_cache_key_does_not_vary_with_host(self):
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        self.renderer_context['request'].get_host.return_value = 'pendant.io'
+
+        self.assertEqual(
+            key,
+            self.sut.get_cache_key(self.data, self.renderer_context)
+        )
+
+    def test_cache_key_varies_with_deduplication(self):
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        self.swagger_settings.DEDUPLICATE_SCHEMAS = True
+
+        self.assertNotEqual(
+            key,
+            self.sut.get_cache_key(self.data, self.renderer_context)
+        )
+
+    def test_cache_key_varies_with_minify(self):
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        self.swagger_settings.MINIFY = True
+
+        self.assertNotEqual(
+            key,
+            self.sut.get_cache_key(self.data, self.renderer_context)
+        )
+
+    def test_cache_key_varies_with_strip_descriptions(self):
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        self.sut.strip_descriptions = True
+
+        self.assertNotEqual(
+            key,
+            self.sut.get_cache_key(self.data, self.renderer_context)
+        )
+
+    def test_render_minified(self):
+        expected = self.render()
+        self.spec_cache.clear()
+        self.swagger_settings.MINIFY = True
+        self.sut = openapi.OpenAPIRenderer()
+        result = self.render()
+
+        self.assertLess(len(result), len(expected))
+        self.assertNotIn(b'": ', result)
+        self.assertNotIn(
+            'description',
+            json.loads(result)['paths']['/snippets/']['post']
+        )
+
+    def test_render_minified_without_descriptions(self):
+        self.swagger_settings.MINIFY = True
+        self.sut.strip_descriptions = True
+        result = json.loads(self.render())
+
+        self.assertNotIn(
+            'description',
+            result['paths']['/snippets/']['get']
+        )
+        self.assertEqual(
+            {'basic': {'type': 'basic'}},
+            result['securityDefinitions']
+        )
+
+    def test_cache_key_varies_with_security_definitions(self):
+        key = self.sut.get_cache_key(self.data, self.renderer_context)
+        self.swagger_settings.SECURITY_DEFINITIONS = None
+
+        self.assertNotEqual(
+            key,
+            self.sut.get_cache_key(self.data, self.renderer_context)
+        )
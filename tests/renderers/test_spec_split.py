@@ -0,0 +1,98 @@
+import json
+
+from django.test import RequestFactory, TestCase
+from rest_framework_swagger.renderers import openapi
+
+from ..compat.mock import MagicMock, patch
+from ..fixtures import get_document
+from .mixins import OpenAPISettingsMixin
+
+
+class TestSpecSplit(OpenAPISettingsMixin, TestCase):
+    def setUp(self):
+        self.sut = openapi.OpenAPIRenderer()
+        self.data = get_document(url='/v1/')
+
+        self.patch_settings(SPEC_SPLIT=True)
+
+    def get_renderer_context(self, query=''):
+        request = RequestFactory().get('/?format=openapi' + query)
+        return {'request': request, 'response': MagicMock(status_code=200)}
+
+    def render(self, query=''):
+        return json.loads(openapi.OpenAPIRenderer().render(
+            self.data,
+            renderer_context=self.get_renderer_context(query)
+        ))
+
+    def test_get_part(self):
+        for query, expected in [
+                ('', ()),
+                ('&index', ('index',)),
+                ('&tag=users', ('tag', 'users'))]:
+            self.assertEqual(
+                expected,
+                self.sut.get_part(self.get_renderer_context(query))
+            )
+
+    def test_get_part_without_split(self):
+        self.swagger_settings.SPEC_SPLIT = False
+
+        self.assertEqual(
+            (),
+            self.sut.get_part(self.get_renderer_context('&tag=users'))
+        )
+
+    def test_render_whole_specification(self):
+        result = self.render()
+
+        self.assertIn('definitions', result)
+        self.assertIn('parameters', result['paths']['/snippets/']['get'])
+
+    def test_render_index(self):
+        result = self.render('&index')
+
+        self.assertEqual('testserver', result['host'])
+        self.assertNotIn('definitions', result)
+        self.assertEqual(
+            {'tags': ['snippets'], 'summary': 'List snippets'},
+            result['paths']['/snippets/']['get']
+        )
+
+    def test_render_fragment(self):
+        result = self.render('&tag=users')
+
+        self.assertEqual(['/users/{pk}/'], list(result['paths']))
+        self.assertEqual(['User'], list(result['definitions']))
+        self.assertNotIn('host', result)
+
+    def test_parts_are_cached_independently(self):
+        for query in ('', '&index', '&tag=users', '&tag=snippets'):
+            self.render(query)
+
+        self.assertEqual(4, len(self.spec_cache))
+
+    def test_cached_fragment_is_not_rendered_again(self):
+        expected = self.render('&tag=users')
+        render = patch.object(openapi.OpenAPIRenderer, 'render_specification')
+        generate = patch.object(openapi, 'generate_swagger_object')
+        with render as mock, generate as gen:
+            result = self.render('&tag=users')
+
+        mock.assert_not_called()
+        gen.assert_not_called()
+        self.assertEqual(expected, result)
+
+    def test_render_index_without_cache(self):
+        self.swagger_settings.SPEC_CACHE = False
+
+        self.assertEqual(self.render('&index'), self.render('&index'))
+        self.assertNotIn('definitions', self.render('&index'))
+
+    def test_stream_fragment(self):
+        renderer_context = self.get_renderer_context('&tag=users')
+
+        self.assertEqual(
+            self.sut.render_specification(self.data, renderer_context),
+            b''.join(self.sut.stream(self.data, renderer_context))
+        )
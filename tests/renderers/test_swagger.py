@@ -1,8 +1,18 @@
-from django.test import TestCase
-from rest_framework_swagger.renderers import SwaggerUIRenderer
+import re
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.middleware.csrf import _compare_salted_tokens
+from django.test import override_settings, RequestFactory, TestCase
 import simplejson as json
+from rest_framework_swagger.cache import Spec, ui_cache
+from rest_framework_swagger.json_backends import SimpleJSONBackend
+from rest_framework_swagger.renderers import SwaggerUIRenderer
 
 from ..compat.mock import patch, MagicMock
+from ..fixtures import get_document
+
+
+CSRF_TOKEN_RE = re.compile(r"name='csrfmiddlewaretoken' value='([^']*)'")
 
 
 class TestSwaggerUIRenderer(TestCase):
@@ -11,10 +21,40 @@ class TestSwaggerUIRenderer(TestCase):
         self.renderer_context = {'request': MagicMock()}
 
         swagger_settings_patcher = patch(
-            'rest_framework_swagger.renderers.swagger_settings',
+            'rest_framework_swagger.renderers.ui.swagger_settings',
         )
         self.swagger_settings = swagger_settings_patcher.start()
+        self.swagger_settings.JSON_BACKEND = SimpleJSONBackend
+        self.swagger_settings.COMPACT_JSON = False
+        self.swagger_settings.SPEC_SPLIT = False
+        self.swagger_settings.MINIFY = False
+        self.swagger_settings.UI_CACHE = False
+        self.swagger_settings.EMBED_SPEC = False
+        self.swagger_settings.USE_BUNDLE = False
+        self.swagger_settings.UI_CACHE_CONTROL = None
+        self.swagger_settings.VERSIONED_SPEC_URL = False
+        # The UI settings are encoded in the context.
+        self.swagger_settings.USE_SESSION_AUTH = True
+        self.swagger_settings.LOGIN_URL = None
+        self.swagger_settings.LOGOUT_URL = None
+        self.swagger_settings.APIS_SORTER = None
+        self.swagger_settings.DOC_EXPANSION = None
+        self.swagger_settings.JSON_EDITOR = False
+        self.swagger_settings.OPERATIONS_SORTER = None
+        self.swagger_settings.SHOW_REQUEST_HEADERS = False
+        self.swagger_settings.SUPPORTED_SUBMIT_METHODS = ['get']
+        self.swagger_settings.VALIDATOR_URL = None
         self.addCleanup(swagger_settings_patcher.stop)
+        # The specification is rendered with the same settings.
+        spec_settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings',
+            self.swagger_settings
+        )
+        spec_settings_patcher.start()
+        self.addCleanup(spec_settings_patcher.stop)
+
+        ui_cache.clear()
+        self.addCleanup(ui_cache.clear)
 
     def test_media_type(self):
         self.assertEqual('text/html', self.sut.media_type)
@@ -31,7 +71,7 @@ class TestSwaggerUIRenderer(TestCase):
     def test_charset(self):
         self.assertEqual('utf-8', self.sut.charset)
 
-    @patch('rest_framework_swagger.renderers.render')
+    @patch('django.shortcuts.render')
     def test_render(self, render_mock):
         with patch.object(self.sut, 'set_context') as context_mock:
             self.sut.render(
@@ -47,6 +87,68 @@ class TestSwaggerUIRenderer(TestCase):
             self.renderer_context
         )
 
+    @patch('rest_framework_swagger.renderers.ui.add_server_timing')
+    @patch('django.shortcuts.render')
+    def test_render_adds_server_timing(self, render_mock, timing_mock):
+        response = MagicMock()
+        self.renderer_context['response'] = response
+        with patch.object(self.sut, 'set_context'):
+            self.sut.render(None, renderer_context=self.renderer_context)
+
+        timing_mock.assert_called_once_with(
+            self.renderer_context['request'],
+            response
+        )
+
+    def test_set_context_is_computed_once(self):
+        with patch.object(self.sut, 'get_auth_urls') as mock:
+            mock.return_value = {}
+            self.sut.set_context(self.renderer_context)
+            SwaggerUIRenderer().set_context({})
+
+        mock.assert_called_once_with()
+
+    def test_settings_change_refreshes_context(self):
+        self.sut.set_context(self.renderer_context)
+        with override_settings(LOGIN_URL='/sign-in/'):
+            with patch.object(self.sut, 'get_auth_urls') as mock:
+                mock.return_value = {}
+                self.sut.set_context(self.renderer_context)
+
+        mock.assert_called_once_with()
+
+    def test_embedded_spec_escapes_script_end(self):
+        self.swagger_settings.EMBED_SPEC = True
+        spec_renderer = MagicMock()
+        spec_renderer.return_value.get_spec.return_value = Spec(
+            b'{"description": "</script>"}'
+        )
+        with patch.object(self.sut, 'spec_renderer_class', spec_renderer):
+            content = self.sut.get_embedded_spec(
+                get_document(), self.renderer_context
+            )
+
+        self.assertEqual(u'{"description": "\\u003c/script>"}', content)
+        self.assertEqual(
+            {'description': '</script>'}, json.loads(content)
+        )
+
+    def test_spec_fields_are_disabled_by_default(self):
+        self.assertEqual(
+            {}, self.sut.get_spec_fields(get_document(), self.renderer_context)
+        )
+
+    def test_set_context_sets_bundle(self):
+        self.swagger_settings.USE_BUNDLE = True
+        bundle = {'script': 'a.js', 'stylesheet': 'a.css'}
+        with patch(
+            'rest_framework_swagger.bundle.get_bundle',
+            return_value=bundle
+        ):
+            self.sut.set_context(self.renderer_context)
+
+        self.assertEqual(bundle, self.renderer_context['bundle'])
+
     def test_set_context_use_session_auth(self):
         self.sut.set_context(self.renderer_context)
 
@@ -122,3 +224,123 @@ class TestSwaggerUIRenderer(TestCase):
         result = self.sut.get_ui_settings()
 
         self.assertNotIn('validatorUrl', result)
+
+    def test_split_spec_when_spec_split(self):
+        self.swagger_settings.SPEC_SPLIT = True
+        result = self.sut.get_ui_settings()
+
+        self.assertIs(True, result['splitSpec'])
+
+    def test_split_spec_not_present_by_default(self):
+        self.assertNotIn('splitSpec', self.sut.get_ui_settings())
+
+
+class TestSwaggerUIShell(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        swagger_settings_patcher = patch(
+            'rest_framework_swagger.renderers.ui.swagger_settings',
+            UI_CACHE=True,
+            USE_SESSION_AUTH=True,
+            LOGIN_URL='/login/',
+            LOGOUT_URL='/logout/',
+            JSON_BACKEND=SimpleJSONBackend,
+            COMPACT_JSON=False,
+            MINIFY=False,
+            SPEC_SPLIT=False,
+            EMBED_SPEC=False,
+            USE_BUNDLE=False,
+            UI_CACHE_CONTROL=None,
+            VERSIONED_SPEC_URL=False,
+            VALIDATOR_URL=''
+        )
+        self.swagger_settings = swagger_settings_patcher.start()
+        self.addCleanup(swagger_settings_patcher.stop)
+        # The specification is rendered with the same settings.
+        spec_settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings',
+            self.swagger_settings
+        )
+        spec_settings_patcher.start()
+        self.addCleanup(spec_settings_patcher.stop)
+
+        ui_cache.clear()
+        self.addCleanup(ui_cache.clear)
+
+    def render(self, path='/docs/', user=None, renderer=None):
+        request = self.factory.get(path)
+        request.user = user or AnonymousUser()
+        renderer = renderer or SwaggerUIRenderer()
+        return renderer.render(None, renderer_context={
+            'request': request,
+        }), request
+
+    def render_template(self, request):
+        renderer = SwaggerUIRenderer()
+        self.swagger_settings.UI_CACHE = False
+        try:
+            response = renderer.render(None, renderer_context={
+                'request': request,
+            })
+        finally:
+            self.swagger_settings.UI_CACHE = True
+        return response.content.decode('utf-8')
+
+    def assertSamePage(self, expected, actual):
+        # CSRF tokens are salted anew for each page.
+        self.assertEqual(
+            CSRF_TOKEN_RE.sub('', expected), CSRF_TOKEN_RE.sub('', actual)
+        )
+
+    def test_matches_template(self):
+        content, request = self.render()
+
+        self.assertSamePage(self.render_template(request), content)
+
+    def test_matches_template_for_authenticated_user(self):
+        user = User(username='<kramer>')
+        content, request = self.render(user=user)
+
+        self.assertSamePage(self.render_template(request), content)
+        self.assertIn('Hello, &lt;kramer&gt;', content)
+
+    def test_fills_in_request_fields(self):
+        content, request = self.render(path='/docs/?a="b"')
+
+        token = CSRF_TOKEN_RE.search(content).group(1)
+        self.assertTrue(
+            _compare_salted_tokens(token, request.META['CSRF_COOKIE'])
+        )
+        self.assertIn('/login/?next=/docs/', content)
+        self.assertNotIn('__rest_framework_swagger_', content)
+
+    def test_template_is_rendered_once(self):
+        self.render()
+        with patch('rest_framework_swagger.shell.render_to_string') as mock:
+            content, _ = self.render(path='/other/')
+
+        mock.assert_not_called()
+        self.assertIn('?next=/other/', content)
+
+    def test_one_shell_per_authentication(self):
+        self.render()
+        self.render(user=User(username='kramer'))
+        self.render(user=User(username='newman'))
+
+        self.assertEqual(3, len(ui_cache))
+
+    def test_without_session_auth(self):
+        self.swagger_settings.USE_SESSION_AUTH = False
+        content, request = self.render()
+
+        self.assertNotIn('csrfmiddlewaretoken', content)
+        self.assertNotIn('CSRF_COOKIE', request.META)
+
+    def test_bundle(self):
+        self.swagger_settings.USE_BUNDLE = True
+        content, _ = self.render()
+
+        self.assertEqual(2, content.count("<script src='/static/"))
+        self.assertEqual(1, content.count("rel='stylesheet'"))
+        self.assertIn('/static/rest_framework_swagger/bundle.', content)
+        self.assertIn('/static/rest_framework_swagger/css/bundle.', content)
@@ -1,6 +1,17 @@
 SECRET_KEY = 'fake-key'
 INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.staticfiles',
+    'rest_framework_swagger',
     'tests',
 ]
 ROOT_URLCONF = []
 DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3'}}
+STATIC_URL = '/static/'
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'APP_DIRS': True,
+    },
+]
@@ -0,0 +1,122 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from django.core.management import call_command
+from django.http import Http404
+from django.test import override_settings, RequestFactory, TestCase
+from django.utils.six import StringIO
+from rest_framework_swagger import artifacts
+
+
+@override_settings(ROOT_URLCONF='tests.urls')
+class TestArtifactView(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.generate()
+        self.view = artifacts.ArtifactView.as_view(directory=self.directory)
+        self.factory = RequestFactory()
+
+    def generate(self, **options):
+        call_command(
+            'generate_swagger',
+            self.directory,
+            url='/swagger/',
+            stdout=StringIO(),
+            **options
+        )
+        self.manifest = artifacts.get_artifacts(self.directory).manifest
+
+    def read(self, name):
+        with open(os.path.join(self.directory, name), 'rb') as f:
+            return f.read()
+
+    def get(self, path='', data=None, **headers):
+        return self.view(self.factory.get('/', data, **headers), path=path)
+
+    def test_index(self):
+        response = self.get()
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('text/html; charset=utf-8', response['Content-Type'])
+        self.assertEqual(self.read('index.html'), response.getvalue())
+
+    def test_specification(self):
+        name = self.manifest['spec']['name']
+        response = self.get(name)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/openapi+json', response['Content-Type'])
+        self.assertEqual(self.read(name), response.getvalue())
+        self.assertEqual(str(len(self.read(name))), response['Content-Length'])
+        self.assertEqual(self.manifest['spec']['etag'], response['ETag'])
+
+    def test_format_openapi(self):
+        response = self.get(data={'format': 'openapi'})
+
+        self.assertEqual(
+            self.read(self.manifest['spec']['name']),
+            response.getvalue()
+        )
+
+    def test_compressed_variant(self):
+        variants = dict(self.manifest['spec']['encodings'])
+        response = self.get(
+            self.manifest['spec']['name'],
+            HTTP_ACCEPT_ENCODING='gzip'
+        )
+
+        self.assertEqual('gzip', response['Content-Encoding'])
+        self.assertEqual('Accept-Encoding', response['Vary'])
+        self.assertEqual(self.read(variants['gzip']), response.getvalue())
+
+    def test_matching_etag_returns_not_modified(self):
+        response = self.get(
+            self.manifest['spec']['name'],
+            HTTP_IF_NONE_MATCH=self.manifest['spec']['etag']
+        )
+
+        self.assertEqual(304, response.status_code)
+
+    def test_unknown_file(self):
+        with self.assertRaises(Http404):
+            self.get('manifest.json')
+
+    def test_missing_artifacts(self):
+        view = artifacts.ArtifactView.as_view(
+            directory=os.path.join(self.directory, 'missing')
+        )
+        with self.assertRaises(Http404):
+            view(self.factory.get('/'), path='')
+
+    def test_new_artifacts_are_mapped(self):
+        self.get()
+        self.generate(host='kramerica.org')
+        name = self.manifest['spec']['name']
+
+        self.assertEqual(self.read(name), self.get(name).getvalue())
+
+    def test_artifacts_are_mapped_once(self):
+        self.get()
+        with override_settings():
+            first = artifacts.get_artifacts(self.directory).files
+            second = artifacts.get_artifacts(self.directory).files
+
+        self.assertIs(first, second)
+
+
+class TestImports(TestCase):
+    def test_does_not_import_coreapi(self):
+        code = (
+            'import sys, django; django.setup(); '
+            'import rest_framework_swagger.artifacts; '
+            'print(sorted(m for m in ("coreapi", "openapi_codec") '
+            'if m in sys.modules))'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='tests.settings')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+
+        self.assertEqual(b'[]', output.strip())
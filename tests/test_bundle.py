@@ -0,0 +1,177 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings, TestCase
+from django.utils.six import StringIO
+from rest_framework_swagger import bundle
+
+
+BASE_TEMPLATE = os.path.join(
+    os.path.dirname(bundle.__file__),
+    'templates', 'rest_framework_swagger', 'base.html'
+)
+SCRIPT_RE = re.compile(r'<script src=\'{% static "rest_framework_swagger/'
+                       r'(.*?)" %}\'')
+STATIC_DIR = os.path.join(
+    os.path.dirname(bundle.__file__), 'static', 'rest_framework_swagger'
+)
+
+
+class TestBuildBundle(TestCase):
+    def test_shipped_bundle_is_up_to_date(self):
+        for name, content in bundle.build_bundle():
+            with open(finders.find(name), 'rb') as f:
+                self.assertEqual(content, f.read(), name)
+
+    def test_bundles_scripts_of_base_template(self):
+        with open(BASE_TEMPLATE) as f:
+            scripts = SCRIPT_RE.findall(f.read())
+
+        # The template loads the unminified Swagger UI, for debugging.
+        self.assertEqual(
+            [script.replace('swagger-ui.min.js', 'swagger-ui.js')
+             for script in bundle.SCRIPTS],
+            [script for script in scripts if script != 'init.js']
+        )
+
+    def test_ships_only_scripts_of_base_template(self):
+        with open(BASE_TEMPLATE) as f:
+            scripts = SCRIPT_RE.findall(f.read())
+
+        self.assertEqual(
+            sorted(script for script in scripts if script.startswith('lib/')),
+            sorted(
+                'lib/' + name
+                for name in os.listdir(os.path.join(STATIC_DIR, 'lib'))
+            )
+        )
+
+    def test_names_are_hashed(self):
+        (script, _), (stylesheet, _), (_, content) = bundle.build_bundle()
+
+        self.assertRegexpMatches(
+            script, r'^rest_framework_swagger/bundle\.[0-9a-f]{12}\.js$'
+        )
+        self.assertEqual(
+            {'script': script, 'stylesheet': stylesheet},
+            json.loads(content.decode('utf-8'))
+        )
+
+    def test_missing_file(self):
+        with self.assertRaises(ImproperlyConfigured):
+            bundle.build_bundle(lambda path: None)
+
+    def test_bundle_scripts(self):
+        content = bundle.bundle_scripts([
+            u'var a = 1\n//# sourceMappingURL=a.map', u'b() // c'
+        ])
+
+        self.assertEqual(u'var a = 1\n;\nb() // c\n;\n', content)
+
+    def test_bundle_stylesheets(self):
+        content = bundle.bundle_stylesheets([
+            (None, [u'@font-face { src: url(a.ttf) }']),
+            ('print', [u'a { color: red }', u'b { color: blue }']),
+        ])
+
+        self.assertEqual(
+            u'@font-face{src: url(a.ttf)}\n'
+            u'@media print{a{color: red}\nb{color: blue}}\n',
+            content
+        )
+
+
+class TestMinifyCSS(TestCase):
+    def test_drops_comments(self):
+        self.assertEqual(u'a{}', bundle.minify_css(u'/* a */\na {\n}\n'))
+
+    def test_collapses_spaces(self):
+        source = u'.a  >  .b ,\n.c:hover {\n  margin: 0  auto;\n}'
+
+        self.assertEqual(
+            u'.a > .b,.c:hover{margin: 0 auto;}', bundle.minify_css(source)
+        )
+
+    def test_keeps_strings(self):
+        source = u'a{content: "/* a ,  b */";font-family: \'A  B\'}'
+
+        self.assertEqual(source, bundle.minify_css(source))
+
+
+class TestGetBundle(TestCase):
+    def test_reads_manifest(self):
+        self.assertEqual(
+            dict(
+                (key, name) for key, name in zip(
+                    ('script', 'stylesheet'),
+                    [name for name, _ in bundle.build_bundle()]
+                )
+            ),
+            bundle.get_bundle()
+        )
+
+    def test_missing_manifest(self):
+        with self.assertRaises(ImproperlyConfigured):
+            bundle.get_bundle(lambda path: None)
+
+
+class TestBuildSwaggerBundle(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def call(self):
+        call_command(
+            'build_swagger_bundle', self.directory, stdout=StringIO()
+        )
+        with open(os.path.join(self.directory, bundle.MANIFEST_NAME)) as f:
+            return json.load(f)
+
+    def test_writes_bundle(self):
+        manifest = self.call()
+
+        for name in manifest.values():
+            self.assertTrue(
+                os.path.exists(os.path.join(self.directory, name))
+            )
+
+    def test_removes_previous_bundle(self):
+        previous = os.path.join(
+            self.directory, bundle.SCRIPT_NAME % 'previous'
+        )
+        self.call()
+        manifest_path = os.path.join(self.directory, bundle.MANIFEST_NAME)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        with open(previous, 'w') as f:
+            f.write('')
+        manifest['script'] = bundle.SCRIPT_NAME % 'previous'
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+        self.call()
+
+        self.assertFalse(os.path.exists(previous))
+
+
+class TestCollectStatic(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_collects_with_manifest_storage(self):
+        storage = 'django.contrib.staticfiles.storage.' \
+            'ManifestStaticFilesStorage'
+        with override_settings(STATIC_ROOT=self.directory,
+                               STATICFILES_STORAGE=storage):
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+        self.assertTrue(os.path.exists(
+            os.path.join(self.directory, 'staticfiles.json')
+        ))
@@ -0,0 +1,438 @@
+import hashlib
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from django.test import override_settings, TestCase
+import rest_framework_swagger
+from rest_framework_swagger import cache
+from rest_framework_swagger.compression import compress
+
+from .compat.mock import MagicMock, patch
+
+
+class TestSpec(TestCase):
+    def test_etag_is_content_hash(self):
+        self.assertEqual(
+            '"%s"' % hashlib.sha1(b'fizz').hexdigest(),
+            cache.Spec(b'fizz').etag
+        )
+
+    def test_etag_is_strong(self):
+        self.assertFalse(cache.Spec(b'fizz').etag.startswith('W/'))
+
+    def test_variants(self):
+        spec = cache.Spec(b'fizz', ['gzip'])
+
+        self.assertEqual(
+            compress(b'fizz', 'gzip'),
+            spec.get_content('gzip')
+        )
+        self.assertEqual(b'fizz', spec.get_content())
+
+    def test_size_includes_variants(self):
+        spec = cache.Spec(b'fizz', ['gzip'])
+
+        self.assertEqual(
+            cache.Spec(b'fizz').size +
+            sys.getsizeof(spec.get_content('gzip')),
+            spec.size
+        )
+
+    def test_etag_per_encoding(self):
+        spec = cache.Spec(b'fizz', ['gzip'])
+
+        self.assertEqual(spec.etag, spec.get_etag())
+        self.assertEqual(
+            '"%s-gzip"' % hashlib.sha1(b'fizz').hexdigest(),
+            spec.get_etag('gzip')
+        )
+
+    def test_last_modified(self):
+        with patch('time.time', return_value=1000.5):
+            spec = cache.Spec(b'fizz')
+
+        self.assertEqual(1000, spec.last_modified)
+
+
+class TestSpecTemplate(TestCase):
+    def setUp(self):
+        self.sut = cache.SpecTemplate(b'{"host": ', b'}')
+
+    def test_render(self):
+        self.assertEqual(
+            b'{"host": "kramerica.org"}',
+            self.sut.render(b'"kramerica.org"').content
+        )
+
+    def test_render_with_variants(self):
+        spec = self.sut.render(b'"kramerica.org"', ['gzip'])
+
+        self.assertEqual(
+            compress(b'{"host": "kramerica.org"}', 'gzip'),
+            spec.get_content('gzip')
+        )
+
+    def test_etag_varies_with_host(self):
+        self.assertNotEqual(
+            self.sut.render(b'"kramerica.org"').etag,
+            self.sut.render(b'"pendant.io"').etag
+        )
+
+    def test_etag_varies_with_template(self):
+        other = cache.SpecTemplate(b'{"host":', b'}')
+
+        self.assertNotEqual(
+            self.sut.render(b'"kramerica.org"').etag,
+            other.render(b'"kramerica.org"').etag
+        )
+
+    def test_last_modified(self):
+        spec = self.sut.render(b'"kramerica.org"')
+
+        self.assertEqual(self.sut.last_modified, spec.last_modified)
+
+
+@override_settings(SWAGGER_SETTINGS={
+    'SPEC_CACHE_MAX_ENTRIES': 2,
+    'SPEC_CACHE_MAX_BYTES': 1024,
+})
+class TestSpecCache(TestCase):
+    def setUp(self):
+        self.sut = cache.SpecCache()
+
+    def test_get_when_missing(self):
+        self.assertIsNone(self.sut.get('fizz'))
+
+    def test_set_and_get(self):
+        self.sut.set('fizz', cache.Spec(b'buzz'))
+
+        self.assertEqual(b'buzz', self.sut.get('fizz').content)
+
+    def test_size_accounts_for_each_entry(self):
+        self.sut.set('fizz', cache.Spec(b'buzz'))
+        self.sut.set('foo', cache.Spec(b'bar'))
+
+        expected = cache.Spec(b'buzz').size + cache.Spec(b'bar').size
+        self.assertEqual(expected, self.sut.size)
+
+    def test_replacing_an_entry_updates_size(self):
+        self.sut.set('fizz', cache.Spec(b'buzz'))
+        self.sut.set('fizz', cache.Spec(b'buzzbuzz'))
+
+        self.assertEqual(cache.Spec(b'buzzbuzz').size, self.sut.size)
+
+    def test_evicts_least_recently_used_entry(self):
+        self.sut.set('a', cache.Spec(b'1'))
+        self.sut.set('b', cache.Spec(b'2'))
+        self.sut.get('a')
+        self.sut.set('c', cache.Spec(b'3'))
+
+        self.assertIn('a', self.sut)
+        self.assertNotIn('b', self.sut)
+        self.assertIn('c', self.sut)
+
+    def test_evicts_when_over_max_bytes(self):
+        self.sut.set('a', cache.Spec(b'x' * 600))
+        self.sut.set('b', cache.Spec(b'x' * 600))
+
+        self.assertNotIn('a', self.sut)
+        self.assertIn('b', self.sut)
+        self.assertLessEqual(self.sut.size, 1024)
+
+    def test_entry_larger_than_max_bytes_is_not_stored(self):
+        self.sut.set('a', cache.Spec(b'x' * 2048))
+
+        self.assertEqual(0, len(self.sut))
+        self.assertEqual(0, self.sut.size)
+
+    def test_clear(self):
+        self.sut.set('a', cache.Spec(b'1'))
+        self.sut.clear()
+
+        self.assertEqual(0, len(self.sut))
+        self.assertEqual(0, self.sut.size)
+
+
+class TestSpecCacheInvalidation(TestCase):
+    def test_settings_change_clears_spec_cache(self):
+        cache.spec_cache.set('fizz', cache.Spec(b'buzz'))
+        with override_settings(SWAGGER_SETTINGS={}):
+            self.assertEqual(0, len(cache.spec_cache))
+
+
+class TestGeneration(TestCase):
+    def test_generation_is_assigned_once(self):
+        document = MagicMock()
+        generation = cache.get_generation(document)
+
+        self.assertEqual(generation, cache.get_generation(document))
+        self.assertNotEqual(generation, cache.get_generation(MagicMock()))
+
+    def test_set_generation_renews_it(self):
+        document = MagicMock()
+        generation = cache.get_generation(document)
+        cache.set_generation(document)
+
+        self.assertGreater(cache.get_generation(document), generation)
+
+
+class TestDocumentCache(TestCase):
+    def setUp(self):
+        self.sut = cache.DocumentCache()
+        self.patterns = []
+
+    def test_get_entry(self):
+        self.sut.set('fizz', 'buzz', self.patterns)
+
+        self.assertEqual(
+            ('buzz', False),
+            self.sut.get_entry('fizz', self.patterns)
+        )
+
+    def test_get_entry_when_expired(self):
+        with patch('time.time', return_value=1000):
+            self.sut.set('fizz', 'buzz', self.patterns, ttl=60)
+        with patch('time.time', return_value=1060):
+            entry = self.sut.get_entry('fizz', self.patterns)
+            document = self.sut.get('fizz', self.patterns)
+
+        self.assertEqual(('buzz', True), entry)
+        self.assertIsNone(document)
+
+    def test_get_entry_with_other_patterns(self):
+        self.sut.set('fizz', 'buzz', self.patterns)
+
+        self.assertEqual((None, False), self.sut.get_entry('fizz', []))
+
+    def test_entry_with_other_patterns_is_dropped(self):
+        self.sut.set('fizz', 'buzz', self.patterns)
+        self.sut.get_entry('fizz', [])
+
+        self.assertNotIn('fizz', self.sut)
+
+    @override_settings(SWAGGER_SETTINGS={'SCHEMA_CACHE_MAX_ENTRIES': 2})
+    def test_evicts_least_recently_used_entry(self):
+        self.sut.set('a', '1', self.patterns)
+        self.sut.set('b', '2', self.patterns)
+        self.sut.get('a', self.patterns)
+        self.sut.set('c', '3', self.patterns)
+
+        self.assertIn('a', self.sut)
+        self.assertNotIn('b', self.sut)
+        self.assertIn('c', self.sut)
+
+
+class TestSingleFlight(TestCase):
+    def setUp(self):
+        self.sut = cache.SingleFlight()
+
+    def run_concurrently(self, func, count=8):
+        """
+        Calls `func` from `count` threads, while the first call blocks.
+        Returns the results and errors of every call.
+        """
+        started, release = threading.Event(), threading.Event()
+        results, errors = [], []
+
+        def leader():
+            started.set()
+            release.wait()
+            return func()
+
+        def call():
+            try:
+                results.append(self.sut.do('fizz', leader))
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        # Leaves the other threads time to join the call.
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
+
+    def test_concurrent_calls_share_one_call(self):
+        calls = []
+
+        def func():
+            calls.append(None)
+            return 'buzz'
+
+        results, errors = self.run_concurrently(func)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(8 * ['buzz'], results)
+        self.assertEqual([], errors)
+
+    def test_error_is_raised_in_every_caller(self):
+        def func():
+            raise ValueError()
+
+        results, errors = self.run_concurrently(func)
+
+        self.assertEqual([], results)
+        self.assertEqual(8, len(errors))
+
+    def test_sequential_calls_are_not_shared(self):
+        calls = []
+        self.sut.do('fizz', lambda: calls.append(None))
+        self.sut.do('fizz', lambda: calls.append(None))
+
+        self.assertEqual(2, len(calls))
+        self.assertFalse(self.sut.in_flight('fizz'))
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'swagger': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'swagger',
+    },
+}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    SWAGGER_SETTINGS={'CACHE': 'swagger'}
+)
+class TestSharedSpecCache(TestCase):
+    def setUp(self):
+        self.sut = cache.SharedSpecCache()
+        self.sut.poll_interval = 0.001
+        self.sut.cache.clear()
+
+    def create(self):
+        return cache.Spec(b'fizz')
+
+    def test_enabled(self):
+        self.assertTrue(self.sut.enabled)
+        with override_settings(SWAGGER_SETTINGS={}):
+            self.assertFalse(self.sut.enabled)
+
+    def test_key_includes_package_version(self):
+        self.assertIn(
+            ':%s:' % rest_framework_swagger.__version__,
+            self.sut.make_key(('fizz',))
+        )
+
+    def test_get_or_set_stores_value(self):
+        spec = self.sut.get_or_set(('fizz',), self.create)
+
+        self.assertEqual(
+            spec.etag,
+            self.sut.cache.get(self.sut.make_key(('fizz',))).etag
+        )
+
+    def test_get_or_set_uses_stored_value(self):
+        self.sut.get_or_set(('fizz',), self.create)
+        with patch.object(self, 'create') as mock:
+            spec = self.sut.get_or_set(('fizz',), self.create)
+
+        mock.assert_not_called()
+        self.assertEqual(b'fizz', spec.content)
+
+    def test_lease_is_released(self):
+        self.sut.get_or_set(('fizz',), self.create)
+        lease_key = self.sut.make_key(('fizz',)) + ':lease'
+
+        self.assertIsNone(self.sut.cache.get(lease_key))
+
+    def test_lease_is_released_when_create_fails(self):
+        def create():
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            self.sut.get_or_set(('fizz',), create)
+
+        lease_key = self.sut.make_key(('fizz',)) + ':lease'
+        self.assertIsNone(self.sut.cache.get(lease_key))
+
+    def test_waits_for_lease_holder(self):
+        cache_key = self.sut.make_key(('fizz',))
+        self.sut.cache.add(cache_key + ':lease', 'other', 30)
+
+        def sleep(seconds):
+            self.sut.cache.set(cache_key, cache.Spec(b'buzz'))
+
+        with patch('time.sleep', side_effect=sleep), \
+                patch.object(self, 'create') as mock:
+            spec = self.sut.get_or_set(('fizz',), self.create)
+
+        mock.assert_not_called()
+        self.assertEqual(b'buzz', spec.content)
+
+    def test_takes_over_expired_lease(self):
+        lease_key = self.sut.make_key(('fizz',)) + ':lease'
+        self.sut.cache.add(lease_key, 'other', 30)
+
+        def sleep(seconds):
+            self.sut.cache.delete(lease_key)
+
+        with patch('time.sleep', side_effect=sleep):
+            spec = self.sut.get_or_set(('fizz',), self.create)
+
+        self.assertEqual(b'fizz', spec.content)
+
+    def test_renders_one_at_a_time_across_threads(self):
+        # The lease serializes renders. Django < 1.11's locmem backend may
+        # lose a value set while another thread misses it, so the number
+        # of renders is not asserted.
+        active, overlaps, results = [], [], []
+
+        def create():
+            active.append(None)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return cache.Spec(b'fizz')
+
+        def get():
+            results.append(self.sut.get_or_set(('fizz',), create))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([1], sorted(set(overlaps)))
+        self.assertEqual(8 * [b'fizz'], [spec.content for spec in results])
+
+
+class TestFileBasedSharedSpecCache(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(
+            CACHES={
+                'default': {
+                    'BACKEND':
+                        'django.core.cache.backends.filebased.FileBasedCache',
+                    'LOCATION': directory,
+                },
+            },
+            SWAGGER_SETTINGS={'CACHE': 'default'}
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.sut = cache.SharedSpecCache()
+
+    def test_get_or_set(self):
+        spec = cache.SpecTemplate(b'{"host": ', b'}')
+        self.sut.get_or_set(('fizz',), lambda: spec)
+        result = self.sut.get_or_set(('fizz',), lambda: None)
+
+        self.assertEqual(spec.prefix, result.prefix)
+        self.assertEqual(spec.digest, result.digest)
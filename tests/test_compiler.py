@@ -0,0 +1,66 @@
+import coreapi
+from django.test import TestCase
+from openapi_codec import OpenAPICodec
+import simplejson as json
+from rest_framework_swagger import compiler
+
+from .fixtures import get_document, load_json
+
+
+class TestGenerateSwaggerObject(TestCase):
+    def setUp(self):
+        self.document = get_document()
+
+    def test_matches_golden_file(self):
+        result = compiler.generate_swagger_object(self.document)
+
+        self.assertEqual(load_json('openapi.json'), result)
+
+    def test_matches_codec(self):
+        """
+        The compiled specification should be identical to a round trip
+        through the OpenAPICodec.
+        """
+        expected = json.loads(OpenAPICodec().dump(self.document))
+        result = compiler.generate_swagger_object(self.document)
+
+        self.assertEqual(expected, result)
+
+    def test_matches_codec_for_empty_document(self):
+        document = coreapi.Document()
+        expected = json.loads(OpenAPICodec().dump(document))
+        result = compiler.generate_swagger_object(document)
+
+        self.assertEqual(expected, result)
+
+    def test_does_not_share_mutable_state_with_document(self):
+        result = compiler.generate_swagger_object(self.document)
+        result['tags'][0]['name'] = 'changed'
+        result['definitions']['User']['type'] = 'changed'
+
+        self.assertEqual('snippets', self.document.tags[0]['name'])
+        self.assertEqual('object', self.document.definitions['User']['type'])
+
+    def test_path_items_match_paths_object(self):
+        expected = compiler.generate_swagger_object(self.document)
+        root = compiler.generate_swagger_root(self.document)
+        path_items = list(compiler.iter_path_items(self.document))
+
+        self.assertEqual(list(expected['paths'].items()), path_items)
+        self.assertEqual({}, root['paths'])
+        expected['paths'] = {}
+        self.assertEqual(expected, root)
+
+    def test_non_string_keys_are_converted(self):
+        result = compiler._to_primitive({
+            2: 'a', 1.5: 'b', True: 'c', None: 'd'
+        })
+
+        self.assertEqual(
+            {'2': 'a', '1.5': 'b', 'true': 'c', 'null': 'd'},
+            result
+        )
+
+    def test_unsupported_keys_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            compiler._to_primitive({(1, 2): 'a'})
@@ -0,0 +1,83 @@
+import gzip
+import io
+
+from django.test import TestCase
+from rest_framework_swagger import compression
+
+from .compat.mock import MagicMock, patch
+
+
+class TestGetAvailableEncodings(TestCase):
+    @patch.object(compression, 'brotli', None)
+    def test_without_brotli(self):
+        self.assertEqual(['gzip'], compression.get_available_encodings())
+
+    @patch.object(compression, 'brotli', MagicMock())
+    def test_with_brotli(self):
+        self.assertEqual(
+            ['br', 'gzip'],
+            compression.get_available_encodings()
+        )
+
+
+class TestCompress(TestCase):
+    def test_gzip(self):
+        result = compression.compress(b'fizz buzz', 'gzip')
+
+        with gzip.GzipFile(fileobj=io.BytesIO(result)) as f:
+            self.assertEqual(b'fizz buzz', f.read())
+
+    def test_gzip_is_reproducible(self):
+        self.assertEqual(
+            compression.compress(b'fizz buzz', 'gzip'),
+            compression.compress(b'fizz buzz', 'gzip')
+        )
+
+    @patch.object(compression, 'brotli')
+    def test_brotli(self, brotli_mock):
+        result = compression.compress(b'fizz buzz', 'br')
+
+        brotli_mock.compress.assert_called_once_with(b'fizz buzz')
+        self.assertEqual(brotli_mock.compress.return_value, result)
+
+    def test_unsupported_encoding(self):
+        with self.assertRaises(ValueError):
+            compression.compress(b'fizz buzz', 'deflate')
+
+
+class TestGetAcceptedEncoding(TestCase):
+    def setUp(self):
+        self.encodings = ['br', 'gzip']
+
+    def get(self, accept_encoding):
+        return compression.get_accepted_encoding(
+            accept_encoding,
+            self.encodings
+        )
+
+    def test_without_header(self):
+        self.assertIsNone(self.get(None))
+
+    def test_identity(self):
+        self.assertIsNone(self.get('identity'))
+
+    def test_single_encoding(self):
+        self.assertEqual('gzip', self.get('gzip'))
+
+    def test_server_preference_on_equal_quality(self):
+        self.assertEqual('br', self.get('gzip, deflate, br'))
+
+    def test_quality_values(self):
+        self.assertEqual('gzip', self.get('br;q=0.5, gzip;q=0.8'))
+
+    def test_zero_quality_is_not_acceptable(self):
+        self.assertIsNone(self.get('gzip;q=0, br;q=0'))
+
+    def test_wildcard(self):
+        self.assertEqual('br', self.get('*'))
+
+    def test_wildcard_does_not_override_explicit_quality(self):
+        self.assertEqual('gzip', self.get('br;q=0, *'))
+
+    def test_malformed_quality(self):
+        self.assertEqual('gzip', self.get('br;q=fizz, gzip'))
@@ -0,0 +1,150 @@
+import json
+
+from django.test import TestCase
+from rest_framework_swagger.compiler import generate_swagger_object
+from rest_framework_swagger.definitions import deduplicate_schemas
+
+from .fixtures import get_document
+
+
+def get_schema(title=None):
+    schema = {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'username': {'type': 'string'},
+            'email': {'type': 'string', 'format': 'email'},
+        }
+    }
+    if title is not None:
+        schema['title'] = title
+    return schema
+
+
+def get_operation(schema):
+    return {'responses': {'200': {'description': 'OK', 'schema': schema}}}
+
+
+class TestDeduplicateSchemas(TestCase):
+    def setUp(self):
+        self.spec = {
+            'paths': {
+                '/users/': {'get': get_operation(get_schema())},
+                '/admins/': {'get': get_operation(get_schema())},
+            }
+        }
+
+    def get_schema(self, path, method='get', status='200'):
+        return self.spec['paths'][path][method]['responses'][status]['schema']
+
+    def test_repeated_schemas_are_hoisted(self):
+        deduplicate_schemas(self.spec)
+        definitions = self.spec['definitions']
+        reference = {'$ref': '#/definitions/%s' % list(definitions)[0]}
+
+        self.assertEqual([get_schema()], list(definitions.values()))
+        self.assertEqual(reference, self.get_schema('/users/'))
+        self.assertEqual(reference, self.get_schema('/admins/'))
+
+    def test_name_is_content_hash(self):
+        deduplicate_schemas(self.spec)
+
+        self.assertRegexpMatches(
+            list(self.spec['definitions'])[0],
+            r'^Schema[0-9a-f]{8}$'
+        )
+
+    def test_name_is_title(self):
+        for path in ('/users/', '/admins/'):
+            self.spec['paths'][path]['get'] = get_operation(
+                get_schema('User')
+            )
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual(
+            {'$ref': '#/definitions/User'},
+            self.get_schema('/users/')
+        )
+
+    def test_title_of_other_definition_is_not_reused(self):
+        self.spec['definitions'] = {'User': {'type': 'string'}}
+        for path in ('/users/', '/admins/'):
+            self.spec['paths'][path]['get'] = get_operation(
+                get_schema('User')
+            )
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual({'type': 'string'}, self.spec['definitions']['User'])
+        self.assertNotEqual(
+            {'$ref': '#/definitions/User'},
+            self.get_schema('/users/')
+        )
+
+    def test_existing_definition_is_referred_to(self):
+        self.spec['definitions'] = {'User': get_schema()}
+        self.spec['paths']['/admins/'] = {'get': {'responses': {}}}
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual(
+            {'$ref': '#/definitions/User'},
+            self.get_schema('/users/')
+        )
+        self.assertEqual(['User'], list(self.spec['definitions']))
+
+    def test_unique_schemas_are_kept_inline(self):
+        self.spec['paths']['/admins/'] = {'get': {'responses': {}}}
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual(get_schema(), self.get_schema('/users/'))
+        self.assertNotIn('definitions', self.spec)
+
+    def test_small_schemas_are_kept_inline(self):
+        for path in ('/users/', '/admins/'):
+            self.spec['paths'][path]['get'] = get_operation(
+                {'type': 'string'}
+            )
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual({'type': 'string'}, self.get_schema('/users/'))
+
+    def test_nested_schemas_are_hoisted(self):
+        self.spec['paths']['/users/']['get'] = get_operation({
+            'type': 'array',
+            'items': get_schema()
+        })
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual(
+            {'type': 'array', 'items': self.get_schema('/admins/')},
+            self.get_schema('/users/')
+        )
+
+    def test_parameter_schemas_are_hoisted(self):
+        self.spec['paths']['/users/']['post'] = {
+            'parameters': [{'name': 'data', 'in': 'body',
+                            'schema': get_schema()}],
+            'responses': {}
+        }
+        deduplicate_schemas(self.spec)
+        parameter = self.spec['paths']['/users/']['post']['parameters'][0]
+
+        self.assertEqual(self.get_schema('/users/'), parameter['schema'])
+        self.assertEqual(1, len(self.spec['definitions']))
+
+    def test_shrinks_specification(self):
+        spec = generate_swagger_object(get_document())
+        for index in range(10):
+            spec['paths']['/users%d/' % index] = {
+                'get': get_operation(get_schema())
+            }
+        size = len(json.dumps(spec))
+        deduplicate_schemas(spec)
+
+        self.assertLess(len(json.dumps(spec)), size)
+
+    def test_is_deterministic(self):
+        first = json.loads(json.dumps(self.spec))
+        deduplicate_schemas(first)
+        deduplicate_schemas(self.spec)
+
+        self.assertEqual(first, self.spec)
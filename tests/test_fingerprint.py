@@ -0,0 +1,198 @@
+import coreapi
+from django.conf.urls import url
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import TestCase
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.schemas import SchemaGenerator
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from rest_framework_swagger import fingerprint
+
+from .compat.mock import patch
+from .fixtures import get_document
+
+
+def clone(document, **kwargs):
+    options = {
+        'url': document.url,
+        'title': document.title,
+        'content': dict(document.items()),
+        'tags': document.tags,
+        'definitions': document.definitions,
+    }
+    options.update(kwargs)
+    return coreapi.Document(**options)
+
+
+def with_link(document, **kwargs):
+    link = document['snippets']['list']
+    options = {
+        'url': link.url,
+        'action': link.action,
+        'summary': link.summary,
+        'description': link.description,
+        'fields': link.fields,
+        'responses': link.responses,
+    }
+    options.update(kwargs)
+    snippets = dict(document['snippets'].items())
+    snippets['list'] = coreapi.Link(**options)
+    content = dict(document.items())
+    content['snippets'] = snippets
+    return clone(document, content=content)
+
+
+class TestGetDocumentFingerprint(TestCase):
+    def setUp(self):
+        self.document = get_document()
+        self.expected = fingerprint.get_document_fingerprint(self.document)
+
+    def assertChanged(self, document):
+        self.assertNotEqual(
+            self.expected,
+            fingerprint.get_document_fingerprint(document)
+        )
+
+    def test_equal_documents_have_equal_fingerprints(self):
+        self.assertEqual(
+            self.expected,
+            fingerprint.get_document_fingerprint(get_document())
+        )
+
+    def test_fingerprint_is_stable(self):
+        self.assertEqual(
+            self.expected,
+            fingerprint.get_document_fingerprint(self.document)
+        )
+
+    def test_fingerprint_does_not_depend_on_key_order(self):
+        responses = self.document['snippets']['list'].responses
+        reordered = dict(reversed(list(responses.items())))
+        document = with_link(self.document, responses=reordered)
+
+        self.assertEqual(
+            self.expected,
+            fingerprint.get_document_fingerprint(document)
+        )
+
+    def test_title_changes_fingerprint(self):
+        self.assertChanged(clone(self.document, title='Fizz'))
+
+    def test_tags_change_fingerprint(self):
+        self.assertChanged(clone(self.document, tags=[{'name': 'fizz'}]))
+
+    def test_definitions_change_fingerprint(self):
+        self.assertChanged(clone(self.document, definitions={'Fizz': {}}))
+
+    def test_link_description_changes_fingerprint(self):
+        self.assertChanged(with_link(self.document, description='Fizz'))
+
+    def test_link_summary_changes_fingerprint(self):
+        self.assertChanged(with_link(self.document, summary='Fizz'))
+
+    def test_link_fields_change_fingerprint(self):
+        self.assertChanged(with_link(self.document, fields=['fizz']))
+
+    def test_link_responses_change_fingerprint(self):
+        self.assertChanged(with_link(self.document, responses={}))
+
+    def test_memoized_digest_is_reused(self):
+        document = get_document()
+        digest = fingerprint.get_document_fingerprint(document)
+        with patch.object(fingerprint, '_encode') as mock:
+            self.assertEqual(
+                digest,
+                fingerprint.get_document_fingerprint(document)
+            )
+
+        mock.assert_not_called()
+
+
+class TestGetNodeFingerprint(TestCase):
+    def test_digest_is_memoized_on_node(self):
+        link = coreapi.Link(url='/fizz/', action='get')
+        digest = fingerprint.get_node_fingerprint(link)
+
+        self.assertEqual(
+            digest,
+            getattr(link, fingerprint.MEMO_ATTRIBUTE)
+        )
+
+    def test_memoized_digest_is_reused(self):
+        link = coreapi.Link(url='/fizz/', action='get')
+        fingerprint.get_node_fingerprint(link)
+        with patch.object(fingerprint, '_encode') as mock:
+            fingerprint.get_node_fingerprint(link)
+
+        mock.assert_not_called()
+
+
+class PublicView(APIView):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request):
+        return Response()
+
+    def post(self, request):
+        return Response()
+
+
+class PrivateView(PublicView):
+    permission_classes = (IsAuthenticated,)
+
+
+class TestGetAccessFingerprint(TestCase):
+    def setUp(self):
+        self.generator = SchemaGenerator(patterns=[
+            url(r'^public/$', PublicView.as_view()),
+            url(r'^private/$', PrivateView.as_view()),
+        ])
+
+    def get_fingerprint(self, user):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=user)
+        return fingerprint.get_access_fingerprint(
+            self.generator,
+            APIView().initialize_request(request)
+        )
+
+    def get_paths(self, user):
+        # REST framework 3.5+ sorts the endpoints, 3.4 doesn't.
+        endpoints = fingerprint.get_endpoints(self.generator)
+        return sorted(
+            endpoints[index][:2] for index in self.get_fingerprint(user)
+        )
+
+    def test_lists_permitted_endpoints(self):
+        self.assertEqual(
+            [('/public/', 'GET'), ('/public/', 'POST')],
+            self.get_paths(AnonymousUser())
+        )
+        self.assertEqual(
+            [('/private/', 'GET'), ('/private/', 'POST'),
+             ('/public/', 'GET'), ('/public/', 'POST')],
+            self.get_paths(User(username='amy'))
+        )
+
+    def test_equal_access_gives_equal_fingerprints(self):
+        self.assertEqual(
+            self.get_fingerprint(User(username='amy')),
+            self.get_fingerprint(User(username='jerry'))
+        )
+
+    def test_endpoints_are_memoized_on_generator(self):
+        self.get_fingerprint(AnonymousUser())
+        endpoints = self.generator.endpoints
+        self.get_fingerprint(AnonymousUser())
+
+        self.assertIs(endpoints, self.generator.endpoints)
+
+    def test_endpoints_are_those_of_schema(self):
+        self.generator.get_schema()
+
+        self.assertEqual(
+            self.generator.endpoints,
+            fingerprint.get_endpoints(self.generator)
+        )
@@ -0,0 +1,155 @@
+import json
+
+from django.test import TestCase
+from rest_framework_swagger.compiler import generate_swagger_object
+from rest_framework_swagger.fragments import (
+    get_fragment, get_index, get_lite
+)
+
+from .fixtures import get_document
+
+
+class TestGetIndex(TestCase):
+    def setUp(self):
+        self.spec = generate_swagger_object(get_document())
+
+    def test_keeps_tags_and_summaries(self):
+        index = get_index(self.spec)
+
+        self.assertEqual(
+            {'tags': ['snippets'], 'summary': 'List snippets'},
+            index['paths']['/snippets/']['get']
+        )
+
+    def test_omits_definitions(self):
+        self.assertNotIn('definitions', get_index(self.spec))
+
+    def test_keeps_other_members(self):
+        index = get_index(self.spec)
+
+        for key in ('swagger', 'info', 'tags', 'host'):
+            self.assertEqual(self.spec[key], index[key])
+
+    def test_lists_every_operation(self):
+        index = get_index(self.spec)
+
+        self.assertEqual(
+            {path: set(operations) for path, operations in
+             self.spec['paths'].items()},
+            {path: set(operations) for path, operations in
+             index['paths'].items()}
+        )
+
+
+class TestGetFragment(TestCase):
+    def setUp(self):
+        self.spec = generate_swagger_object(get_document())
+
+    def test_holds_operations_of_tag(self):
+        fragment = get_fragment(self.spec, 'snippets')
+
+        self.assertEqual(
+            {'/snippets/': self.spec['paths']['/snippets/']},
+            fragment['paths']
+        )
+
+    def test_holds_referenced_definitions(self):
+        self.assertEqual(
+            {'User': self.spec['definitions']['User']},
+            get_fragment(self.spec, 'users')['definitions']
+        )
+
+    def test_omits_unreferenced_definitions(self):
+        self.assertEqual(
+            {},
+            get_fragment(self.spec, 'snippets')['definitions']
+        )
+
+    def test_holds_nested_references(self):
+        self.spec['definitions']['Group'] = {
+            'type': 'object',
+            'properties': {
+                'members': {
+                    'type': 'array',
+                    'items': {'$ref': '#/definitions/User'}
+                }
+            }
+        }
+        operation = self.spec['paths']['/users/{pk}/']['get']
+        operation['responses']['200']['schema'] = {
+            '$ref': '#/definitions/Group'
+        }
+
+        self.assertEqual(
+            {'Group', 'User'},
+            set(get_fragment(self.spec, 'users')['definitions'])
+        )
+
+    def test_untagged_operations_are_default(self):
+        self.spec['paths']['/'] = {'get': {'summary': 'Root'}}
+
+        self.assertEqual(
+            {'/': {'get': {'summary': 'Root'}}},
+            get_fragment(self.spec, 'default')['paths']
+        )
+
+    def test_unknown_tag(self):
+        self.assertEqual(
+            {'paths': {}, 'definitions': {}},
+            get_fragment(self.spec, 'kramerica')
+        )
+
+
+class TestGetLite(TestCase):
+    def setUp(self):
+        self.spec = generate_swagger_object(get_document())
+        self.spec['info']['description'] = 'Snippets and their users.'
+
+    def test_keeps_summaries_and_parameters(self):
+        lite = get_lite(self.spec)
+
+        self.assertEqual(
+            {
+                'tags': ['snippets'],
+                'summary': 'List snippets',
+                'parameters': [{
+                    'name': 'page',
+                    'in': 'query',
+                    'required': False,
+                    'type': 'integer'
+                }]
+            },
+            lite['paths']['/snippets/']['get']
+        )
+
+    def test_omits_parameter_schemas(self):
+        operation = self.spec['paths']['/snippets/']['post']
+        operation['parameters'][0]['schema'] = {'type': 'string'}
+        lite = get_lite(self.spec)
+
+        self.assertEqual(
+            {'name': 'code', 'in': 'formData', 'required': True,
+             'type': 'string'},
+            lite['paths']['/snippets/']['post']['parameters'][0]
+        )
+
+    def test_omits_descriptions(self):
+        lite = get_lite(self.spec)
+
+        self.assertNotIn('description', lite['info'])
+        self.assertEqual(
+            [{'name': 'snippets'}, {'name': 'users'}],
+            lite['tags']
+        )
+
+    def test_omits_definitions_and_responses(self):
+        lite = get_lite(self.spec)
+
+        self.assertNotIn('definitions', lite)
+        self.assertNotIn('responses', lite['paths']['/users/{pk}/']['get'])
+
+    def test_is_smaller(self):
+        self.assertLess(
+            len(json.dumps(get_lite(self.spec))),
+            len(json.dumps(self.spec)) / 2
+        )
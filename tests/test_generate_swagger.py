@@ -0,0 +1,137 @@
+import json
+import os
+import shutil
+import tempfile
+import zlib
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings, TestCase
+from django.utils.six import StringIO
+from rest_framework_swagger.management.commands import generate_swagger
+
+from .compat.mock import patch
+
+
+@override_settings(ROOT_URLCONF='tests.urls')
+class TestGenerateSwagger(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def call(self, *args, **options):
+        call_command(
+            'generate_swagger',
+            self.directory,
+            *args,
+            stdout=StringIO(),
+            **options
+        )
+        return self.read_json('manifest.json')
+
+    def read(self, name):
+        with open(os.path.join(self.directory, name), 'rb') as f:
+            return f.read()
+
+    def read_json(self, name):
+        return json.loads(self.read(name).decode('utf-8'))
+
+    def test_writes_hashed_specification(self):
+        manifest = self.call(url='/swagger/')
+        name = manifest['spec']['name']
+        spec = self.read_json(name)
+
+        self.assertRegexpMatches(name, r'^openapi\.[0-9a-f]{12}\.json$')
+        self.assertIn('/snippets/', spec['paths'])
+        self.assertTrue(
+            manifest['spec']['etag'].startswith('"%s' % name[8:20])
+        )
+
+    def test_writes_compressed_variants(self):
+        manifest = self.call(url='/swagger/')
+        spec = manifest['spec']
+        variants = dict(spec['encodings'])
+
+        self.assertEqual(
+            self.read(spec['name']),
+            zlib.decompress(self.read(variants['gzip']), 16 + zlib.MAX_WBITS)
+        )
+
+    def test_writes_index(self):
+        manifest = self.call(url='/swagger/')
+        index = self.read('index.html').decode('utf-8')
+
+        self.assertIn('"url": "%s"' % manifest['spec']['name'], index)
+        self.assertNotIn('csrfmiddlewaretoken', index)
+
+    def test_index_loads_whole_specification(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_SPLIT',
+            True
+        ):
+            self.call(url='/swagger/')
+
+        self.assertNotIn('splitSpec', self.read('index.html').decode('utf-8'))
+
+    def test_generator(self):
+        manifest = self.call(generator='tests.test_warmup.Generator')
+        spec = self.read_json(manifest['spec']['name'])
+
+        self.assertEqual('Pastebin API', spec['info']['title'])
+
+    def test_specification_has_no_host(self):
+        manifest = self.call(url='/swagger/')
+
+        self.assertNotIn('host', self.read_json(manifest['spec']['name']))
+
+    def test_host(self):
+        manifest = self.call(url='/swagger/', host='kramerica.org')
+        spec = self.read_json(manifest['spec']['name'])
+
+        self.assertEqual('kramerica.org', spec['host'])
+
+    def test_output_defaults_to_setting(self):
+        with override_settings(
+            SWAGGER_SETTINGS={'ARTIFACTS_DIR': self.directory}
+        ):
+            call_command(
+                'generate_swagger',
+                url='/swagger/',
+                stdout=StringIO()
+            )
+
+        self.assertTrue(
+            os.path.exists(os.path.join(self.directory, 'manifest.json'))
+        )
+
+    def test_output_is_required(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_swagger', url='/swagger/')
+
+    def test_missing_view(self):
+        with self.assertRaises(CommandError):
+            self.call(url='/missing/')
+
+    def test_failing_view(self):
+        schema_patcher = patch(
+            'rest_framework_swagger.views.SwaggerSchemaView.get_schema',
+            return_value=None
+        )
+        with schema_patcher, self.assertRaises(CommandError):
+            self.call(url='/swagger/')
+
+
+class TestWrite(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_write_replaces_file(self):
+        path = os.path.join(self.directory, 'fizz')
+        generate_swagger.write(self.directory, 'fizz', b'buzz')
+        inode = os.stat(path).st_ino
+        generate_swagger.write(self.directory, 'fizz', b'foo')
+
+        self.assertNotEqual(inode, os.stat(path).st_ino)
+        self.assertEqual(['fizz'], os.listdir(self.directory))
@@ -0,0 +1,122 @@
+import unittest
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from rest_framework_swagger import json_backends
+from rest_framework_swagger.renderers import OpenAPIRenderer
+
+from .compat.mock import patch
+
+
+def is_installed(name):
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+class BackendTestMixin(object):
+    # Each test case sets the `backend_class` it tests.
+    data = {'paths': {'/fizz/': {'get': {'tags': ['buzz']}}}}
+
+    def test_loads_dumps_round_trip(self):
+        sut = self.backend_class()
+
+        self.assertEqual(self.data, sut.loads(sut.dumps(self.data)))
+
+    def test_compact_separators(self):
+        sut = self.backend_class(compact=True)
+
+        self.assertEqual(',', sut.item_separator)
+        self.assertEqual(':', sut.key_separator)
+        self.assertNotIn(b' ', self.dumps(sut))
+
+    def dumps(self, backend):
+        content = backend.dumps(self.data)
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        return content
+
+
+class TestSimpleJSONBackend(BackendTestMixin, TestCase):
+    backend_class = json_backends.SimpleJSONBackend
+    library = 'simplejson'
+
+    def test_verbose_separators(self):
+        sut = self.backend_class()
+
+        self.assertEqual(', ', sut.item_separator)
+        self.assertEqual(': ', sut.key_separator)
+        self.assertIn(b': ', self.dumps(sut))
+
+    def test_dumps_uses_library(self):
+        with patch('%s.dumps' % self.library) as mock:
+            result = self.backend_class().dumps(self.data)
+
+        mock.assert_called_once_with(self.data)
+        self.assertEqual(mock.return_value, result)
+
+
+class TestStdlibJSONBackend(TestSimpleJSONBackend):
+    backend_class = json_backends.StdlibJSONBackend
+    library = 'json'
+
+
+@unittest.skipUnless(is_installed('ujson'), 'ujson is not installed')
+class TestUJSONBackend(BackendTestMixin, TestCase):
+    backend_class = json_backends.UJSONBackend
+
+    def test_always_compact(self):
+        self.assertTrue(self.backend_class().compact)
+
+    def test_does_not_escape_forward_slashes(self):
+        self.assertIn(b'"/fizz/"', self.dumps(self.backend_class()))
+
+
+@unittest.skipUnless(is_installed('orjson'), 'orjson is not installed')
+class TestOrjsonBackend(BackendTestMixin, TestCase):
+    backend_class = json_backends.OrjsonBackend
+
+    def test_always_compact(self):
+        self.assertTrue(self.backend_class().compact)
+
+    def test_non_string_keys(self):
+        result = self.backend_class().dumps({200: 'OK'})
+
+        self.assertEqual(b'{"200":"OK"}', result)
+
+
+class TestMissingBackend(TestCase):
+    def test_raises_improperly_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            json_backends._import('rest_framework_swagger_missing')
+
+
+class TestRendererBackend(TestCase):
+    def setUp(self):
+        self.sut = OpenAPIRenderer()
+        self.data = {
+            'swagger': '2.0',
+            'paths': {'/fizz/': {'get': {}}, '/buzz/': {'get': {}}},
+        }
+
+        settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+        )
+        self.swagger_settings = settings_patcher.start()
+        self.swagger_settings.JSON_BACKEND = json_backends.StdlibJSONBackend
+        self.swagger_settings.COMPACT_JSON = True
+        self.addCleanup(settings_patcher.stop)
+
+    def test_dump_uses_backend(self):
+        self.assertEqual(
+            b'{"swagger":"2.0"}',
+            self.sut.dump({'swagger': '2.0'})
+        )
+
+    def test_iterdump_uses_backend_separators(self):
+        self.assertEqual(
+            self.sut.dump(self.data),
+            b''.join(self.sut.iterdump(self.data))
+        )
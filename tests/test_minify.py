@@ -0,0 +1,126 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+from django.test import TestCase
+from rest_framework_swagger.compiler import generate_swagger_object
+from rest_framework_swagger.minify import minify
+
+from .fixtures import get_document
+
+
+class TestMinify(TestCase):
+    def setUp(self):
+        self.spec = generate_swagger_object(get_document())
+
+    def test_drops_empty_members(self):
+        minify(self.spec)
+        operation = self.spec['paths']['/snippets/']['post']
+
+        self.assertNotIn('description', operation)
+        self.assertNotIn('summary', operation)
+        self.assertEqual(
+            {'in': '', 'name': 'title'},
+            operation['parameters'][1]
+        )
+
+    def test_drops_default_members(self):
+        minify(self.spec)
+        parameter = self.spec['paths']['/snippets/']['get']['parameters'][0]
+
+        self.assertNotIn('required', parameter)
+        self.assertEqual(
+            True,
+            self.spec['paths']['/snippets/']['post']['parameters'][0][
+                'required'
+            ]
+        )
+
+    def test_keeps_required_members(self):
+        minify(self.spec)
+
+        self.assertEqual({'title': 'Pastebin API', 'version': ''},
+                         self.spec['info'])
+
+    def test_keeps_empty_operations(self):
+        self.spec['paths']['/'] = {'get': {'description': ''}}
+        minify(self.spec)
+
+        self.assertEqual({'get': {}}, self.spec['paths']['/'])
+
+    def test_keeps_empty_responses(self):
+        operation = self.spec['paths']['/snippets/']['get']
+        operation['responses'] = {}
+        minify(self.spec)
+
+        self.assertEqual({}, operation['responses'])
+
+    def test_keeps_named_entries(self):
+        self.spec['definitions']['Any'] = {}
+        self.spec['definitions']['User']['properties']['description'] = {
+            'type': 'string'
+        }
+        minify(self.spec, strip_descriptions=True)
+
+        self.assertEqual({}, self.spec['definitions']['Any'])
+        self.assertIn(
+            'description',
+            self.spec['definitions']['User']['properties']
+        )
+
+    def test_keeps_values(self):
+        schema = {
+            'type': 'string',
+            'default': '',
+            'enum': ['', 'a'],
+            'x-empty': [],
+        }
+        self.spec['definitions']['Letter'] = schema
+        minify(self.spec)
+
+        self.assertEqual(schema, self.spec['definitions']['Letter'])
+
+    def test_keeps_meaningful_empty_members(self):
+        operation = self.spec['paths']['/snippets/']['get']
+        operation['security'] = []
+        operation['responses']['200']['schema'] = {}
+        minify(self.spec)
+
+        self.assertEqual([], operation['security'])
+        self.assertEqual({}, operation['responses']['200']['schema'])
+
+    def test_zero_is_not_a_default(self):
+        schema = {'type': 'integer', 'minimum': 0, 'exclusiveMinimum': 0}
+        self.spec['definitions']['Count'] = schema
+        minify(self.spec)
+
+        self.assertEqual(0, schema['exclusiveMinimum'])
+
+    def test_keeps_descriptions_by_default(self):
+        minify(self.spec)
+
+        self.assertEqual(
+            'Returns every snippet.',
+            self.spec['paths']['/snippets/']['get']['description']
+        )
+
+    def test_strips_descriptions(self):
+        minify(self.spec, strip_descriptions=True)
+
+        self.assertNotIn(
+            'description',
+            self.spec['paths']['/snippets/']['get']
+        )
+        self.assertEqual(
+            [{'name': 'snippets'}, {'name': 'users'}],
+            self.spec['tags']
+        )
+
+    def test_does_not_modify_security_definitions(self):
+        security_definitions = {'basic': {'type': 'basic', 'description': ''}}
+        self.spec['securityDefinitions'] = security_definitions
+        minify(self.spec, strip_descriptions=True)
+
+        self.assertEqual(
+            {'basic': {'type': 'basic', 'description': ''}},
+            security_definitions
+        )
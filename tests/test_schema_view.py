@@ -0,0 +1,422 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from django.conf.urls import url
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import override_settings, TestCase
+from rest_framework.response import Response
+from rest_framework.schemas import SchemaGenerator
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from rest_framework_swagger import views
+from rest_framework_swagger.cache import document_cache, spec_cache
+from rest_framework_swagger.renderers import (
+    OpenAPILiteRenderer, OpenAPIRenderer, SwaggerUIRenderer
+)
+
+from .compat.mock import patch
+from .fixtures import get_document
+
+
+class SnippetView(APIView):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request):
+        return Response()
+
+
+class SwaggerSchemaView(views.SwaggerSchemaView):
+    authentication_classes = ()
+    permission_classes = ()
+    title = 'Pastebin API'
+    patterns = [url(r'^snippets/$', SnippetView.as_view())]
+
+
+class TestSwaggerSchemaView(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = SwaggerSchemaView.as_view()
+        document_cache.clear()
+        self.addCleanup(document_cache.clear)
+
+    def get(self, view=None, **kwargs):
+        view = view or self.view
+        request = self.factory.get('/', HTTP_ACCEPT=OpenAPIRenderer.media_type)
+        response = view(request, **kwargs)
+        response.render()
+        return response
+
+    def get_generate_schema_args(self, view=None, **kwargs):
+        document_cache.clear()
+        with patch.object(SwaggerSchemaView, 'generate_schema') as mock:
+            mock.return_value = get_document()
+            self.get(view, **kwargs)
+        return mock.call_args[0]
+
+    def test_renders_specification(self):
+        response = self.get()
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn(b'/snippets/', response.content)
+
+    def test_negotiates_swagger_ui(self):
+        response = self.view(self.factory.get('/'))
+
+        self.assertIsInstance(response.accepted_renderer, SwaggerUIRenderer)
+
+    def test_negotiates_specification(self):
+        response = self.get()
+
+        self.assertIs(OpenAPIRenderer, type(response.accepted_renderer))
+
+    def test_renders_lite_specification(self):
+        response = self.view(self.factory.get('/?format=openapi-lite'))
+        response.render()
+        spec = json.loads(response.content.decode('utf-8'))
+
+        self.assertIsInstance(response.accepted_renderer, OpenAPILiteRenderer)
+        self.assertEqual(['get'], list(spec['paths']['/snippets/']))
+        self.assertNotIn('responses', spec['paths']['/snippets/']['get'])
+
+    def test_schema_is_memoized(self):
+        self.get()
+        with patch.object(SwaggerSchemaView, 'generate_schema') as mock:
+            response = self.get()
+
+        mock.assert_not_called()
+        self.assertEqual(200, response.status_code)
+
+    def test_schema_expires_after_ttl(self):
+        view = SwaggerSchemaView.as_view(schema_ttl=60)
+        with patch('time.time', return_value=1000):
+            self.get(view)
+        with patch('time.time', return_value=1060), \
+                patch.object(SwaggerSchemaView, 'generate_schema') as mock:
+            mock.return_value = get_document()
+            self.get(view)
+
+        self.assertEqual(1, mock.call_count)
+
+    def test_schema_is_valid_within_ttl(self):
+        view = SwaggerSchemaView.as_view(schema_ttl=60)
+        with patch('time.time', return_value=1000):
+            self.get(view)
+        with patch('time.time', return_value=1059), \
+                patch.object(SwaggerSchemaView, 'generate_schema') as mock:
+            self.get(view)
+
+        mock.assert_not_called()
+
+    def test_ttl_defaults_to_setting(self):
+        with patch(
+            'rest_framework_swagger.views.swagger_settings.SCHEMA_CACHE_TTL',
+            30
+        ):
+            self.assertEqual(30, SwaggerSchemaView().get_ttl())
+
+    def test_new_patterns_invalidate_schema(self):
+        self.get()
+        patterns = list(SwaggerSchemaView.patterns)
+        view = SwaggerSchemaView.as_view(patterns=patterns)
+        with patch.object(SwaggerSchemaView, 'generate_schema') as mock:
+            mock.return_value = get_document()
+            self.get(view)
+
+        generator = mock.call_args[0][0]
+        self.assertIs(patterns, generator.patterns)
+
+    def test_reloaded_urlconf_replaces_schema(self):
+        view = SwaggerSchemaView.as_view(patterns=None, urlconf='tests.urls')
+        self.get(view)
+        with patch('tests.urls.urlpatterns', SwaggerSchemaView.patterns):
+            self.get(view)
+
+        # The schema and the generator of the reloaded urlconf.
+        self.assertEqual(2, len(document_cache))
+
+    def test_generator_is_memoized(self):
+        self.get()
+        with patch.object(SwaggerSchemaView, 'generator_class') as mock:
+            self.get(SwaggerSchemaView.as_view(schema_ttl=0))
+
+        mock.assert_not_called()
+
+    def test_generator_class_is_imported_from_dotted_path(self):
+        generator = self.get_generate_schema_args()[0]
+
+        self.assertEqual(
+            'rest_framework.schemas.SchemaGenerator',
+            views.SwaggerSchemaView.generator_class
+        )
+        self.assertIsInstance(generator, SchemaGenerator)
+
+    def test_schema_lists_every_endpoint(self):
+        request = self.get_generate_schema_args()[1]
+
+        self.assertIsNone(request)
+
+    def test_settings_reload_invalidates_schema(self):
+        self.get()
+        with override_settings(SWAGGER_SETTINGS={}):
+            self.assertEqual(0, len(document_cache))
+
+    def test_urlconf_reload_invalidates_schema(self):
+        self.get()
+        with override_settings(ROOT_URLCONF='tests.urls'):
+            self.assertEqual(0, len(document_cache))
+
+    def test_empty_schema_is_forbidden(self):
+        view = SwaggerSchemaView.as_view(patterns=[])
+        response = self.get(view)
+
+        self.assertEqual(403, response.status_code)
+
+
+class PrivateSnippetView(SnippetView):
+    permission_classes = (IsAuthenticated,)
+
+
+class PermissionSchemaView(SwaggerSchemaView):
+    filter_by_permissions = True
+    patterns = [
+        url(r'^snippets/$', SnippetView.as_view()),
+        url(r'^private/$', PrivateSnippetView.as_view()),
+    ]
+
+
+class TestPermissionAwareSchema(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = PermissionSchemaView.as_view()
+        document_cache.clear()
+        self.addCleanup(document_cache.clear)
+
+    def get(self, user=None):
+        request = self.factory.get('/', HTTP_ACCEPT=OpenAPIRenderer.media_type)
+        force_authenticate(request, user=user or AnonymousUser())
+        response = self.view(request)
+        response.render()
+        return response
+
+    def test_schema_is_filtered_by_permissions(self):
+        anonymous = self.get()
+        authenticated = self.get(User(username='amy'))
+
+        self.assertNotIn(b'/private/', anonymous.content)
+        self.assertIn(b'/private/', authenticated.content)
+
+    def test_users_with_same_access_share_schema(self):
+        self.get(User(username='amy'))
+        with patch.object(PermissionSchemaView, 'generate_schema') as mock:
+            self.get(User(username='jerry'))
+            self.get(User(username='elaine'))
+
+        mock.assert_not_called()
+
+    def test_one_schema_per_access_fingerprint(self):
+        self.get()
+        self.get(User(username='amy'))
+        self.get(User(username='jerry'))
+        self.get()
+
+        # The generator and the anonymous and authenticated schemas.
+        self.assertEqual(3, len(document_cache))
+
+
+class TestConcurrentSchemaRequests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        document_cache.clear()
+        self.addCleanup(document_cache.clear)
+        self.builds = []
+
+        generate_schema = SwaggerSchemaView.generate_schema
+
+        def slow_generate_schema(view, generator, request=None):
+            self.builds.append(None)
+            time.sleep(0.05)
+            return generate_schema(view, generator, request)
+
+        patcher = patch.object(
+            SwaggerSchemaView,
+            'generate_schema',
+            slow_generate_schema
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def hammer(self, view, count=16):
+        """
+        Requests the specification from `count` threads at once.
+        """
+        responses = []
+
+        def get():
+            request = self.factory.get(
+                '/',
+                HTTP_ACCEPT=OpenAPIRenderer.media_type
+            )
+            response = view(request)
+            response.render()
+            responses.append(response)
+
+        threads = [threading.Thread(target=get) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return responses
+
+    def wait_for_revalidation(self, timeout=5):
+        """
+        Waits for the background thread to store a fresh schema.
+        """
+        patterns = SwaggerSchemaView.patterns
+        key = SwaggerSchemaView().get_schema_cache_key(None)
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            schema, expired = document_cache.get_entry(key, patterns)
+            if not expired:
+                return schema
+            time.sleep(0.01)
+
+    def test_missing_schema_is_built_once(self):
+        responses = self.hammer(SwaggerSchemaView.as_view())
+
+        self.assertEqual(1, len(self.builds))
+        self.assertEqual(
+            [200], sorted(set(r.status_code for r in responses))
+        )
+        self.assertEqual(1, len(set(r.content for r in responses)))
+
+    def test_expired_schema_is_built_once(self):
+        view = SwaggerSchemaView.as_view(schema_ttl=60)
+        with patch('time.time', return_value=1000):
+            self.hammer(view, count=1)
+
+        responses = self.hammer(view)
+
+        self.assertEqual(2, len(self.builds))
+        self.assertEqual(16, len(responses))
+
+    @patch(
+        'rest_framework_swagger.views.swagger_settings'
+        '.STALE_WHILE_REVALIDATE',
+        True
+    )
+    def test_expired_schema_is_served_stale(self):
+        view = SwaggerSchemaView.as_view(schema_ttl=60)
+        with patch('time.time', return_value=1000):
+            expected = self.hammer(view, count=1)[0].content
+
+        responses = self.hammer(view)
+        self.wait_for_revalidation()
+
+        self.assertEqual(
+            [expected], list(set(r.content for r in responses))
+        )
+        self.assertEqual(2, len(self.builds))
+
+    @patch(
+        'rest_framework_swagger.views.swagger_settings'
+        '.STALE_WHILE_REVALIDATE',
+        True
+    )
+    def test_revalidation_refreshes_schema(self):
+        view = SwaggerSchemaView.as_view(schema_ttl=60)
+        with patch('time.time', return_value=1000):
+            self.hammer(view, count=1)
+
+        self.hammer(view, count=1)
+
+        self.assertIsNotNone(self.wait_for_revalidation())
+
+    def test_spec_is_rendered_once(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_CACHE',
+            True
+        ), patch.object(
+            OpenAPIRenderer,
+            'create_spec_template',
+            autospec=True,
+            side_effect=OpenAPIRenderer.create_spec_template
+        ) as mock:
+            spec_cache.clear()
+            self.addCleanup(spec_cache.clear)
+            responses = self.hammer(SwaggerSchemaView.as_view())
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(1, len(set(r.content for r in responses)))
+
+
+class StreamingSwaggerSchemaView(views.StreamingSpecMixin,
+                                 SwaggerSchemaView):
+    pass
+
+
+class TestStreamingSchemaView(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = StreamingSwaggerSchemaView.as_view()
+        document_cache.clear()
+        self.addCleanup(document_cache.clear)
+
+        settings_patcher = patch(
+            'rest_framework_swagger.views.swagger_settings.SPEC_STREAMING',
+            True
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+    def get(self):
+        request = self.factory.get('/', HTTP_ACCEPT=OpenAPIRenderer.media_type)
+        return self.view(request)
+
+    def test_specification_is_not_encoded_whole(self):
+        with patch.object(OpenAPIRenderer, 'get_spec') as mock:
+            response = self.get()
+            content = b''.join(response.streaming_content)
+
+        mock.assert_not_called()
+        self.assertIn(b'/snippets/', content)
+
+    def test_sets_cache_control(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_CACHE_CONTROL',
+            {'max_age': 60}
+        ):
+            response = self.get()
+
+        self.assertEqual('max-age=60', response['Cache-Control'])
+
+    @override_settings(SWAGGER_SETTINGS={'TIMING': True})
+    def test_adds_server_timing(self):
+        response = self.get()
+
+        self.assertIn('schema;dur=', response['Server-Timing'])
+
+
+class TestImports(TestCase):
+    def test_defers_heavy_dependencies(self):
+        # Django REST framework is imported by the urlconf first.
+        code = (
+            'import sys, django; django.setup(); '
+            'import rest_framework.renderers, rest_framework.views; '
+            'before = set(sys.modules); '
+            'import rest_framework_swagger.views; '
+            'print(sorted(m for m in ("openapi_codec", "django.shortcuts", '
+            '"rest_framework.schemas") if m in set(sys.modules) - before))'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='tests.settings')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+
+        self.assertEqual(b'[]', output.strip())
@@ -1,10 +1,11 @@
 from django.test import override_settings, TestCase
 from rest_framework_swagger import settings
+from rest_framework_swagger.json_backends import SimpleJSONBackend
 
 
 class TestSettings(TestCase):
     def test_import_string(self):
-        self.assertEqual([], settings.IMPORT_STRINGS)
+        self.assertEqual(['JSON_BACKEND'], settings.IMPORT_STRINGS)
 
     @override_settings(SWAGGER_SETTINGS={'SECURITY_DEFINITIONS': None})
     def test_settings_when_none(self):
@@ -46,3 +47,90 @@ class TestDefaults(TestCase):
 
     def test_doc_expansion(self):
         self.assertIsNone(self.sut.DOC_EXPANSION)
+
+    def test_use_openapi_codec(self):
+        self.assertIs(False, self.sut.USE_OPENAPI_CODEC)
+
+    def test_spec_cache(self):
+        self.assertIs(False, self.sut.SPEC_CACHE)
+
+    def test_spec_compression(self):
+        self.assertIs(False, self.sut.SPEC_COMPRESSION)
+
+    def test_spec_streaming(self):
+        self.assertIs(False, self.sut.SPEC_STREAMING)
+
+    def test_spec_split(self):
+        self.assertIs(False, self.sut.SPEC_SPLIT)
+
+    def test_deduplicate_schemas(self):
+        self.assertIs(False, self.sut.DEDUPLICATE_SCHEMAS)
+
+    def test_minify(self):
+        self.assertIs(False, self.sut.MINIFY)
+
+    def test_ui_cache(self):
+        self.assertIs(False, self.sut.UI_CACHE)
+
+    def test_embed_spec(self):
+        self.assertIs(False, self.sut.EMBED_SPEC)
+
+    def test_use_bundle(self):
+        self.assertIs(False, self.sut.USE_BUNDLE)
+
+    def test_ui_cache_control(self):
+        self.assertIsNone(self.sut.UI_CACHE_CONTROL)
+
+    def test_spec_cache_control(self):
+        self.assertIsNone(self.sut.SPEC_CACHE_CONTROL)
+
+    def test_versioned_spec_url(self):
+        self.assertIs(False, self.sut.VERSIONED_SPEC_URL)
+
+    def test_versioned_spec_cache_control(self):
+        self.assertEqual(
+            {'public': True, 'max_age': 31536000, 'immutable': True},
+            self.sut.VERSIONED_SPEC_CACHE_CONTROL
+        )
+
+    def test_json_backend(self):
+        self.assertIs(SimpleJSONBackend, self.sut.JSON_BACKEND)
+
+    def test_compact_json(self):
+        self.assertIs(False, self.sut.COMPACT_JSON)
+
+    def test_timing(self):
+        self.assertIs(False, self.sut.TIMING)
+
+    def test_schema_cache_ttl(self):
+        self.assertIsNone(self.sut.SCHEMA_CACHE_TTL)
+
+    def test_schema_cache_max_entries(self):
+        self.assertEqual(64, self.sut.SCHEMA_CACHE_MAX_ENTRIES)
+
+    def test_stale_while_revalidate(self):
+        self.assertIs(False, self.sut.STALE_WHILE_REVALIDATE)
+
+    def test_cache(self):
+        self.assertIsNone(self.sut.CACHE)
+
+    def test_cache_timeout(self):
+        self.assertEqual(86400, self.sut.CACHE_TIMEOUT)
+
+    def test_cache_lease_timeout(self):
+        self.assertEqual(30, self.sut.CACHE_LEASE_TIMEOUT)
+
+    def test_warmup(self):
+        self.assertEqual([], self.sut.WARMUP)
+
+    def test_warmup_workers(self):
+        self.assertEqual(1, self.sut.WARMUP_WORKERS)
+
+    def test_warmup_executor(self):
+        self.assertEqual('thread', self.sut.WARMUP_EXECUTOR)
+
+    def test_warmup_raise(self):
+        self.assertIs(False, self.sut.WARMUP_RAISE)
+
+    def test_artifacts_dir(self):
+        self.assertIsNone(self.sut.ARTIFACTS_DIR)
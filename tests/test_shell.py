@@ -0,0 +1,73 @@
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import RequestFactory, TestCase
+from rest_framework_swagger.shell import (
+    is_authenticated, PLACEHOLDER, Shell, ShellUser
+)
+
+from .compat.mock import MagicMock
+
+
+class TestShell(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/docs/<x>/')
+        self.request.user = User(username='"kramer"')
+
+    def test_fills_in_fields(self):
+        sut = Shell(u'<a href="%s">%s</a>' % (
+            PLACEHOLDER % 'path', PLACEHOLDER % 'user'
+        ))
+
+        self.assertEqual(
+            u'<a href="/docs/&lt;x&gt;/">&quot;kramer&quot;</a>',
+            sut.render(self.request)
+        )
+
+    def test_fills_in_repeated_fields(self):
+        sut = Shell(u'%s|%s' % (PLACEHOLDER % 'path', PLACEHOLDER % 'path'))
+
+        self.assertEqual(
+            u'/docs/&lt;x&gt;/|/docs/&lt;x&gt;/',
+            sut.render(self.request)
+        )
+
+    def test_csrf_token_is_only_generated_when_used(self):
+        Shell(u'page').render(self.request)
+
+        self.assertNotIn('CSRF_COOKIE', self.request.META)
+
+    def test_csrf_token(self):
+        content = Shell(PLACEHOLDER % 'csrf_token').render(self.request)
+
+        self.assertEqual(64, len(content))
+        self.assertIn('CSRF_COOKIE', self.request.META)
+
+    def test_inserts_values_as_they_are(self):
+        sut = Shell(PLACEHOLDER % 'spec')
+
+        self.assertEqual(
+            u'{"a": "<b>"}', sut.render(self.request, spec=u'{"a": "<b>"}')
+        )
+
+    def test_missing_value(self):
+        with self.assertRaises(ValueError):
+            Shell(PLACEHOLDER % 'spec').render(self.request)
+
+    def test_keeps_unknown_placeholders(self):
+        content = PLACEHOLDER % 'other'
+
+        self.assertEqual(content, Shell(content).render(self.request))
+
+
+class TestIsAuthenticated(TestCase):
+    def test_anonymous(self):
+        self.assertIs(False, is_authenticated(AnonymousUser()))
+
+    def test_authenticated(self):
+        self.assertIs(True, is_authenticated(User(username='kramer')))
+
+    def test_property(self):
+        self.assertIs(True, is_authenticated(MagicMock(is_authenticated=1)))
+
+    def test_shell_user(self):
+        self.assertIs(False, is_authenticated(ShellUser(False)))
+        self.assertEqual(PLACEHOLDER % 'user', str(ShellUser(True)))
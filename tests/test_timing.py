@@ -0,0 +1,116 @@
+from django.http import HttpResponse
+from django.test import override_settings, TestCase
+from rest_framework_swagger import timing
+from rest_framework_swagger.renderers import OpenAPIRenderer
+from rest_framework_swagger.signals import stage_timed
+
+from .compat.mock import MagicMock, patch
+from .fixtures import get_document
+
+
+class Request(object):
+    def get_host(self):
+        return 'kramerica.org'
+
+
+class TestTimedDisabled(TestCase):
+    def test_records_nothing(self):
+        request = Request()
+        with timing.timed(request, 'fizz'):
+            pass
+
+        self.assertFalse(hasattr(request, timing.TIMINGS_ATTRIBUTE))
+
+    def test_add_server_timing_does_nothing(self):
+        request, response = Request(), HttpResponse()
+        timing.record(request, 'fizz', 0.1)
+        timing.add_server_timing(request, response)
+
+        self.assertNotIn('Server-Timing', response)
+
+
+@override_settings(SWAGGER_SETTINGS={'TIMING': True})
+class TestTimed(TestCase):
+    def setUp(self):
+        self.request = Request()
+
+    def test_records_stage(self):
+        with patch('time.time', side_effect=[10, 10.5]):
+            with timing.timed(self.request, 'fizz'):
+                pass
+
+        self.assertEqual(
+            [('fizz', 0.5)],
+            timing.get_timings(self.request)
+        )
+
+    def test_records_stage_on_error(self):
+        with self.assertRaises(ValueError):
+            with timing.timed(self.request, 'fizz'):
+                raise ValueError
+
+        self.assertEqual(1, len(timing.get_timings(self.request)))
+
+    def test_without_request(self):
+        receiver = MagicMock()
+        stage_timed.connect(receiver)
+        self.addCleanup(stage_timed.disconnect, receiver)
+
+        with timing.timed(None, 'fizz'):
+            pass
+
+        receiver.assert_not_called()
+
+    def test_sends_signal(self):
+        receiver = MagicMock()
+        stage_timed.connect(receiver)
+        self.addCleanup(stage_timed.disconnect, receiver)
+
+        timing.record(self.request, 'fizz', 0.5)
+
+        receiver.assert_called_once_with(
+            signal=stage_timed,
+            sender=None,
+            stage='fizz',
+            duration=0.5,
+            request=self.request
+        )
+
+    def test_add_server_timing(self):
+        response = HttpResponse()
+        timing.record(self.request, 'fizz', 0.0015)
+        timing.record(self.request, 'buzz', 0.25)
+        timing.add_server_timing(self.request, response)
+
+        self.assertEqual(
+            'fizz;dur=1.500, buzz;dur=250.000',
+            response['Server-Timing']
+        )
+
+    def test_add_server_timing_appends_to_header(self):
+        response = HttpResponse()
+        response['Server-Timing'] = 'db;dur=1'
+        timing.record(self.request, 'fizz', 0.001)
+        timing.add_server_timing(self.request, response)
+
+        self.assertEqual(
+            'db;dur=1, fizz;dur=1.000',
+            response['Server-Timing']
+        )
+
+    def test_add_server_timing_without_timings(self):
+        response = HttpResponse()
+        timing.add_server_timing(self.request, response)
+
+        self.assertNotIn('Server-Timing', response)
+
+    def test_openapi_renderer_stages(self):
+        response = HttpResponse()
+        OpenAPIRenderer().render(get_document(), renderer_context={
+            'request': self.request,
+            'response': response
+        })
+
+        stages = [stage for stage, _ in timing.get_timings(self.request)]
+        self.assertEqual(['specification', 'customizations', 'json'], stages)
+        self.assertIn('json;dur=', response['Server-Timing'])
@@ -0,0 +1,438 @@
+import json
+import re
+
+from django.test import TestCase
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_swagger import views
+from rest_framework_swagger.cache import (
+    Spec, document_cache, spec_cache, ui_cache
+)
+from rest_framework_swagger.renderers import OpenAPIRenderer
+
+from .compat.mock import MagicMock, patch
+from .fixtures import get_document
+from .test_schema_view import PermissionSchemaView, SwaggerSchemaView
+
+
+EMBEDDED_SPEC_RE = re.compile(
+    r'<script id="drs-spec" type="application/json">(.*?)</script>', re.S
+)
+SPEC_VERSION_RE = re.compile(r'data-spec-version="([0-9a-f]+)"')
+
+
+class SchemaView(views.ConditionalSpecMixin, APIView):
+    authentication_classes = ()
+    permission_classes = ()
+    renderer_classes = (OpenAPIRenderer,)
+
+    def get(self, request):
+        return Response(get_document())
+
+
+class TestIsNotModified(TestCase):
+    def setUp(self):
+        self.spec = Spec(b'{}')
+        self.spec.last_modified = 1000
+
+    def get_request(self, **headers):
+        return MagicMock(META=headers)
+
+    def test_without_conditional_headers(self):
+        self.assertFalse(views.is_not_modified(self.get_request(), self.spec))
+
+    def test_if_none_match(self):
+        request = self.get_request(HTTP_IF_NONE_MATCH=self.spec.etag)
+
+        self.assertTrue(views.is_not_modified(request, self.spec))
+
+    def test_if_none_match_with_several_etags(self):
+        request = self.get_request(
+            HTTP_IF_NONE_MATCH='"fizz", %s' % self.spec.etag
+        )
+
+        self.assertTrue(views.is_not_modified(request, self.spec))
+
+    def test_if_none_match_mismatch(self):
+        request = self.get_request(HTTP_IF_NONE_MATCH='"fizz"')
+
+        self.assertFalse(views.is_not_modified(request, self.spec))
+
+    def test_if_none_match_takes_precedence(self):
+        request = self.get_request(
+            HTTP_IF_NONE_MATCH='"fizz"',
+            HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 1970 00:16:40 GMT'
+        )
+
+        self.assertFalse(views.is_not_modified(request, self.spec))
+
+    def test_if_modified_since(self):
+        request = self.get_request(
+            HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 1970 00:16:40 GMT'
+        )
+
+        self.assertTrue(views.is_not_modified(request, self.spec))
+
+    def test_if_modified_since_older(self):
+        request = self.get_request(
+            HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 1970 00:16:39 GMT'
+        )
+
+        self.assertFalse(views.is_not_modified(request, self.spec))
+
+
+class TestConditionalSpecMixin(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = SchemaView.as_view()
+        spec_cache.clear()
+        self.addCleanup(spec_cache.clear)
+
+        settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_CACHE',
+            True
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+    def get(self, **headers):
+        response = self.view(self.factory.get('/', **headers))
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def test_response_has_etag(self):
+        response = self.get()
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(Spec(response.content).etag, response['ETag'])
+        self.assertIn('Last-Modified', response)
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response['ETag'])
+        self.assertEqual(b'', response.content)
+
+    def test_matching_etag_does_not_render_specification(self):
+        etag = self.get()['ETag']
+        with patch.object(OpenAPIRenderer, 'render_specification') as mock:
+            self.get(HTTP_IF_NONE_MATCH=etag)
+
+        mock.assert_not_called()
+
+    def test_mismatching_etag_returns_specification(self):
+        response = self.get(HTTP_IF_NONE_MATCH='"fizz"')
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(b'', response.content)
+
+    def test_matching_etag_of_compressed_variant(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_COMPRESSION',
+            True
+        ):
+            etag = self.get(HTTP_ACCEPT_ENCODING='gzip')['ETag']
+            response = self.get(
+                HTTP_ACCEPT_ENCODING='gzip',
+                HTTP_IF_NONE_MATCH=etag
+            )
+            identity = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual('Accept-Encoding', response['Vary'])
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(200, identity.status_code)
+
+    def test_post_is_not_conditional(self):
+        etag = self.get()['ETag']
+        request = self.factory.post('/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(405, self.view(request).status_code)
+
+
+class StreamingSchemaView(views.StreamingSpecMixin, APIView):
+    authentication_classes = ()
+    permission_classes = ()
+    renderer_classes = (OpenAPIRenderer,)
+
+    def get(self, request):
+        return Response(get_document())
+
+
+class TestStreamingSpecMixin(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = StreamingSchemaView.as_view()
+
+        settings_patcher = patch(
+            'rest_framework_swagger.views.swagger_settings.SPEC_STREAMING',
+            True
+        )
+        self.settings = settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+    def test_streams_specification(self):
+        response = self.view(self.factory.get('/'))
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            'application/openapi+json',
+            response['Content-Type']
+        )
+
+    def test_streamed_content_matches_rendered_content(self):
+        request = self.factory.get('/')
+        content = b''.join(self.view(request).streaming_content)
+        with patch(
+            'rest_framework_swagger.views.swagger_settings.SPEC_STREAMING',
+            False
+        ):
+            response = self.view(request)
+            response.render()
+
+        self.assertEqual(response.content, content)
+
+    def test_preserves_headers(self):
+        response = self.view(self.factory.get('/'))
+
+        self.assertEqual('GET, HEAD, OPTIONS', response['Allow'])
+
+    def test_disabled(self):
+        with patch(
+            'rest_framework_swagger.views.swagger_settings.SPEC_STREAMING',
+            False
+        ):
+            response = self.view(self.factory.get('/'))
+
+        self.assertFalse(response.streaming)
+
+
+class TestEmbeddedSpec(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = SwaggerSchemaView.as_view()
+        for cache in (document_cache, spec_cache, ui_cache):
+            cache.clear()
+            self.addCleanup(cache.clear)
+
+        self.settings = {}
+        for name in ('EMBED_SPEC', 'SPEC_CACHE', 'SPEC_SPLIT', 'UI_CACHE'):
+            settings_patcher = patch(
+                'rest_framework_swagger.renderers.openapi.swagger_settings'
+                '.' + name,
+                name == 'EMBED_SPEC'
+            )
+            settings_patcher.start()
+            self.addCleanup(settings_patcher.stop)
+
+    def get(self, path='/', **headers):
+        response = self.view(self.factory.get(path, **headers))
+        response.render()
+        return response.content.decode('utf-8')
+
+    def get_embedded_spec(self, content):
+        match = EMBEDDED_SPEC_RE.search(content)
+        return match and json.loads(match.group(1))
+
+    def test_embeds_specification(self):
+        spec = self.get('/?format=openapi')
+
+        self.assertEqual(
+            json.loads(spec), self.get_embedded_spec(self.get())
+        )
+
+    def test_embeds_nothing_by_default(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.EMBED_SPEC',
+            False
+        ):
+            content = self.get()
+
+        self.assertIsNone(self.get_embedded_spec(content))
+
+    def test_embeds_index_with_spec_split(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_SPLIT',
+            True
+        ):
+            index = self.get('/?format=openapi&index')
+            spec = self.get_embedded_spec(self.get())
+
+        self.assertEqual(json.loads(index), spec)
+        self.assertNotIn('responses', spec['paths']['/snippets/']['get'])
+
+    def test_shares_spec_cache(self):
+        with patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_CACHE',
+            True
+        ), patch.object(
+            OpenAPIRenderer,
+            'get_openapi_specification',
+            wraps=OpenAPIRenderer().get_openapi_specification
+        ) as mock:
+            self.get()
+            self.get('/?format=openapi')
+
+        self.assertEqual(1, mock.call_count)
+
+    def test_embeds_specification_in_cached_page(self):
+        expected = self.get_embedded_spec(self.get())
+        with patch(
+            'rest_framework_swagger.renderers.ui.swagger_settings.UI_CACHE',
+            True
+        ):
+            content = self.get()
+
+        self.assertEqual(expected, self.get_embedded_spec(content))
+        self.assertNotIn('__rest_framework_swagger_', content)
+
+    def test_error_pages_embed_nothing(self):
+        with patch.object(SwaggerSchemaView, 'get_schema', return_value=None):
+            content = self.get()
+
+        self.assertIsNone(self.get_embedded_spec(content))
+
+
+class TestCacheControl(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = SwaggerSchemaView.as_view()
+        for cache in (document_cache, spec_cache, ui_cache):
+            cache.clear()
+            self.addCleanup(cache.clear)
+
+        self.patch_settings(
+            UI_CACHE_CONTROL=None,
+            SPEC_CACHE_CONTROL=None,
+            VERSIONED_SPEC_URL=False
+        )
+
+    def patch_settings(self, **settings):
+        for name, value in settings.items():
+            settings_patcher = patch(
+                'rest_framework_swagger.renderers.openapi.swagger_settings'
+                '.' + name,
+                value
+            )
+            settings_patcher.start()
+            self.addCleanup(settings_patcher.stop)
+
+    def get(self, path='/', view=None, **headers):
+        response = (view or self.view)(self.factory.get(path, **headers))
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def get_cache_control(self, response):
+        return set(
+            directive.strip()
+            for directive in response.get('Cache-Control', '').split(',')
+            if directive
+        )
+
+    def get_spec_version(self):
+        content = self.get().content.decode('utf-8')
+        return SPEC_VERSION_RE.search(content).group(1)
+
+    def test_no_policy_by_default(self):
+        self.assertNotIn('Cache-Control', self.get())
+        self.assertNotIn('Cache-Control', self.get('/?format=openapi'))
+
+    def test_spec_policy(self):
+        self.patch_settings(SPEC_CACHE_CONTROL={'public': True, 'max_age': 60})
+        response = self.get('/?format=openapi')
+
+        self.assertEqual(
+            {'public', 'max-age=60'}, self.get_cache_control(response)
+        )
+
+    def test_ui_policy(self):
+        self.patch_settings(UI_CACHE_CONTROL={'private': True, 'max_age': 60})
+        response = self.get()
+
+        self.assertEqual(
+            {'private', 'max-age=60'}, self.get_cache_control(response)
+        )
+
+    def get_vary(self, response):
+        return set(
+            header.strip() for header in response.get('Vary', '').split(',')
+        )
+
+    def test_page_has_no_version_by_default(self):
+        content = self.get().content.decode('utf-8')
+
+        self.assertIsNone(SPEC_VERSION_RE.search(content))
+
+    def test_versioned_url_is_immutable(self):
+        self.patch_settings(VERSIONED_SPEC_URL=True)
+        version = self.get_spec_version()
+        response = self.get('/?format=openapi&v=' + version)
+
+        self.assertEqual(
+            {'public', 'max-age=31536000', 'immutable'},
+            self.get_cache_control(response)
+        )
+
+    def test_outdated_version_uses_spec_policy(self):
+        self.patch_settings(
+            VERSIONED_SPEC_URL=True,
+            SPEC_CACHE_CONTROL={'no_cache': True}
+        )
+        response = self.get('/?format=openapi&v=0123456789ab')
+
+        self.assertEqual({'no-cache'}, self.get_cache_control(response))
+
+    def test_version_changes_with_settings(self):
+        self.patch_settings(VERSIONED_SPEC_URL=True)
+        version = self.get_spec_version()
+        self.patch_settings(MINIFY=True)
+
+        self.assertNotEqual(version, self.get_spec_version())
+
+    def test_version_changes_with_package_version(self):
+        self.patch_settings(VERSIONED_SPEC_URL=True)
+        version = self.get_spec_version()
+        with patch(
+            'rest_framework_swagger.renderers.openapi.__version__', '0.0.0'
+        ):
+            self.assertNotEqual(version, self.get_spec_version())
+
+    def test_version_in_cached_page(self):
+        self.patch_settings(VERSIONED_SPEC_URL=True)
+        version = self.get_spec_version()
+        self.patch_settings(UI_CACHE=True)
+
+        self.assertEqual(version, self.get_spec_version())
+
+    def test_not_modified_has_policy(self):
+        self.patch_settings(SPEC_CACHE_CONTROL={'max_age': 60})
+        etag = self.get('/?format=openapi')['ETag']
+        response = self.get('/?format=openapi', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual({'max-age=60'}, self.get_cache_control(response))
+
+    def test_filtered_schema_is_private(self):
+        self.patch_settings(
+            VERSIONED_SPEC_URL=True,
+            SPEC_CACHE_CONTROL={'public': True, 'max_age': 60}
+        )
+        view = PermissionSchemaView.as_view()
+        response = self.get('/?format=openapi', view=view)
+
+        self.assertEqual(
+            {'private', 'max-age=60'}, self.get_cache_control(response)
+        )
+        self.assertTrue(
+            {'Authorization', 'Cookie'} <= self.get_vary(response)
+        )
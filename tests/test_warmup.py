@@ -0,0 +1,156 @@
+from django.http import Http404
+from django.test import override_settings, TestCase
+from rest_framework.schemas import SchemaGenerator
+from rest_framework_swagger import warmup
+from rest_framework_swagger.apps import SwaggerConfig
+from rest_framework_swagger.cache import document_cache, spec_cache
+from rest_framework_swagger.signals import warmed_up
+from rest_framework_swagger.views import SwaggerSchemaView
+
+import rest_framework_swagger
+
+from .compat.mock import MagicMock, patch
+from .urls import snippet_patterns
+
+
+class Generator(SchemaGenerator):
+    def __init__(self):
+        super(Generator, self).__init__(
+            title='Pastebin API',
+            patterns=snippet_patterns
+        )
+
+
+@override_settings(ROOT_URLCONF='tests.urls')
+class TestWarmUp(TestCase):
+    def setUp(self):
+        document_cache.clear()
+        spec_cache.clear()
+        self.addCleanup(document_cache.clear)
+        self.addCleanup(spec_cache.clear)
+
+        settings_patcher = patch(
+            'rest_framework_swagger.renderers.openapi.swagger_settings'
+            '.SPEC_CACHE',
+            True
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+    def test_warm_up_url_fills_caches(self):
+        result, = warmup.warm_up(['/swagger/'])
+
+        self.assertIsNone(result.error)
+        self.assertEqual('/swagger/', result.target)
+        self.assertEqual(2, len(document_cache))
+        self.assertEqual(1, len(spec_cache))
+
+    def test_warm_up_generator_fills_spec_cache(self):
+        result, = warmup.warm_up(['tests.test_warmup.Generator'])
+
+        self.assertIsNone(result.error)
+        self.assertEqual(1, len(spec_cache))
+
+    def test_warm_up_reports_errors(self):
+        result, = warmup.warm_up(['/missing/'])
+
+        self.assertIsNotNone(result.error)
+
+    def test_warm_up_raises_errors_when_asked(self):
+        with self.assertRaises(Http404):
+            warmup.warm_up(['/missing/'], raise_errors=True)
+
+    def test_warm_up_raises_errors_after_reporting_all(self):
+        receiver = MagicMock()
+        warmed_up.connect(receiver)
+        self.addCleanup(warmed_up.disconnect, receiver)
+        with override_settings(SWAGGER_SETTINGS={'WARMUP_RAISE': True}):
+            with self.assertRaises(Http404):
+                warmup.warm_up(['/missing/', '/swagger/'])
+
+        self.assertEqual(2, receiver.call_count)
+
+    def test_warm_up_reports_non_200_responses(self):
+        with patch.object(SwaggerSchemaView, 'get_schema') as mock:
+            mock.return_value = None
+            result, = warmup.warm_up(['/swagger/'])
+
+        self.assertIsInstance(result.error, ValueError)
+
+    def test_warm_up_on_threads(self):
+        results = warmup.warm_up(
+            ['/swagger/', 'tests.test_warmup.Generator'],
+            workers=2,
+            executor='thread'
+        )
+
+        self.assertEqual([None, None], [result.error for result in results])
+        # One for each document: the view's and the generator's.
+        self.assertEqual(2, len(spec_cache))
+
+    def test_warm_up_on_processes(self):
+        results = warmup.warm_up(
+            ['/swagger/', 'tests.test_warmup.Generator'],
+            workers=2,
+            executor='process'
+        )
+
+        self.assertEqual([None, None], [result.error for result in results])
+
+    def test_unsupported_executor(self):
+        with self.assertRaises(ValueError):
+            warmup.warm_up(['/swagger/', '/swagger/'], 2, 'fiber')
+
+    def test_sends_timings(self):
+        receiver = MagicMock()
+        warmed_up.connect(receiver)
+        self.addCleanup(warmed_up.disconnect, receiver)
+        result, = warmup.warm_up(['/swagger/'])
+
+        receiver.assert_called_once_with(
+            signal=warmed_up,
+            sender=None,
+            target='/swagger/',
+            duration=result.duration,
+            error=None
+        )
+
+    @override_settings(ALLOWED_HOSTS=['.kramerica.org'])
+    def test_host_is_allowed(self):
+        self.assertEqual('kramerica.org', warmup.get_host())
+
+    @override_settings(ALLOWED_HOSTS=['*'])
+    def test_host_when_any_is_allowed(self):
+        self.assertEqual('localhost', warmup.get_host())
+
+
+class TestSwaggerConfig(TestCase):
+    def setUp(self):
+        self.sut = SwaggerConfig(
+            'rest_framework_swagger',
+            rest_framework_swagger
+        )
+
+    @patch('rest_framework_swagger.warmup.warm_up')
+    def test_ready_warms_up(self, warm_up):
+        with override_settings(SWAGGER_SETTINGS={'WARMUP': ['/swagger/']}):
+            self.sut.ready()
+
+        warm_up.assert_called_once_with(raise_errors=False)
+
+    @override_settings(
+        DEBUG=True,
+        ROOT_URLCONF='tests.urls',
+        SWAGGER_SETTINGS={'WARMUP': ['/missing/'], 'WARMUP_RAISE': True}
+    )
+    @patch('rest_framework_swagger.warmup.logger')
+    def test_ready_logs_errors(self, logger):
+        self.sut.ready()
+
+        self.assertEqual(1, logger.error.call_count)
+
+    @patch('rest_framework_swagger.warmup.warm_up')
+    def test_ready_without_warm_up(self, warm_up):
+        self.sut.ready()
+
+        warm_up.assert_not_called()
@@ -0,0 +1,24 @@
+from django.conf.urls import url
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_swagger.views import SwaggerSchemaView
+
+
+class SnippetView(APIView):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request):
+        return Response()
+
+
+snippet_patterns = [url(r'^snippets/$', SnippetView.as_view())]
+
+urlpatterns = [
+    url(r'^swagger/$', SwaggerSchemaView.as_view(
+        authentication_classes=(),
+        permission_classes=(),
+        title='Pastebin API',
+        patterns=snippet_patterns
+    )),
+]